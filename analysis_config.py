@@ -4,6 +4,11 @@ ANALISIS_KONFIGURASI = {
     'MAKS_KATA_KUNCI': 10,
     'DETEKSI_BAHASA': True,
     'RINGKASAN_OTOMATIS': False,
-    'PANJANG_RINGKASAN': 3  # dalam kalimat
+    'PANJANG_RINGKASAN': 3,  # dalam kalimat
+    'ANALISIS_SAAT_CRAWL': False,  # jalankan sentimen/kata kunci/ringkasan untuk tiap halaman hasil crawl
+    'DETEKSI_TEKNOLOGI_SAAT_CRAWL': False,  # deteksi teknologi (Wappalyzer) dari HTML & header yang sudah diambil, sekali per host
+    'SIMPAN_TEKS': False,  # simpan teks hasil ekstraksi di rekaman crawl (field 'teks') buat analisis_korpus nanti
+    'PANJANG_SAMPEL_BAHASA': 2000,  # jumlah karakter teks yang dipakai untuk deteksi bahasa
+    'MAKS_CACHE_ANALISIS': 10000  # jumlah hasil analisis (per hash konten) yang disimpan di memori
 }
 
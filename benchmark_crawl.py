@@ -0,0 +1,277 @@
+import argparse
+import hashlib
+import json
+import multiprocessing
+import os
+import random
+import resource
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DIREKTORI = os.path.dirname(os.path.abspath(__file__))
+
+SKENARIO = ['ambil', 'crawl', 'crawl_async', 'ekstrak', 'ekspor']
+
+KATA = ['data', 'web', 'halaman', 'server', 'tautan', 'konten', 'cepat', 'lambat', 'jaringan', 'proses',
+        'analisis', 'hasil', 'kode', 'sumber', 'format', 'berkas', 'pengguna', 'sistem', 'laporan', 'uji']
+
+def buat_halaman(nomor, opsi):
+    # Halaman sintetis deterministik: isi & tautan cuma bergantung ke nomor halaman dan seed
+    acak = random.Random(f"{opsi['seed']}:{nomor}")
+    tautan = [(nomor * opsi['fanout'] + i + 1) % opsi['halaman'] for i in range(opsi['fanout'])]
+    tautan += [acak.randrange(opsi['halaman']) for _ in range(2)]
+    bagian = [
+        f"<html><head><title>Halaman {nomor}</title>",
+        f'<meta name="description" content="Halaman sintetis nomor {nomor}">',
+        '<meta name="keywords" content="benchmark, sintetis">',
+        '<link rel="stylesheet" href="http://cdn.example.com/gaya.css"></head><body>',
+        f"<h1>Halaman {nomor}</h1>"
+    ]
+    bagian += [f'<a href="/h/{tujuan}">Ke halaman {tujuan}</a>' for tujuan in tautan]
+    ukuran = opsi['ukuran'] * 1024
+    panjang = sum(len(b) for b in bagian)
+    while panjang < ukuran:
+        paragraf = f"<p>{' '.join(acak.choice(KATA) + str(acak.randrange(1000)) for _ in range(40))}</p>"
+        bagian.append(paragraf)
+        panjang += len(paragraf)
+    bagian.append("</body></html>")
+    return ''.join(bagian).encode('utf-8')
+
+def _error_disuntik(nomor, opsi):
+    ringkasan = hashlib.blake2b(f"{opsi['seed']}:error:{nomor}".encode(), digest_size=4).digest()
+    return int.from_bytes(ringkasan, 'big') / 2 ** 32 < opsi['error']
+
+def _jalankan_server(opsi, antrean):
+    halaman_siap = {}
+
+    class PenanganSintetis(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'  # keep-alive, sama seperti server sungguhan
+
+        def setup(self):
+            super().setup()
+            # Header & badan respons ditulis terpisah; tanpa TCP_NODELAY tiap respons kena delayed ACK ~40 ms
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        def do_GET(self):
+            path = self.path.split('?')[0]
+            if not (path == '/' or path.startswith('/h/')):
+                self.send_error(404)
+                return
+            nomor = int(path[3:] or 0) if path != '/' else 0
+            if opsi['latensi']:
+                time.sleep(opsi['latensi'] / 1000 * random.uniform(0.5, 1.5))
+            if _error_disuntik(nomor, opsi):
+                self.send_error(500)
+                return
+            # Halaman dibuat sekali lalu disimpan, biar server gak jadi leher botol
+            nomor %= opsi['halaman']
+            isi = halaman_siap.get(nomor)
+            if isi is None:
+                isi = halaman_siap[nomor] = buat_halaman(nomor, opsi)
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(isi)))
+            self.end_headers()
+            self.wfile.write(isi)
+
+        def log_message(self, *argumen):
+            pass
+
+    if opsi['halaman'] * opsi['ukuran'] <= 200 * 1024:
+        # Situs yang muat di memori dibuat di depan, jadi pengukuran gak ikut menanggung pembuatan halaman
+        for nomor in range(opsi['halaman']):
+            halaman_siap[nomor] = buat_halaman(nomor, opsi)
+    ThreadingHTTPServer.daemon_threads = True
+    server = ThreadingHTTPServer(('127.0.0.1', 0), PenanganSintetis)
+    antrean.put(server.server_port)
+    server.serve_forever()
+
+def mulai_server(opsi):
+    # Server jalan di proses terpisah biar CPU & memorinya gak ikut terukur
+    konteks = multiprocessing.get_context('spawn')
+    antrean = konteks.Queue()
+    proses = konteks.Process(target=_jalankan_server, args=(opsi, antrean), daemon=True)
+    proses.start()
+    return proses, antrean.get(timeout=30)
+
+def _siapkan_scraper(direktori_kerja):
+    # Konfigurasi netral: tanpa batas laju, tanpa cache file/database/checkpoint, biar yang terukur cuma jalur kode
+    sys.path.insert(0, DIREKTORI)
+    os.chdir(direktori_kerja)
+    import syaaScrapeer
+
+    syaaScrapeer.KONFIGURASI['GUNAKAN_CACHE_FILE'] = False
+    syaaScrapeer.KONFIGURASI['MAKS_PERCOBAAN'] = 1
+    syaaScrapeer.DATABASE_KONFIGURASI['GUNAKAN_DATABASE'] = False
+    syaaScrapeer.KINERJA_KONFIGURASI['FILE_LAPORAN_METRIK'] = None
+    syaaScrapeer.CRAWLING_KONFIGURASI['MAKS_KEDALAMAN'] = 10
+    syaaScrapeer.CRAWLING_KONFIGURASI['HORMATI_ROBOTS_TXT'] = False
+    syaaScrapeer.CRAWLING_KONFIGURASI['GUNAKAN_SITEMAP'] = False
+    syaaScrapeer.penjadwal = syaaScrapeer.PenjadwalDomain(10 ** 9, 0, 10 ** 9)
+    syaaScrapeer.console.quiet = True
+    return syaaScrapeer
+
+def _waktu_cpu():
+    sendiri = resource.getrusage(resource.RUSAGE_SELF)
+    anak = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return sendiri.ru_utime + sendiri.ru_stime + anak.ru_utime + anak.ru_stime
+
+def _persentil(nilai, syaaScrapeer):
+    nilai = sorted(nilai)
+    return {'p50': syaaScrapeer.hitung_persentil(nilai, 50), 'p99': syaaScrapeer.hitung_persentil(nilai, 99)}
+
+def jalankan_skenario(nama, opsi, port):
+    syaaScrapeer = _siapkan_scraper(tempfile.mkdtemp(prefix='benchmark_crawl_'))
+    url_dasar = f"http://127.0.0.1:{port}/"
+    jumlah = opsi['halaman']
+    latensi = []
+    latensi_ringkas = None
+    hasil = {}
+
+    mulai, cpu_awal = time.perf_counter(), _waktu_cpu()
+    if nama == 'ambil':
+        import concurrent.futures
+
+        def ambil(nomor):
+            awal = time.perf_counter()
+            try:
+                syaaScrapeer.ambil_kode_sumber(f"{url_dasar}h/{nomor}", False)
+            except Exception:
+                return None
+            return time.perf_counter() - awal
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=opsi['konkurensi']) as executor:
+            latensi = [durasi for durasi in executor.map(ambil, range(jumlah)) if durasi is not None]
+        hasil['gagal'] = jumlah - len(latensi)
+
+    elif nama in ('crawl', 'crawl_async'):
+        syaaScrapeer.KINERJA_KONFIGURASI['GUNAKAN_ASYNCIO'] = nama == 'crawl_async'
+        syaaScrapeer.KINERJA_KONFIGURASI['MAKS_KONKURENSI'] = opsi['konkurensi']
+        if opsi['multiproses']:
+            # Tanpa --multiproses konfigurasi bawaan dipakai apa adanya, biar yang diukur sama dengan crawl biasa
+            syaaScrapeer.KINERJA_KONFIGURASI['GUNAKAN_MULTIPROCESSING'] = True
+        rekaman = syaaScrapeer.jelajahi_tautan_internal(url_dasar, jumlah)
+        jumlah = len(rekaman)
+        tahap = syaaScrapeer.metrik.ringkasan()['tahap']
+        hasil['tahap'] = {nama_tahap: {'p50': data['p50'], 'p99': data['p99'], 'total_detik': data['total_detik']}
+                          for nama_tahap, data in tahap.items()}
+        if 'ttfb' in tahap:
+            latensi_ringkas = {'p50': tahap['ttfb']['p50'], 'p99': tahap['ttfb']['p99']}
+
+    elif nama == 'ekstrak':
+        daftar_html = [buat_halaman(nomor, opsi).decode('utf-8') for nomor in range(jumlah)]
+        mulai, cpu_awal = time.perf_counter(), _waktu_cpu()
+        for konten_html in daftar_html:
+            awal = time.perf_counter()
+            syaaScrapeer.ekstrak_elemen_spesifik(syaaScrapeer.DokumenHTML(konten_html).sup)
+            latensi.append(time.perf_counter() - awal)
+
+    elif nama == 'ekspor':
+        data = [{'url': f"{url_dasar}h/{nomor}", 'judul': f"Halaman {nomor}",
+                 'elemen': {'deskripsi_meta': f"Halaman sintetis nomor {nomor}", 'kata_kunci_meta': 'benchmark',
+                            'tag_h1': [f"Halaman {nomor}"]}} for nomor in range(jumlah)]
+        mulai, cpu_awal = time.perf_counter(), _waktu_cpu()
+        for tipe_format in ('json', 'jsonl', 'csv', 'xml'):
+            awal = time.perf_counter()
+            syaaScrapeer.ekspor_ke_format(data, tipe_format, f"ekspor.{tipe_format}")
+            latensi.append(time.perf_counter() - awal)
+        jumlah *= 4
+
+    durasi = time.perf_counter() - mulai
+    sendiri = resource.getrusage(resource.RUSAGE_SELF)
+    anak = resource.getrusage(resource.RUSAGE_CHILDREN)
+    hasil.update({
+        'skenario': nama,
+        'jumlah': jumlah,
+        'durasi_detik': durasi,
+        'per_detik': jumlah / durasi if durasi else 0.0,
+        'latensi': _persentil(latensi, syaaScrapeer) if latensi else latensi_ringkas,
+        'cpu_detik': _waktu_cpu() - cpu_awal,
+        # ru_maxrss dalam KB di Linux, byte di macOS
+        'rss_puncak_mb': max(sendiri.ru_maxrss, anak.ru_maxrss) / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+    })
+    return hasil
+
+def revisi_git():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=DIREKTORI, check=True,
+                              capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def _jalankan_anak(nama, opsi, port):
+    # Tiap skenario jalan di proses baru biar CPU & RSS puncaknya gak tercampur skenario lain
+    keluaran = subprocess.run([sys.executable, os.path.abspath(__file__), '--anak', nama, '--port', str(port),
+                               '--opsi', json.dumps(opsi)], check=True, capture_output=True, text=True).stdout
+    return json.loads(keluaran.strip().splitlines()[-1])
+
+def bandingkan(hasil, nama_file, opsi):
+    # Cari hasil terakhir dengan konfigurasi situs yang sama di berkas hasil, lalu tampilkan selisihnya
+    if not nama_file or not os.path.exists(nama_file):
+        return
+    sebelumnya = None
+    with open(nama_file, encoding='utf-8') as f:
+        for baris in f:
+            entri = json.loads(baris)
+            if entri.get('opsi') == opsi:
+                sebelumnya = entri
+    if sebelumnya is None:
+        return
+    lama = {item['skenario']: item for item in sebelumnya['hasil']}
+    print(f"Dibanding revisi {sebelumnya.get('revisi')}:")
+    for item in hasil:
+        pembanding = lama.get(item['skenario'])
+        if pembanding and pembanding['per_detik']:
+            perubahan = (item['per_detik'] / pembanding['per_detik'] - 1) * 100
+            print(f"  {item['skenario']:<12} {perubahan:+.1f}% per detik, "
+                  f"CPU {item['cpu_detik'] - pembanding['cpu_detik']:+.2f} detik, "
+                  f"RSS {item['rss_puncak_mb'] - pembanding['rss_puncak_mb']:+.1f} MB")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark offline fetch/crawl/parse/ekspor pakai situs sintetis lokal")
+    parser.add_argument('--skenario', nargs='+', default=SKENARIO, choices=SKENARIO)
+    parser.add_argument('--halaman', type=int, default=500, help="jumlah halaman situs sintetis")
+    parser.add_argument('--fanout', type=int, default=5, help="jumlah tautan keluar per halaman")
+    parser.add_argument('--ukuran', type=int, default=20, help="ukuran tiap halaman dalam KB")
+    parser.add_argument('--latensi', type=float, default=0, help="latensi server rata-rata dalam milidetik")
+    parser.add_argument('--error', type=float, default=0, help="proporsi halaman yang dijawab 500 (0-1)")
+    parser.add_argument('--konkurensi', type=int, default=10)
+    parser.add_argument('--multiproses', action='store_true', help="paksa crawl pakai pool proses untuk parsing")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--hasil', help="tambahkan hasil ke berkas JSON Lines ini & bandingkan dengan run sebelumnya")
+    parser.add_argument('--anak', help=argparse.SUPPRESS)
+    parser.add_argument('--port', type=int, help=argparse.SUPPRESS)
+    parser.add_argument('--opsi', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.anak:
+        print(json.dumps(jalankan_skenario(args.anak, json.loads(args.opsi), args.port)))
+        return
+
+    opsi = {'halaman': args.halaman, 'fanout': args.fanout, 'ukuran': args.ukuran, 'latensi': args.latensi,
+            'error': args.error, 'konkurensi': args.konkurensi, 'multiproses': args.multiproses, 'seed': args.seed}
+    server, port = mulai_server(opsi)
+    try:
+        hasil = []
+        for nama in args.skenario:
+            item = _jalankan_anak(nama, opsi, port)
+            hasil.append(item)
+            latensi = item.get('latensi') or {}
+            teks_latensi = (f", p50 {latensi['p50'] * 1000:.1f} ms, p99 {latensi['p99'] * 1000:.1f} ms"
+                            if latensi.get('p50') is not None else '')
+            print(f"{nama:<12} {item['per_detik']:9.1f} per detik{teks_latensi}, "
+                  f"CPU {item['cpu_detik']:.2f} detik, RSS puncak {item['rss_puncak_mb']:.1f} MB")
+    finally:
+        server.terminate()
+
+    bandingkan(hasil, args.hasil, opsi)
+    if args.hasil:
+        with open(args.hasil, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({'waktu': time.time(), 'revisi': revisi_git(), 'opsi': opsi, 'hasil': hasil}) + '\n')
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+DIREKTORI = os.path.dirname(os.path.abspath(__file__))
+
+# Modul yang gak boleh ikut ke-load cuma karena `import syaaScrapeer`
+MODUL_BERAT = [
+    'boto3', 'google.cloud.storage', 'azure.storage.blob', 'telegram', 'matplotlib',
+    'textblob', 'langdetect', 'Wappalyzer', 'aiohttp', 'pkg_resources', 'numpy'
+]
+
+def _jalankan(kode, *opsi):
+    return subprocess.run([sys.executable, *opsi, '-c', kode], cwd=DIREKTORI, check=True,
+                          capture_output=True, text=True)
+
+def ukur_waktu(kode, ulang):
+    durasi = []
+    for _ in range(ulang):
+        mulai = time.perf_counter()
+        _jalankan(kode)
+        durasi.append(time.perf_counter() - mulai)
+    return statistics.median(durasi)
+
+def modul_berat_termuat():
+    keluaran = _jalankan("import json, sys, syaaScrapeer; print(json.dumps(sorted(sys.modules)))").stdout
+    termuat = set(json.loads(keluaran.strip().splitlines()[-1]))
+    return [modul for modul in MODUL_BERAT if modul in termuat]
+
+def impor_terlambat(jumlah=10):
+    # Baca keluaran `-X importtime`, urutkan modul tingkat atas berdasarkan waktu kumulatif
+    baris = _jalankan('import syaaScrapeer', '-X', 'importtime').stderr.splitlines()
+    hasil = []
+    for entri in baris:
+        if not entri.startswith('import time:') or '|' not in entri:
+            continue
+        _, kumulatif, nama = entri[len('import time:'):].split('|')
+        if kumulatif.strip().isdigit() and not nama.startswith('  '):
+            hasil.append((int(kumulatif) / 1e6, nama.strip()))
+    return sorted(hasil, reverse=True)[:jumlah]
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark waktu startup `import syaaScrapeer`")
+    parser.add_argument('--ulang', type=int, default=10, help="jumlah pengukuran (diambil median)")
+    parser.add_argument('--batas', type=float, default=0.5,
+                        help="batas waktu import dalam detik, di luar waktu startup interpreter")
+    parser.add_argument('--hasil', help="tambahkan hasil ke berkas JSON Lines ini")
+    args = parser.parse_args()
+
+    dasar = ukur_waktu('pass', args.ulang)
+    total = ukur_waktu('import syaaScrapeer', args.ulang)
+    bersih = max(total - dasar, 0.0)
+    berat = modul_berat_termuat()
+
+    print(f"Startup interpreter : {dasar:.3f} detik")
+    print(f"Import syaaScrapeer : {bersih:.3f} detik (batas {args.batas:.3f})")
+    print("Modul paling lambat:")
+    for durasi, nama in impor_terlambat():
+        print(f"  {durasi:.3f}  {nama}")
+    if berat:
+        print(f"Modul berat ikut ter-load saat import: {', '.join(berat)}")
+
+    if args.hasil:
+        with open(args.hasil, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({'waktu': time.time(), 'import_detik': bersih, 'interpreter_detik': dasar,
+                                'modul_berat': berat}) + '\n')
+
+    if berat or bersih > args.batas:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+import argparse
+import os
+import random
+import sys
+
+DIREKTORI = os.path.dirname(os.path.abspath(__file__))
+
+# Kalibrasi deteksi near-duplicate terhadap teks nyata (dokumentasi referensi Python dari pydoc_data, selalu ada di
+# stdlib) yang dibungkus template situs: pasangan hampir sama harus ketahuan, halaman beda dengan template sama jangan.
+
+NAVIGASI = ("Beranda Dokumentasi Tutorial Referensi Bahasa Pustaka Standar Unduh Komunitas Berita Acara Cari "
+            "Masuk Daftar Bahasa Indonesia English Versi 3.12 3.11 3.10 Tema Terang Gelap Menu Utama Navigasi")
+KAKI = ("Hak cipta yayasan perangkat lunak Lisensi Kebijakan privasi Laporkan masalah Ubah halaman ini di GitHub "
+        "Dibuat dengan Sphinx Pembaruan terakhir")
+TERKAIT = ["Modul os", "Modul sys", "Ekspresi reguler", "Pemrosesan teks", "Jaringan", "Konkurensi", "Tipe data",
+           "Matematika", "Berkas dan direktori", "Kompresi"]
+
+def _korpus():
+    from pydoc_data.topics import topics
+    return ' '.join(topics[nama] for nama in sorted(topics)).split()
+
+def _halaman(isi, acak, dilihat=None, terkait=None):
+    dilihat = acak.randint(100, 99999) if dilihat is None else dilihat
+    terkait = terkait or acak.sample(TERKAIT, 4)
+    return ' '.join([NAVIGASI, ' '.join(isi), "Artikel terkait:", *terkait, f"Dilihat {dilihat} kali", KAKI,
+                     f"{acak.randint(1, 28)}-{acak.randint(1, 12)}-2024"])
+
+def _ubah_kata(isi, acak, jumlah, cara):
+    hasil = list(isi)
+    for posisi in sorted(acak.sample(range(len(hasil)), jumlah), reverse=True):
+        kata_baru = f"kata{acak.randint(0, 10 ** 6)}"
+        if cara == 'ganti':
+            hasil[posisi] = kata_baru
+        elif cara == 'sisip':
+            hasil.insert(posisi, kata_baru)
+        else:
+            del hasil[posisi]
+    return hasil
+
+def _shingle(teks, panjang):
+    kata = teks.lower().split()
+    return {' '.join(kata[i:i + panjang]) for i in range(len(kata) - panjang + 1)}
+
+def _jaccard(a, b):
+    return len(a & b) / len(a | b)
+
+def _persentil(nilai, p):
+    urut = sorted(nilai)
+    return urut[min(len(urut) - 1, int(len(urut) * p))]
+
+def main():
+    parser = argparse.ArgumentParser(description="Kalibrasi ambang kemiripan deteksi halaman duplikat")
+    parser.add_argument('--ukuran', type=int, nargs='+', default=[200, 500, 1000, 3000], help="jumlah kata isi halaman")
+    parser.add_argument('--pasangan', type=int, default=200, help="jumlah pasangan hampir sama per ukuran")
+    parser.add_argument('--kata-beda', type=int, default=3, help="jumlah kata yang diubah di pasangan hampir sama")
+    parser.add_argument('--ambang', type=float, help="ambang yang diuji (bawaan: AMBANG_KEMIRIPAN)")
+    parser.add_argument('--min-recall', type=float, default=0.95, help="recall minimum per ukuran supaya lolos")
+    parser.add_argument('--toleransi', type=float, default=0.1,
+                        help="halaman beda yang ditandai baru dihitung salah kalau Jaccard aslinya < ambang - toleransi")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    sys.path.insert(0, DIREKTORI)
+    import syaaScrapeer
+
+    acak = random.Random(args.seed)
+    kata = _korpus()
+    ambang = syaaScrapeer.IndeksDuplikat(args.ambang).ambang
+    sidik = syaaScrapeer.sidik_konten
+    print(f"Korpus {len(kata)} kata, ambang kemiripan {ambang}")
+
+    panjang = syaaScrapeer.CRAWLING_KONFIGURASI['PANJANG_SHINGLE']
+    gagal = []
+    semua_mirip, semua_beda, selisih = [], [], []
+    for ukuran in args.ukuran:
+        ketemu, kemiripan = 0, []
+        for nomor in range(args.pasangan):
+            mulai = acak.randrange(len(kata) - ukuran)
+            isi = kata[mulai:mulai + ukuran]
+            asli = _halaman(isi, acak)
+            # Versi kedua: beberapa kata diubah, plus penghitung, tanggal & blok artikel terkait ikut berganti
+            salinan = _halaman(_ubah_kata(isi, acak, args.kata_beda, ('ganti', 'sisip', 'hapus')[nomor % 3]), acak)
+            hash_a, tanda_a = sidik(asli)
+            hash_b, tanda_b = sidik(salinan)
+            indeks = syaaScrapeer.IndeksDuplikat(args.ambang)
+            indeks.periksa('a', hash_a, tanda_a)
+            ketemu += indeks.periksa('b', hash_b, tanda_b) == 'a'
+            perkiraan = indeks.kemiripan(bytes.fromhex(tanda_a), bytes.fromhex(tanda_b))
+            kemiripan.append(perkiraan)
+            selisih.append(abs(perkiraan - _jaccard(_shingle(asli, panjang), _shingle(salinan, panjang))))
+
+        # Halaman berbeda: potongan korpus yang gak tumpang tindih, template sama. Dokumentasi Python mengulang
+        # beberapa bagian, jadi yang ditandai dibandingkan dulu dengan Jaccard aslinya sebelum dihitung salah.
+        indeks = syaaScrapeer.IndeksDuplikat(args.ambang)
+        daftar_tanda, daftar_shingle, salah, asli_mirip = [], [], 0, 0
+        for nomor, mulai in enumerate(range(0, len(kata) - ukuran, ukuran)):
+            teks = _halaman(kata[mulai:mulai + ukuran], acak)
+            hash_konten, tanda = sidik(teks)
+            daftar_shingle.append(_shingle(teks, panjang))
+            kanonik = indeks.periksa(nomor, hash_konten, tanda)
+            if kanonik is not None:
+                if _jaccard(daftar_shingle[kanonik], daftar_shingle[-1]) < ambang - args.toleransi:
+                    salah += 1
+                else:
+                    asli_mirip += 1
+            daftar_tanda.append(bytes.fromhex(tanda))
+        beda = []
+        for i in range(len(daftar_tanda)):
+            for j in range(i + 1, min(len(daftar_tanda), i + 20)):
+                perkiraan = indeks.kemiripan(daftar_tanda[i], daftar_tanda[j])
+                sebenarnya = _jaccard(daftar_shingle[i], daftar_shingle[j])
+                selisih.append(abs(perkiraan - sebenarnya))
+                if sebenarnya < ambang - args.toleransi:
+                    beda.append(perkiraan)
+
+        recall = ketemu / args.pasangan
+        semua_mirip += kemiripan
+        semua_beda += beda
+        lolos = recall >= args.min_recall and not salah
+        print(f"[{'OK' if lolos else 'GAGAL'}] {ukuran:5d} kata: recall {recall:.1%}, "
+              f"kemiripan pasangan p5 {_persentil(kemiripan, 0.05):.3f} / p50 {_persentil(kemiripan, 0.5):.3f}, "
+              f"halaman beda maks {max(beda):.3f}, salah tandai {salah}/{len(daftar_tanda)}"
+              f"{f' ({asli_mirip} memang hampir sama)' if asli_mirip else ''}")
+        if not lolos:
+            gagal.append(ukuran)
+
+    print(f"Selisih perkiraan MinHash vs Jaccard asli: p50 {_persentil(selisih, 0.5):.3f}, "
+          f"p99 {_persentil(selisih, 0.99):.3f}")
+    # Ambang aman ada di antara kemiripan tertinggi halaman beda dan kemiripan pasangan hampir sama yang terendah
+    print(f"Rentang ambang yang memisahkan keduanya: {max(semua_beda):.3f} < ambang <= "
+          f"{_persentil(semua_mirip, 1 - args.min_recall):.3f}")
+    if gagal:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
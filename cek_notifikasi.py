@@ -0,0 +1,183 @@
+import argparse
+import json
+import os
+import socketserver
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+DIREKTORI = os.path.dirname(os.path.abspath(__file__))
+
+# Cek pengirim notifikasi latar terhadap server SMTP dan Bot API Telegram tiruan di localhost, tanpa jaringan luar
+
+class ServerSMTPLokal(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        self.koneksi = 0
+        self.pesan = []
+        self.putuskan_berikutnya = False
+        super().__init__(('127.0.0.1', 0), PenanganSMTP)
+
+class PenanganSMTP(socketserver.StreamRequestHandler):
+    # Cukup EHLO/MAIL/RCPT/DATA/QUIT; putuskan_berikutnya meniru server yang memutus koneksi idle
+    def handle(self):
+        server = self.server
+        server.koneksi += 1
+        self._balas('220 smtp-lokal')
+        while True:
+            baris = self.rfile.readline()
+            if not baris:
+                return
+            perintah = baris.decode('utf-8', 'replace').strip().upper()
+            if server.putuskan_berikutnya and perintah.startswith('MAIL'):
+                server.putuskan_berikutnya = False
+                return
+            if perintah.startswith(('EHLO', 'HELO')):
+                self._balas('250 smtp-lokal')
+            elif perintah.startswith(('MAIL', 'RCPT', 'RSET', 'NOOP')):
+                self._balas('250 ok')
+            elif perintah == 'DATA':
+                self._balas('354 lanjut')
+                isi = []
+                for baris in iter(self.rfile.readline, b''):
+                    if baris in (b'.\r\n', b'.\n'):
+                        break
+                    isi.append(baris.decode('utf-8', 'replace'))
+                server.pesan.append(''.join(isi))
+                self._balas('250 diterima')
+            elif perintah == 'QUIT':
+                self._balas('221 sampai jumpa')
+                return
+            else:
+                self._balas('502 tidak dikenal')
+
+    def _balas(self, teks):
+        self.wfile.write(f"{teks}\r\n".encode('utf-8'))
+
+class PenanganTelegram(BaseHTTPRequestHandler):
+    # Bot API tiruan: getMe untuk initialize(), sendMessage dicatat teksnya
+    def log_message(self, *argumen):
+        pass
+
+    def do_POST(self):
+        badan = self.rfile.read(int(self.headers.get('Content-Length') or 0)).decode('utf-8')
+        metode = self.path.rsplit('/', 1)[-1]
+        if metode == 'getMe':
+            hasil = {'id': 1, 'is_bot': True, 'first_name': 'lokal', 'username': 'bot_lokal'}
+        else:
+            if metode == 'sendMessage':
+                self.server.pesan.append(parse_qs(badan).get('text', [''])[0])
+            hasil = {'message_id': len(self.server.pesan), 'date': int(time.time()),
+                     'chat': {'id': 1, 'type': 'private'}}
+        data = json.dumps({'ok': True, 'result': hasil}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+def _jalankan_latar(server):
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def _tunggu(kondisi, batas):
+    akhir = time.monotonic() + batas
+    while time.monotonic() < akhir:
+        if kondisi():
+            return True
+        time.sleep(0.02)
+    return kondisi()
+
+def main():
+    parser = argparse.ArgumentParser(description="Cek pengirim notifikasi digest terhadap SMTP/Telegram lokal")
+    parser.add_argument('--pesan', type=int, default=300, help="jumlah pesan yang dikirim sekaligus")
+    parser.add_argument('--jendela', type=float, default=0.5, help="jendela digest dalam detik")
+    parser.add_argument('--maks-pesan', type=int, default=100, help="pesan maksimum per digest")
+    parser.add_argument('--batas-kirim', type=float, default=0.05,
+                        help="batas waktu (detik) total kirim() untuk semua pesan; pemanggil gak boleh nunggu jaringan")
+    args = parser.parse_args()
+
+    sys.path.insert(0, DIREKTORI)
+    import syaaScrapeer
+
+    smtp = _jalankan_latar(ServerSMTPLokal())
+    syaaScrapeer.NOTIFIKASI_KONFIGURASI.update(SMTP_SERVER='127.0.0.1', SMTP_PORT=smtp.server_address[1],
+                                               SMTP_STARTTLS=False, EMAIL_PASSWORD='', TIMEOUT_KIRIM=5)
+    daftar_saluran = [syaaScrapeer.SaluranEmail()]
+    telegram = None
+    try:
+        import telegram as _  # noqa: F401
+    except ImportError:
+        print("python-telegram-bot tidak terpasang, saluran Telegram dilewati")
+    else:
+        telegram = ThreadingHTTPServer(('127.0.0.1', 0), PenanganTelegram)
+        telegram.pesan = []
+        _jalankan_latar(telegram)
+        syaaScrapeer.NOTIFIKASI_KONFIGURASI.update(TELEGRAM_BASE_URL=f"http://127.0.0.1:{telegram.server_port}/bot",
+                                                   TELEGRAM_BOT_TOKEN='1:lokal', TELEGRAM_CHAT_ID='1')
+        daftar_saluran.append(syaaScrapeer.SaluranTelegram())
+
+    gagal = []
+
+    def periksa(nama, lolos, keterangan=''):
+        print(f"[{'OK' if lolos else 'GAGAL'}] {nama}{f' ({keterangan})' if keterangan else ''}")
+        if not lolos:
+            gagal.append(nama)
+
+    pengirim = syaaScrapeer.PengirimNotifikasi(daftar_saluran, jendela=args.jendela, maks_pesan=args.maks_pesan,
+                                               ukuran_antrean=args.pesan * 2)
+    mulai = time.perf_counter()
+    for nomor in range(args.pesan):
+        pengirim.kirim(f"halaman {nomor} gagal diambil")
+    durasi = time.perf_counter() - mulai
+    periksa("kirim() gak menunggu jaringan", durasi <= args.batas_kirim,
+            f"{durasi * 1000:.1f} ms untuk {args.pesan} pesan")
+
+    jumlah_digest = -(-args.pesan // args.maks_pesan)
+    _tunggu(lambda: len(smtp.pesan) >= jumlah_digest, args.jendela * jumlah_digest + 5)
+    periksa("pesan digabung jadi digest", len(smtp.pesan) == jumlah_digest,
+            f"{len(smtp.pesan)} email, diharapkan {jumlah_digest}")
+    periksa("satu koneksi SMTP dipakai ulang", smtp.koneksi == 1, f"{smtp.koneksi} koneksi")
+    isi_email = ''.join(smtp.pesan)
+    periksa("semua pesan ada di digest", all(f"halaman {nomor} gagal" in isi_email for nomor in range(args.pesan)))
+
+    # flush() mengirim tanpa menunggu jendela habis, sekalian koneksi yang diputus server disambung ulang
+    smtp.putuskan_berikutnya = True
+    sebelum = len(smtp.pesan)
+    pengirim.kirim("pesan mendesak")
+    terkirim = pengirim.flush(timeout=args.jendela + 5)
+    periksa("flush() mengirim segera", terkirim and len(smtp.pesan) == sebelum + 1)
+    periksa("sambung ulang setelah diputus server", smtp.koneksi == 2, f"{smtp.koneksi} koneksi")
+
+    # Pesan terakhir sengaja panjang (> 4096 karakter) biar pemecahan pesan Telegram ikut teruji
+    pengirim.kirim("pesan terakhir\n" + '\n'.join(f"baris rincian {nomor:04d} " + '-' * 40 for nomor in range(120)))
+    pengirim.tutup()
+    periksa("tutup() mengirim sisa antrean", 'pesan terakhir' in smtp.pesan[-1])
+
+    # Antrean penuh: pesan baru dibuang lalu disebut di digest berikutnya, bukan menahan pemanggil
+    penuh = syaaScrapeer.PengirimNotifikasi([syaaScrapeer.SaluranEmail()], jendela=args.jendela, ukuran_antrean=5)
+    for nomor in range(50):
+        penuh.kirim(f"banjir {nomor}")
+    penuh.tutup()
+    periksa("pesan yang dibuang dilaporkan", any('dibuang' in isi for isi in smtp.pesan[-2:]))
+
+    if telegram is not None:
+        semua = '\n'.join(telegram.pesan)
+        periksa("digest sampai di Telegram", all(f"halaman {nomor} gagal" in semua for nomor in range(args.pesan)),
+                f"{len(telegram.pesan)} pesan")
+        periksa("pesan Telegram dipecah <= 4096 karakter",
+                all(len(teks) <= syaaScrapeer.SaluranTelegram.MAKS_PANJANG for teks in telegram.pesan) and
+                'baris rincian 0119' in semua)
+
+    smtp.shutdown()
+    if telegram is not None:
+        telegram.shutdown()
+    if gagal:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,40 @@
 CRAWLING_KONFIGURASI = {
     'MAKS_KEDALAMAN': 3,
     'MAKS_HALAMAN_PER_DOMAIN': 100,
-    'JEDA_ANTAR_PERMINTAAN': 2,  # dalam detik
+    'JEDA_ANTAR_PERMINTAAN': 2,  # jeda minimum per host, dalam detik
+    'KAPASITAS_BURST_PER_HOST': 1,  # jumlah permintaan beruntun yang boleh lolos tanpa nunggu token
     'HORMATI_ROBOTS_TXT': True,
+    'AGEN_ROBOTS_TXT': '*',  # nama agen yang dicocokkan dengan aturan robots.txt
+    'TTL_ROBOTS_TXT': 3600,  # robots.txt tiap host disimpan sekian detik sebelum diambil ulang
+    'GUNAKAN_SITEMAP': True,  # isi antrean awal dari sitemap.xml / sitemap index
+    'MAKS_URL_SITEMAP': 50_000,  # batas URL yang dibaca dari sitemap per crawl
     'IKUTI_REDIRECTS': True,
     'MAKS_REDIRECTS': 5,
-    'ABAIKAN_FRAGMENT': True
+    'ABAIKAN_FRAGMENT': True,
+    'HAPUS_GARIS_MIRING_AKHIR': True,  # /blog/ dan /blog dianggap halaman yang sama
+    'GUNAKAN_BLOOM_FILTER': False,  # memori tetap untuk crawl sangat besar, dengan sedikit false positive
+    'KAPASITAS_BLOOM': 10_000_000,
+    'TINGKAT_FALSE_POSITIVE_BLOOM': 0.001,
+    'STATISTIK_HALAMAN': True,  # simpan waktu muat, ukuran & jumlah tag/tautan/gambar tiap halaman (buat dashboard crawl)
+    'DETEKSI_DUPLIKAT': True,  # halaman (hampir) sama disimpan sebagai rujukan ke halaman kanonik
+    'AMBANG_KEMIRIPAN': 0.75,  # perkiraan Jaccard shingle minimum yang dianggap duplikat (kalibrasi: python cek_duplikat.py)
+    'PANJANG_SHINGLE': 3,  # jumlah kata per shingle MinHash
+    'MIN_KATA_MINHASH': 50,  # halaman lebih pendek dari ini cuma dicek hash persis
+    'CRAWL_INKREMENTAL': False,  # crawl ulang pakai ETag/Last-Modified & hash konten, halaman yang gak berubah dilewati
+    'FILE_INKREMENTAL': 'phantom_web_recrawl.db',
+    'INTERVAL_KUNJUNG_AWAL': 24 * 3600,  # dalam detik, interval cek ulang halaman baru
+    'INTERVAL_KUNJUNG_MIN': 3600,  # interval mengecil kalau halaman sering berubah...
+    'INTERVAL_KUNJUNG_MAKS': 30 * 24 * 3600,  # ...dan membesar kalau jarang berubah
+    'HEMAT_MEMORI': False,  # rekaman cuma dialirkan ke sink, gak dikumpulkan di memori sampai crawl selesai
+    'UKURAN_ANTREAN_BERTAHAP': 1000,  # rekaman yang boleh antre di jelajahi_bertahap sebelum crawler ditahan
+    'FILE_FRONTIER_BERSAMA': 'phantom_web_frontier.db',  # frontier crawl terdistribusi (taruh di volume bersama, jangan NFS tanpa lock)
+    'JUMLAH_PEKERJA': 4,  # proses pekerja lokal yang dijalankan koordinator
+    'JUMLAH_PARTISI': 64,  # URL dibagi per hash host; satu partisi cuma dipegang satu pekerja, jadi jeda per host tetap terjaga
+    'UKURAN_SEWA': 50,  # URL yang disewa pekerja sekali ambil
+    'JEDA_ISI_ULANG_SEWA': 0.5,  # dalam detik; selama antrean lokal belum kosong, pekerja menyewa paling sering segini
+    'TIMEOUT_SEWA': 120,  # dalam detik; sewa yang gak diperpanjang dianggap pekerjanya mati dan URL-nya diantrekan ulang
+    'MAKS_PERCOBAAN_URL': 3,  # URL yang sewanya kedaluwarsa sekian kali ditandai gagal
+    'DIREKTORI_CHECKPOINT': 'checkpoint_crawl',
+    'INTERVAL_CHECKPOINT': 50  # checkpoint setiap sekian halaman selesai
 }
 
@@ -5,6 +5,9 @@ DATABASE_KONFIGURASI = {
     'HOST': 'localhost',
     'PORT': 3306,
     'USERNAME': 'user',
-    'PASSWORD': 'password'
+    'PASSWORD': 'password',
+    'UKURAN_BATCH': 1000,  # jumlah rekaman per executemany
+    'UKURAN_ANTREAN': 10000,  # rekaman yang boleh antre sebelum crawler ditahan
+    'SIMPAN_TAUTAN': True  # simpan semua tautan keluar tiap halaman ke tabel tautan
 }
 
@@ -7,8 +7,20 @@ KONFIGURASI = {
     'MAKS_THREAD': 5,
     'CACHE_EXPIRY': 3600,  # 1 jam dalam detik
     'GUNAKAN_CACHE_FILE': True,
-    'CACHE_FILE': 'phantom_web_cache.json',
-    'BATAS_PERMINTAAN': 10,  # Jumlah permintaan maksimum per menit
+    'CACHE_FILE': 'phantom_web_cache.db',
+    'CACHE_MAKS_UKURAN': 256 * 1024 * 1024,  # dalam byte, entri paling lama gak diakses dibuang duluan
+    'CACHE_KOMPRESI': True,
+    'CACHE_MEMORI_MAKS_UKURAN': 64 * 1024 * 1024,  # dalam byte, lapis cache respons di memori (di depan cache file)
+    'CACHE_MEMORI_KOMPRESI': False,  # simpan respons di memori dalam bentuk terkompresi (hemat RAM, tambah CPU)
+    'MAKS_CACHE_HEADER': 1024,  # jumlah header respons terakhir yang disimpan di memori
+    'MAKS_UKURAN_RESPONS': 10 * 1024 * 1024,  # dalam byte, unduhan dihentikan kalau badan respons lebih besar dari ini
+    'UKURAN_POTONGAN_UNDUH': 64 * 1024,  # badan respons dibaca & didekode per potongan sebesar ini
+    'TIPE_KONTEN_DIIZINKAN': ('text/html', 'application/xhtml+xml'),  # Content-Type lain langsung ditolak sebelum diunduh
+    'PERIKSA_HEAD_EKSTENSI': True,  # kirim HEAD dulu untuk URL dengan ekstensi di bawah ini
+    'EKSTENSI_MENCURIGAKAN': ('.pdf', '.zip', '.gz', '.tgz', '.tar', '.rar', '.7z', '.exe', '.msi', '.dmg', '.iso', '.apk',
+                              '.bin', '.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg', '.ico', '.mp3', '.mp4', '.avi',
+                              '.mov', '.mkv', '.webm', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx', '.csv', '.json'),
+    'BATAS_PERMINTAAN': 10,  # Jumlah permintaan maksimum per menit untuk setiap host
     'GUNAKAN_PROXY': False,
     'PROXY': {
         'http': 'http://proxy.example.com:8080',
@@ -16,7 +28,9 @@ KONFIGURASI = {
     },
     'VERIFIKASI_SSL': True,
     'LOG_LEVEL': logging.INFO,
-    'LOG_FILE': 'phantom_web.log'
+    'LOG_FILE': 'phantom_web.log',
+    'CEK_DEPENDENSI_SAAT_MULAI': False,  # cek & install dependensi lewat pip setiap kali modul di-import
+    'PERIKSA_PEMBARUAN_SAAT_MULAI': False  # tanya GitHub soal versi terbaru sebelum menu muncul
 }
 
 # User-Agent
@@ -41,7 +55,8 @@ KODE_ERROR = {
     'BATAS_WAKTU_TERLAMPAUI': 1002,
     'KESALAHAN_SSL': 1003,
     'BATAS_PERMINTAAN_TERLAMPAUI': 1004,
-    'KESALAHAN_PARSING': 1005
+    'KESALAHAN_PARSING': 1005,
+    'KONTEN_DITOLAK': 1006
 }
 
 # Pesan error
@@ -50,7 +65,8 @@ PESAN_ERROR = {
     KODE_ERROR['BATAS_WAKTU_TERLAMPAUI']: "Waktu permintaan habis. Server terlalu lama merespons.",
     KODE_ERROR['KESALAHAN_SSL']: "Terjadi kesalahan SSL. Coba aktifkan opsi 'VERIFIKASI_SSL' di konfigurasi.",
     KODE_ERROR['BATAS_PERMINTAAN_TERLAMPAUI']: "Batas permintaan terlampaui. Coba lagi nanti.",
-    KODE_ERROR['KESALAHAN_PARSING']: "Gagal mengurai konten HTML. Struktur halaman mungkin telah berubah."
+    KODE_ERROR['KESALAHAN_PARSING']: "Gagal mengurai konten HTML. Struktur halaman mungkin telah berubah.",
+    KODE_ERROR['KONTEN_DITOLAK']: "Konten tidak diunduh karena bukan HTML atau ukurannya melebihi batas."
 }
 
 # Fungsi untuk dapetin pesan error
@@ -7,6 +7,12 @@ NOTIFIKASI_KONFIGURASI = {
     'EMAIL_PASSWORD': 'kinemaster321',
     'KIRIM_TELEGRAM': False,
     'TELEGRAM_BOT_TOKEN': 'your_bot_token',
-    'TELEGRAM_CHAT_ID': 'your_chat_id'
+    'TELEGRAM_CHAT_ID': 'your_chat_id',
+    'TELEGRAM_BASE_URL': None,  # isi (contoh: 'http://127.0.0.1:8081/bot') untuk Bot API server lokal atau stub uji
+    'SMTP_STARTTLS': True,  # matikan untuk server SMTP lokal/uji yang gak mendukung TLS
+    'TIMEOUT_KIRIM': 30,  # dalam detik, per koneksi/permintaan ke SMTP atau Telegram
+    'JENDELA_DIGEST': 30,  # dalam detik; pesan yang masuk dalam jendela ini digabung jadi satu kiriman
+    'MAKS_PESAN_PER_DIGEST': 100,  # digest dikirim lebih awal kalau pesannya sudah sebanyak ini
+    'UKURAN_ANTREAN': 10_000  # kalau penuh, pesan baru dibuang (dan dihitung) daripada menahan crawler
 }
 
@@ -1,9 +1,9 @@
 OUTPUT_KONFIGURASI = {
-    'FORMAT_DEFAULT': 'json',
+    'FORMAT_DEFAULT': 'json',  # atau 'jsonl', 'csv', 'xml'
     'DIREKTORI_OUTPUT': 'hasil_scraping',
     'NAMA_FILE_DEFAULT': 'hasil_scraping_{timestamp}',
     'TIMESTAMP_FORMAT': '%Y%m%d_%H%M%S',
     'KOMPRESI_OUTPUT': True,
-    'FORMAT_KOMPRESI': 'zip'
+    'FORMAT_KOMPRESI': 'zip'  # atau 'gzip', 'zstd'
 }
 
@@ -3,6 +3,7 @@ PARSING_KONFIGURASI = {
     'EKSTRAK_JAVASCRIPT': False,
     'EKSTRAK_CSS': False,
     'EKSTRAK_KOMENTAR': False,
-    'BERSIHKAN_HTML': True
+    'BERSIHKAN_HTML': True,
+    'MAKS_UKURAN_CACHE_DOKUMEN': 32 * 1024 * 1024  # dalam byte, perkiraan memori dokumen hasil parsing yang disimpan
 }
 
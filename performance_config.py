@@ -1,11 +1,17 @@
 KINERJA_KONFIGURASI = {
-    'GUNAKAN_MULTIPROCESSING': True,
+    'GUNAKAN_MULTIPROCESSING': False,  # pool proses cuma untung buat halaman berat/crawl besar; untuk crawl biasa malah lebih lambat
     'JUMLAH_PROSES': 4,
     'UKURAN_CHUNK': 1000,  # untuk pemrosesan batch
     'GUNAKAN_ASYNCIO': False,
     'MAKS_KONKURENSI': 10,
     'TIMEOUT_PERMINTAAN': 30,  # dalam detik
     'RETRY_PADA_KEGAGALAN': True,
-    'MAKS_RETRY': 3
+    'MAKS_RETRY': 3,
+    'JUMLAH_POOL_HOST': 100,  # jumlah host yang pool koneksinya disimpan
+    'UKURAN_POOL_PER_HOST': 10,  # koneksi keep-alive maksimum per host
+    'UKURAN_POOL_KHUSUS': {},  # contoh: {'example.com': 20}
+    'AKTIFKAN_METRIK': True,  # timer & penghitung per tahap (fetch, cache, parse, analisis, ekspor, penyimpanan)
+    'FILE_LAPORAN_METRIK': None,  # isi path (contoh: 'laporan_crawl.json') untuk laporan JSON tiap crawl selesai
+    'PORT_METRIK': None  # isi port (contoh: 9108) untuk endpoint Prometheus di /metrics
 }
 
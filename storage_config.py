@@ -6,7 +6,10 @@ PENYIMPANAN_KONFIGURASI = {
     'GCS_PROJECT_ID': 'your_gcs_project_id',
     'GCS_PRIVATE_KEY': 'your_gcs_private_key',
     'AZURE_CONNECTION_STRING': 'your_azure_connection_string',
-    'SIMPAN_HASIL_SEMENTARA': True,
-    'HAPUS_HASIL_SETELAH_UPLOAD': True
+    'S3_ENDPOINT_URL': None,  # isi untuk layanan kompatibel S3 lokal, contoh: 'http://localhost:9000'
+    'SIMPAN_HASIL_SEMENTARA': True,  # spool unggahan di DIREKTORI_OUTPUT (kalau False, di direktori temp sistem)
+    'HAPUS_HASIL_SETELAH_UPLOAD': True,
+    'UKURAN_BAGIAN_UNGGAH': 8 * 1024 * 1024,  # dalam byte, minimal 5 MB untuk multipart S3
+    'UNGGAHAN_PARALEL': 4
 }
 
@@ -1,356 +1,3641 @@
 import sys
 import subprocess
-import pkg_resources
-import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urlparse, urljoin
 import json
 import xml.etree.ElementTree as ET
 import time
 import os
 import random
+import re
+import math
+import hashlib
+import sqlite3
+import threading
+import queue
+import atexit
+import zlib
+import pickle
 import concurrent.futures
-from functools import lru_cache
+import bisect
+import array
+import codecs
+import contextlib
+from functools import lru_cache, cached_property
+from operator import eq
+from collections import Counter, OrderedDict, deque
+from collections.abc import Mapping, MutableMapping
+from dataclasses import dataclass, fields
+from urllib.parse import urlparse, urljoin, urlunparse, urlencode, parse_qsl
+from urllib.robotparser import RobotFileParser
 import csv
 import logging
-from ratelimit import limits, sleep_and_retry
 import zipfile
+import gzip
+import io
+import base64
+import tempfile
 import smtplib
 from email.mime.text import MIMEText
-import telegram
 import asyncio
 import multiprocessing
-import boto3
-from google.cloud import storage
-from azure.storage.blob import BlobServiceClient
-from textblob import TextBlob
-import matplotlib.pyplot as plt
+import socket
+
+from konfigurasi import KONFIGURASI, AGEN_PENGGUNA, HEADER, KODE_ERROR, dapatkan_pesan_error
+from output_config import OUTPUT_KONFIGURASI
+from crawling_config import CRAWLING_KONFIGURASI
+from parsing_config import PARSING_KONFIGURASI
+from database_config import DATABASE_KONFIGURASI
+from notification_config import NOTIFIKASI_KONFIGURASI
+from security_config import KEAMANAN_KONFIGURASI
+from analysis_config import ANALISIS_KONFIGURASI
+from performance_config import KINERJA_KONFIGURASI
+from storage_config import PENYIMPANAN_KONFIGURASI
+from visualization_config import VISUALISASI_KONFIGURASI
+
+def _nama_paket(nama):
+    return nama.lower().replace('_', '-')
+
+def CEK_INSTALL_DEPENDESI():
+    import importlib.metadata
+
+    required = {
+        'requests', 'beautifulsoup4', 'rich', 'langdetect', 'python-Wappalyzer',
+        'textblob', 'matplotlib', 'numpy', 'boto3', 'google-cloud-storage',
+        'azure-storage-blob', 'python-telegram-bot', 'aiohttp'
+    }
+    installed = {_nama_paket(dist.metadata['Name']) for dist in importlib.metadata.distributions() if dist.metadata['Name']}
+    missing = {paket for paket in required if _nama_paket(paket) not in installed}
+
+    if missing:
+        print("Tunggu sebentar lagi install dependesi...")
+        python = sys.executable
+        subprocess.check_call([python, '-m', 'pip', 'install', *missing], stdout=subprocess.DEVNULL)
+        print("Dependensi berhasil diinstal.")
+
+# Cek dependensi cuma kalau diminta, biar import modul ini tetap cepat (backend berat dimuat saat dipakai)
+if KONFIGURASI['CEK_DEPENDENSI_SAAT_MULAI']:
+    CEK_INSTALL_DEPENDESI()
+
+import requests
+import requests.adapters
+import urllib3
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+import requests.structures
+from bs4 import BeautifulSoup, Comment
+from rich.console import Console
+from rich.panel import Panel
+from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn
+from rich.syntax import Syntax
+from rich.table import Table
+
+console = Console()
+
+# Konfigurasi logging
+logging.basicConfig(filename=KONFIGURASI['LOG_FILE'], level=KONFIGURASI['LOG_LEVEL'],
+                    format='%(asctime)s - %(levelname)s - %(message)s')
+
+def _perkiraan_ukuran(nilai):
+    # Perkiraan kasar byte yang dipakai nilai di memori; cukup buat membatasi cache, gak perlu presisi
+    if isinstance(nilai, (str, bytes)):
+        return len(nilai)
+    if isinstance(nilai, (tuple, list)):
+        return 64 + sum(_perkiraan_ukuran(isi) for isi in nilai)
+    if isinstance(nilai, dict):
+        return 64 + sum(_perkiraan_ukuran(k) + _perkiraan_ukuran(v) for k, v in nilai.items())
+    return sys.getsizeof(nilai)
+
+class CacheMemori:
+    # LRU yang dibatasi total byte, bukan jumlah entri; nilai bisa disimpan terkompresi (zlib atas pickle)
+    def __init__(self, maks_ukuran, kompresi=False, ukuran=_perkiraan_ukuran):
+        self.maks_ukuran = maks_ukuran
+        self.kompresi = kompresi
+        self._ukuran = ukuran
+        self._kunci = threading.Lock()
+        self._data = OrderedDict()
+        self.total = 0
+
+    def get(self, kunci, bawaan=None):
+        with self._kunci:
+            entri = self._data.get(kunci)
+            if entri is None:
+                return bawaan
+            self._data.move_to_end(kunci)
+        nilai, _, terkompresi = entri
+        return pickle.loads(zlib.decompress(nilai)) if terkompresi else nilai
+
+    def __setitem__(self, kunci, nilai):
+        if self.kompresi:
+            data = zlib.compress(pickle.dumps(nilai, pickle.HIGHEST_PROTOCOL), 1)
+            ukuran = len(data)
+        else:
+            data = nilai
+            ukuran = self._ukuran(nilai)
+        with self._kunci:
+            lama = self._data.pop(kunci, None)
+            if lama is not None:
+                self.total -= lama[1]
+            if ukuran > self.maks_ukuran:
+                return  # lebih besar dari seluruh cache, gak usah disimpan
+            self._data[kunci] = (data, ukuran, self.kompresi)
+            self.total += ukuran
+            while self.total > self.maks_ukuran:
+                _, (_, ukuran_lama, _) = self._data.popitem(last=False)
+                self.total -= ukuran_lama
+
+    def __contains__(self, kunci):
+        with self._kunci:
+            return kunci in self._data
+
+    def __len__(self):
+        return len(self._data)
+
+    def clear(self):
+        with self._kunci:
+            self._data.clear()
+            self.total = 0
+
+# Cache buat nyimpen hasil: lapis memori di depan cache file, dibatasi byte
+hasil_cache = CacheMemori(KONFIGURASI['CACHE_MEMORI_MAKS_UKURAN'], KONFIGURASI['CACHE_MEMORI_KOMPRESI'])
+
+# Batas atas bucket histogram latensi (detik): 0,5 ms sampai ~65 detik, kelipatan dua
+BATAS_HISTOGRAM = tuple(0.0005 * 2 ** i for i in range(18))
+
+class Metrik:
+    # Penghitung + histogram latensi per tahap, aman dipakai banyak thread. Proses pekerja mengirim metriknya
+    # lewat ambil_mentah(reset=True) dan digabung di proses utama.
+    def __init__(self):
+        self._kunci = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._kunci:
+            self._penghitung = Counter()
+            self._tahap = {}
+            self.mulai = time.time()
+            self._status_terakhir = (0.0, '')
+
+    def tambah(self, nama, jumlah=1):
+        if KINERJA_KONFIGURASI['AKTIFKAN_METRIK']:
+            with self._kunci:
+                self._penghitung[nama] += jumlah
+
+    def catat(self, tahap, durasi):
+        if not KINERJA_KONFIGURASI['AKTIFKAN_METRIK']:
+            return
+        indeks = bisect.bisect_left(BATAS_HISTOGRAM, durasi)
+        with self._kunci:
+            data = self._tahap.get(tahap)
+            if data is None:
+                data = self._tahap[tahap] = [0, 0.0, 0.0, [0] * (len(BATAS_HISTOGRAM) + 1)]
+            data[0] += 1
+            data[1] += durasi
+            data[2] = max(data[2], durasi)
+            data[3][indeks] += 1
+
+    @contextlib.contextmanager
+    def ukur(self, tahap):
+        mulai = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.catat(tahap, time.perf_counter() - mulai)
+
+    def ambil_mentah(self, reset=False):
+        with self._kunci:
+            mentah = {'penghitung': dict(self._penghitung),
+                      'tahap': {nama: [data[0], data[1], data[2], list(data[3])] for nama, data in self._tahap.items()}}
+            if reset:
+                self._penghitung.clear()
+                self._tahap.clear()
+        return mentah
+
+    def gabung(self, mentah):
+        if not mentah:
+            return
+        with self._kunci:
+            self._penghitung.update(mentah['penghitung'])
+            for nama, (jumlah, total, maks, bucket) in mentah['tahap'].items():
+                data = self._tahap.get(nama)
+                if data is None:
+                    data = self._tahap[nama] = [0, 0.0, 0.0, [0] * (len(BATAS_HISTOGRAM) + 1)]
+                data[0] += jumlah
+                data[1] += total
+                data[2] = max(data[2], maks)
+                data[3] = [a + b for a, b in zip(data[3], bucket)]
+
+    @staticmethod
+    def _persentil(bucket, jumlah, maks, persentil):
+        # Estimasi dari histogram: interpolasi linear di dalam bucket tempat persentil jatuh
+        target = jumlah * persentil / 100
+        kumulatif = 0
+        for indeks, isi in enumerate(bucket):
+            if isi and kumulatif + isi >= target:
+                bawah = BATAS_HISTOGRAM[indeks - 1] if indeks else 0.0
+                atas = BATAS_HISTOGRAM[indeks] if indeks < len(BATAS_HISTOGRAM) else maks
+                return min(bawah + (atas - bawah) * (target - kumulatif) / isi, maks)
+            kumulatif += isi
+        return maks
+
+    def ringkasan(self):
+        mentah = self.ambil_mentah()
+        tahap = {}
+        for nama, (jumlah, total, maks, bucket) in sorted(mentah['tahap'].items()):
+            tahap[nama] = {
+                'jumlah': jumlah,
+                'total_detik': total,
+                'rata_rata': total / jumlah if jumlah else None,
+                'p50': self._persentil(bucket, jumlah, maks, 50),
+                'p90': self._persentil(bucket, jumlah, maks, 90),
+                'p99': self._persentil(bucket, jumlah, maks, 99),
+                'maks': maks,
+                'histogram': {f"{batas:g}": isi for batas, isi in zip(BATAS_HISTOGRAM + (float('inf'),), bucket)}
+            }
+        cache = {'memori_byte': hasil_cache.total, 'memori_entri': len(hasil_cache),
+                 'dokumen_byte': _cache_dokumen.total, 'dokumen_entri': len(_cache_dokumen)}
+        return {'durasi_detik': time.time() - self.mulai, 'penghitung': mentah['penghitung'], 'cache': cache,
+                'tahap': tahap}
+
+    def baris_status(self):
+        # Ringkasan satu baris buat tampilan progress; dihitung ulang paling sering tiap 0,5 detik
+        sekarang = time.monotonic()
+        if sekarang - self._status_terakhir[0] < 0.5:
+            return self._status_terakhir[1]
+        with self._kunci:
+            penghitung = dict(self._penghitung)
+            unduh = self._tahap.get('ttfb')
+        # Cache file cuma ditanya kalau lapis memori miss
+        hit = penghitung.get('cache_memori_hit', 0) + penghitung.get('cache_file_hit', 0)
+        miss = penghitung.get('cache_memori_miss', 0) - penghitung.get('cache_file_hit', 0)
+        halaman = penghitung.get('halaman_selesai', 0)
+        bagian = [f"{halaman / max(time.time() - self.mulai, 1e-9):.1f} hal/detik"]
+        if unduh:
+            bagian.append(f"TTFB p50 {self._persentil(unduh[3], unduh[0], unduh[2], 50) * 1000:.0f} ms")
+        if hit + miss:
+            bagian.append(f"cache {hit / (hit + miss):.0%}")
+        teks = ' | '.join(bagian)
+        self._status_terakhir = (sekarang, teks)
+        return teks
+
+    def teks_prometheus(self):
+        mentah = self.ambil_mentah()
+        baris = []
+        for nama, nilai in sorted(mentah['penghitung'].items()):
+            baris.append(f"# TYPE phantom_{nama}_total counter")
+            baris.append(f"phantom_{nama}_total {nilai}")
+        if mentah['tahap']:
+            baris.append("# TYPE phantom_durasi_detik histogram")
+        for nama, (jumlah, total, _, bucket) in sorted(mentah['tahap'].items()):
+            kumulatif = 0
+            for batas, isi in zip(BATAS_HISTOGRAM, bucket):
+                kumulatif += isi
+                baris.append(f'phantom_durasi_detik_bucket{{tahap="{nama}",le="{batas:g}"}} {kumulatif}')
+            baris.append(f'phantom_durasi_detik_bucket{{tahap="{nama}",le="+Inf"}} {jumlah}')
+            baris.append(f'phantom_durasi_detik_sum{{tahap="{nama}"}} {total}')
+            baris.append(f'phantom_durasi_detik_count{{tahap="{nama}"}} {jumlah}')
+        return '\n'.join(baris) + '\n'
+
+    def tulis_laporan(self, nama_file, **info):
+        laporan = dict(info)
+        laporan.update(self.ringkasan())
+        with open(nama_file, 'w', encoding='utf-8') as f:
+            json.dump(laporan, f, ensure_ascii=False, indent=4)
+        return laporan
+
+metrik = Metrik()
+
+def _jalankan_terukur(fungsi, *argumen):
+    # Dipakai buat tugas yang dikirim ke pool; di proses pekerja metriknya ikut dikirim balik biar bisa digabung
+    hasil = fungsi(*argumen)
+    if multiprocessing.parent_process() is not None:
+        return hasil, metrik.ambil_mentah(reset=True)
+    return hasil, None
+
+_server_metrik = None
+
+def jalankan_server_metrik(port=KINERJA_KONFIGURASI['PORT_METRIK']):
+    # Endpoint teks Prometheus di /metrics, jalan di thread latar; cukup dinyalakan sekali per proses
+    global _server_metrik
+    if _server_metrik is not None or not port:
+        return _server_metrik
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class PenanganMetrik(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?')[0] != '/metrics':
+                self.send_error(404)
+                return
+            isi = metrik.teks_prometheus().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4')
+            self.send_header('Content-Length', str(len(isi)))
+            self.end_headers()
+            self.wfile.write(isi)
+
+        def log_message(self, *argumen):
+            pass
+
+    _server_metrik = ThreadingHTTPServer(('0.0.0.0', port), PenanganMetrik)
+    threading.Thread(target=_server_metrik.serve_forever, name='server-metrik', daemon=True).start()
+    logging.info(f"Metrik Prometheus tersedia di http://localhost:{port}/metrics")
+    return _server_metrik
+
+def url_valid(url):
+    parsed = urlparse(url)
+    return bool(parsed.netloc) and bool(parsed.scheme)
+
+class PenyimpananCache:
+    # Cache respons di SQLite (mode WAL): satu baris per URL, jadi lookup gak perlu baca seluruh file
+    def __init__(self, path, maks_ukuran, kompresi=True):
+        self.path = path
+        self.maks_ukuran = maks_ukuran
+        self.kompresi = kompresi
+        self._kunci = threading.Lock()
+        self._koneksi = None
+        self._pid = None
+        self._total = 0
+
+    def _sambung(self):
+        # Koneksi dibuat ulang kalau proses di-fork, koneksi SQLite gak boleh dipakai lintas proses
+        if self._koneksi is None or self._pid != os.getpid():
+            self._koneksi = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+            self._koneksi.execute('PRAGMA journal_mode=WAL')
+            self._koneksi.execute('PRAGMA synchronous=NORMAL')
+            self._koneksi.execute("""
+                CREATE TABLE IF NOT EXISTS cache (
+                    url TEXT PRIMARY KEY,
+                    data BLOB NOT NULL,
+                    terkompresi INTEGER NOT NULL,
+                    kedaluwarsa REAL NOT NULL,
+                    diakses REAL NOT NULL,
+                    ukuran INTEGER NOT NULL
+                )
+            """)
+            self._koneksi.execute('CREATE INDEX IF NOT EXISTS idx_cache_diakses ON cache(diakses)')
+            self._total = self._koneksi.execute('SELECT COALESCE(SUM(ukuran), 0) FROM cache').fetchone()[0]
+            self._pid = os.getpid()
+        return self._koneksi
+
+    def ambil(self, url):
+        with self._kunci:
+            koneksi = self._sambung()
+            baris = koneksi.execute(
+                'SELECT data, terkompresi, kedaluwarsa, ukuran FROM cache WHERE url = ?', (url,)).fetchone()
+            if baris is None:
+                return None
+            data, terkompresi, kedaluwarsa, ukuran = baris
+            sekarang = time.time()
+            if sekarang >= kedaluwarsa:
+                koneksi.execute('DELETE FROM cache WHERE url = ?', (url,))
+                self._total -= ukuran
+                return None
+            koneksi.execute('UPDATE cache SET diakses = ? WHERE url = ?', (sekarang, url))
+        if terkompresi:
+            data = zlib.decompress(data)
+        return json.loads(data)
+
+    def simpan(self, url, nilai, ttl=KONFIGURASI['CACHE_EXPIRY']):
+        data = json.dumps(nilai, ensure_ascii=False).encode('utf-8')
+        terkompresi = 0
+        if self.kompresi:
+            data = zlib.compress(data, 6)
+            terkompresi = 1
+        sekarang = time.time()
+        with self._kunci:
+            koneksi = self._sambung()
+            lama = koneksi.execute('SELECT ukuran FROM cache WHERE url = ?', (url,)).fetchone()
+            koneksi.execute(
+                'INSERT OR REPLACE INTO cache (url, data, terkompresi, kedaluwarsa, diakses, ukuran) VALUES (?, ?, ?, ?, ?, ?)',
+                (url, data, terkompresi, sekarang + ttl, sekarang, len(data)))
+            self._total += len(data) - (lama[0] if lama else 0)
+            self._gusur(koneksi)
+
+    def _gusur(self, koneksi):
+        # LRU berdasarkan ukuran: buang entri yang paling lama gak diakses sampai di bawah batas
+        while self._total > self.maks_ukuran:
+            korban = koneksi.execute('SELECT url, ukuran FROM cache ORDER BY diakses LIMIT 64').fetchall()
+            if not korban:
+                self._total = 0
+                break
+            koneksi.executemany('DELETE FROM cache WHERE url = ?', [(url,) for url, _ in korban])
+            self._total -= sum(ukuran for _, ukuran in korban)
+
+_cache_store = None
+_kunci_cache_store = threading.Lock()
+
+def dapatkan_cache_store():
+    global _cache_store
+    with _kunci_cache_store:
+        if _cache_store is None:
+            _cache_store = PenyimpananCache(KONFIGURASI['CACHE_FILE'], KONFIGURASI['CACHE_MAKS_UKURAN'],
+                                            KONFIGURASI['CACHE_KOMPRESI'])
+        return _cache_store
+
+def _baca_cache(url):
+    # Lapis memori dulu, baru cache file; hit dari file ikut dinaikkan ke memori
+    entri = hasil_cache.get(url)
+    if entri is not None and time.time() - entri['waktu'] < KONFIGURASI['CACHE_EXPIRY']:
+        metrik.tambah('cache_memori_hit')
+        return entri['data']
+    metrik.tambah('cache_memori_miss')
+    if KONFIGURASI['GUNAKAN_CACHE_FILE']:
+        with metrik.ukur('cache_baca'):
+            entri = dapatkan_cache_store().ambil(url)
+        if entri is not None:
+            metrik.tambah('cache_file_hit')
+            hasil = tuple(entri['data'])
+            hasil_cache[url] = {'data': hasil, 'header': entri.get('header'), 'waktu': time.time()}
+            return hasil
+        metrik.tambah('cache_file_miss')
+    return None
+
+def _tulis_cache(url, hasil, header=None):
+    hasil_cache[url] = {'data': hasil, 'header': header, 'waktu': time.time()}
+    if KONFIGURASI['GUNAKAN_CACHE_FILE']:
+        with metrik.ukur('cache_tulis'):
+            dapatkan_cache_store().simpan(url, {'data': hasil, 'header': header})
+
+_cache_header = OrderedDict()
+_kunci_cache_header = threading.Lock()
+
+def _catat_header(url, header):
+    with _kunci_cache_header:
+        _cache_header[url] = header
+        _cache_header.move_to_end(url)
+        while len(_cache_header) > KONFIGURASI['MAKS_CACHE_HEADER']:
+            _cache_header.popitem(last=False)
+
+def ambil_header_respons(url):
+    # Header respons terakhir untuk URL ini, dari memori atau dari cache respons; gak pernah bikin permintaan baru
+    with _kunci_cache_header:
+        if url in _cache_header:
+            return _cache_header[url]
+    entri = hasil_cache.get(url)
+    if entri is None and KONFIGURASI['GUNAKAN_CACHE_FILE']:
+        entri = dapatkan_cache_store().ambil(url)
+    return (entri or {}).get('header') or {}
+
+_sesi_bersama = None
+_kunci_sesi = threading.Lock()
+
+def _koneksi_terukur(kelas_koneksi):
+    # Waktu buka koneksi baru (DNS + TCP + TLS); koneksi keep-alive yang dipakai ulang gak lewat sini
+    class KoneksiTerukur(kelas_koneksi):
+        def connect(self):
+            with metrik.ukur('koneksi'):
+                super().connect()
+            metrik.tambah('koneksi_baru')
+
+    return KoneksiTerukur
+
+class PoolHTTPTerukur(HTTPConnectionPool):
+    ConnectionCls = _koneksi_terukur(HTTPConnection)
+
+class PoolHTTPSTerukur(HTTPSConnectionPool):
+    ConnectionCls = _koneksi_terukur(HTTPSConnection)
+
+POOL_TERUKUR = {'http': PoolHTTPTerukur, 'https': PoolHTTPSTerukur}
+
+class AdapterTerukur(requests.adapters.HTTPAdapter):
+    def init_poolmanager(self, *argumen, **opsi):
+        super().init_poolmanager(*argumen, **opsi)
+        self.poolmanager.pool_classes_by_scheme = POOL_TERUKUR
+
+    def proxy_manager_for(self, proxy, **opsi):
+        manager = super().proxy_manager_for(proxy, **opsi)
+        # Proxy SOCKS (Tor) punya kelas pool sendiri, jadi cuma proxy HTTP biasa yang diukur
+        if type(manager) is urllib3.ProxyManager:
+            manager.pool_classes_by_scheme = POOL_TERUKUR
+        return manager
+
+def _buat_adapter(ukuran_pool):
+    return AdapterTerukur(pool_connections=KINERJA_KONFIGURASI['JUMLAH_POOL_HOST'], pool_maxsize=ukuran_pool)
+
+def dapatkan_sesi():
+    # Satu session dipakai bareng semua thread, biar koneksi TCP/TLS ke host yang sama dipakai ulang (keep-alive)
+    global _sesi_bersama
+    with _kunci_sesi:
+        if _sesi_bersama is None:
+            sesi = requests.Session()
+            adapter = _buat_adapter(KINERJA_KONFIGURASI['UKURAN_POOL_PER_HOST'])
+            sesi.mount('http://', adapter)
+            sesi.mount('https://', adapter)
+            for host, ukuran_pool in KINERJA_KONFIGURASI['UKURAN_POOL_KHUSUS'].items():
+                adapter_host = _buat_adapter(ukuran_pool)
+                sesi.mount(f'http://{host}/', adapter_host)
+                sesi.mount(f'https://{host}/', adapter_host)
+
+            if KEAMANAN_KONFIGURASI['GUNAKAN_TOR']:
+                sesi.proxies = {'http': KEAMANAN_KONFIGURASI['TOR_PROXY'], 'https': KEAMANAN_KONFIGURASI['TOR_PROXY']}
+            elif KONFIGURASI['GUNAKAN_PROXY']:
+                sesi.proxies = dict(KONFIGURASI['PROXY'])
+            sesi.verify = KEAMANAN_KONFIGURASI['VERIFIKASI_SSL']
+            _sesi_bersama = sesi
+        return _sesi_bersama
+
+def statistik_koneksi():
+    permintaan = 0
+    koneksi_baru = 0
+    if _sesi_bersama is not None:
+        adapters = {id(adapter): adapter for adapter in _sesi_bersama.adapters.values()}
+        for adapter in adapters.values():
+            managers = [adapter.poolmanager, *adapter.proxy_manager.values()]
+            for manager in managers:
+                for kunci in manager.pools.keys():
+                    pool = manager.pools.get(kunci)
+                    if pool is not None:
+                        permintaan += pool.num_requests
+                        koneksi_baru += pool.num_connections
+    return {
+        'permintaan': permintaan,
+        'koneksi_baru': koneksi_baru,
+        'koneksi_dipakai_ulang': max(permintaan - koneksi_baru, 0)
+    }
+
+class PenjadwalDomain:
+    # Token bucket + jeda minimum per host, jadi banyak domain bisa jalan paralel tanpa melanggar batas tiap host
+    def __init__(self, permintaan_per_menit, jeda_minimum, kapasitas=1):
+        self.laju = permintaan_per_menit / 60.0
+        self.jeda_minimum = jeda_minimum
+        self.kapasitas = kapasitas
+        self._kunci = threading.Lock()
+        self._host = {}
+
+    def _status(self, host, sekarang):
+        status = self._host.get(host)
+        if status is None:
+            status = {'token': self.kapasitas, 'isi_ulang': sekarang, 'berikutnya': sekarang, 'jeda': self.jeda_minimum}
+            self._host[host] = status
+        return status
+
+    def atur_jeda(self, host, jeda):
+        with self._kunci:
+            status = self._status(host, time.monotonic())
+            status['jeda'] = max(self.jeda_minimum, jeda)
+
+    def _pesan_slot(self, host):
+        # Pesan slot berikutnya buat host ini, balikin berapa detik harus nunggu
+        with self._kunci:
+            sekarang = time.monotonic()
+            status = self._status(host, sekarang)
+            status['token'] = min(self.kapasitas, status['token'] + (sekarang - status['isi_ulang']) * self.laju)
+            status['isi_ulang'] = sekarang
+            mulai = max(sekarang, status['berikutnya'])
+            if status['token'] < 1:
+                mulai = max(mulai, sekarang + (1 - status['token']) / self.laju)
+            status['token'] -= 1
+            status['berikutnya'] = mulai + status['jeda']
+            return mulai - sekarang
+
+    def jadwal(self, daftar_host):
+        # Waktu (epoch) paling awal tiap host boleh diminta lagi, buat dibagi ke proses lain lewat frontier bersama
+        with self._kunci:
+            selisih = time.time() - time.monotonic()
+            return {host: self._host[host]['berikutnya'] + selisih for host in daftar_host if host in self._host}
+
+    def tunda_sampai(self, host, waktu):
+        # Kebalikan jadwal(): slot berikutnya host ini gak boleh lebih awal dari waktu (epoch) dari proses lain
+        with self._kunci:
+            sekarang = time.monotonic()
+            status = self._status(host, sekarang)
+            status['berikutnya'] = max(status['berikutnya'], waktu - time.time() + sekarang)
+
+    def tunggu(self, host):
+        jeda = self._pesan_slot(host)
+        if jeda > 0:
+            time.sleep(jeda)
+
+    async def tunggu_async(self, host):
+        jeda = self._pesan_slot(host)
+        if jeda > 0:
+            await asyncio.sleep(jeda)
+
+penjadwal = PenjadwalDomain(KONFIGURASI['BATAS_PERMINTAAN'], CRAWLING_KONFIGURASI['JEDA_ANTAR_PERMINTAAN'],
+                            CRAWLING_KONFIGURASI['KAPASITAS_BURST_PER_HOST'])
+
+@lru_cache(maxsize=None)
+def _pilih_parser():
+    parser = PARSING_KONFIGURASI['PARSER']
+    if parser == 'lxml':
+        try:
+            import lxml  # noqa: F401
+        except ImportError:
+            logging.warning("lxml tidak terpasang, kembali ke html.parser")
+            return 'html.parser'
+    return parser
+
+class DokumenHTML:
+    # HTML di-parse sekali aja, turunan (judul, tautan, teks, hitungan tag) dihitung pas pertama dipakai lalu disimpan
+    def __init__(self, konten_html):
+        self.konten_html = konten_html
+
+    @cached_property
+    def sup(self):
+        with metrik.ukur('parse'):
+            return BeautifulSoup(self.konten_html, _pilih_parser())
+
+    @cached_property
+    def judul(self):
+        return self.sup.title.string if self.sup.title else None
+
+    @cached_property
+    def tautan(self):
+        return [tautan['href'] for tautan in self.sup.find_all('a', href=True)]
+
+    @cached_property
+    def teks(self):
+        return self.sup.get_text()
+
+    @cached_property
+    def meta(self):
+        meta = {}
+        for tag in self.sup.find_all('meta'):
+            nama = tag.get('name') or tag.get('property')
+            if nama and tag.get('content') is not None:
+                meta[nama.lower()] = tag['content']
+        return meta
+
+    @cached_property
+    def elemen(self):
+        sup = self.sup
+        with metrik.ukur('ekstrak'):
+            return ekstrak_elemen_spesifik(sup)
+
+    @cached_property
+    def _statistik_tag(self):
+        # Satu kali jalan ke seluruh pohon buat semua hitungan
+        jumlah = Counter()
+        sumber_eksternal = 0
+        for tag in self.sup.find_all():
+            jumlah[tag.name] += 1
+            if tag.name == 'link' and tag.get('href', '').startswith('http'):
+                sumber_eksternal += 1
+        return jumlah, sumber_eksternal
+
+    @property
+    def jumlah_tag(self):
+        return sum(self._statistik_tag[0].values())
+
+    @property
+    def jumlah_tautan(self):
+        return self._statistik_tag[0]['a']
+
+    @property
+    def jumlah_gambar(self):
+        return self._statistik_tag[0]['img']
+
+    @property
+    def sumber_eksternal(self):
+        return self._statistik_tag[1]
+
+POLA_LINK_EKSTERNAL = re.compile(r'<link\b[^>]*?\bhref\s*=\s*["\']?http', re.IGNORECASE)
+
+def _hitung_sumber_eksternal(konten_html):
+    # Hitungan cepat tanpa bikin pohon DOM, biar fetcher gak perlu parsing (parsing cukup sekali di tahap proses)
+    return len(POLA_LINK_EKSTERNAL.findall(konten_html))
+
+# Pohon soup kira-kira beberapa kali ukuran HTML-nya, jadi batas byte dihitung dari HTML x faktor ini
+FAKTOR_UKURAN_SOUP = 8
+_cache_dokumen = CacheMemori(PARSING_KONFIGURASI['MAKS_UKURAN_CACHE_DOKUMEN'],
+                             ukuran=lambda dokumen: len(dokumen.konten_html) * FAKTOR_UKURAN_SOUP)
+_kunci_cache_dokumen = threading.Lock()
+
+def dapatkan_dokumen(konten_html):
+    # Respons yang sama (fetch -> crawl -> analisis) dapet objek dokumen yang sama
+    with _kunci_cache_dokumen:
+        dokumen = _cache_dokumen.get(konten_html)
+        if dokumen is not None:
+            metrik.tambah('cache_dokumen_hit')
+            return dokumen
+        metrik.tambah('cache_dokumen_miss')
+        dokumen = DokumenHTML(konten_html)
+        _cache_dokumen[konten_html] = dokumen
+        return dokumen
+
+class KontenDitolak(Exception):
+    # Respons sengaja gak diunduh (bukan HTML atau kebesaran); alasannya dicatat di rekaman crawl
+    def __init__(self, url, alasan):
+        super().__init__(f"{dapatkan_pesan_error(KODE_ERROR['KONTEN_DITOLAK'])} ({alasan})")
+        self.url = url
+        self.alasan = alasan
+
+    def __reduce__(self):
+        return (KontenDitolak, (self.url, self.alasan))
+
+POLA_CHARSET_HEADER = re.compile(r'charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+POLA_CHARSET_META = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+
+def _periksa_header(url, tipe_konten, panjang):
+    # Penolakan paling awal: cukup dari header, badan respons belum dibaca sama sekali
+    if tipe_konten:
+        mime = tipe_konten.split(';', 1)[0].strip().lower()
+        if mime not in KONFIGURASI['TIPE_KONTEN_DIIZINKAN']:
+            raise KontenDitolak(url, f"Content-Type {mime}")
+    if panjang and panjang.isdigit() and int(panjang) > KONFIGURASI['MAKS_UKURAN_RESPONS']:
+        raise KontenDitolak(url, f"Content-Length {panjang} byte melebihi batas {KONFIGURASI['MAKS_UKURAN_RESPONS']} byte")
+
+def _perlu_periksa_head(url):
+    return (KONFIGURASI['PERIKSA_HEAD_EKSTENSI'] and
+            os.path.splitext(urlparse(url).path)[1].lower() in KONFIGURASI['EKSTENSI_MENCURIGAKAN'])
+
+class PembacaBadan:
+    # Badan respons dibaca per potongan: batas ukuran dicek tiap potongan (aliran tanpa akhir pun berhenti) dan teks
+    # didekode bertahap, jadi gak ada salinan bytes penuh di samping string-nya
+    def __init__(self, url, tipe_konten):
+        self.url = url
+        self.tipe_konten = tipe_konten or ''
+        self.ukuran = 0
+        self._bagian = []
+        self._dekoder = None
+
+    def _encoding(self, potongan_awal):
+        # Urutan: charset di header, <meta charset> di awal dokumen, BOM, lalu UTF-8
+        cocok = POLA_CHARSET_HEADER.search(self.tipe_konten)
+        nama = cocok.group(1) if cocok else None
+        if nama is None:
+            cocok = POLA_CHARSET_META.search(potongan_awal[:4096])
+            nama = cocok.group(1).decode('ascii', 'ignore') if cocok else None
+        if nama:
+            try:
+                return codecs.lookup(nama).name
+            except LookupError:
+                pass
+        return 'utf-8-sig' if potongan_awal.startswith(codecs.BOM_UTF8) else 'utf-8'
+
+    def tambah(self, potongan):
+        self.ukuran += len(potongan)
+        if self.ukuran > KONFIGURASI['MAKS_UKURAN_RESPONS']:
+            raise KontenDitolak(self.url, f"badan respons melebihi batas {KONFIGURASI['MAKS_UKURAN_RESPONS']} byte")
+        if self._dekoder is None:
+            self._dekoder = codecs.getincrementaldecoder(self._encoding(potongan))(errors='replace')
+        self._bagian.append(self._dekoder.decode(potongan))
+
+    def teks(self):
+        if self._dekoder is not None:
+            self._bagian.append(self._dekoder.decode(b'', final=True))
+        return ''.join(self._bagian)
+
+def _probe_head(url, headers):
+    # HEAD dulu untuk URL yang kelihatannya bukan halaman: kalau ditolak, koneksi keep-alive gak perlu diputus di tengah
+    # badan respons. HEAD yang gagal/ditolak server diabaikan, GET tetap mengecek header yang sama.
+    with metrik.ukur('antre_host'):
+        penjadwal.tunggu(urlparse(url).netloc)
+    metrik.tambah('permintaan_head')
+    try:
+        response = dapatkan_sesi().head(url, headers=headers, timeout=KINERJA_KONFIGURASI['TIMEOUT_PERMINTAAN'],
+                                        allow_redirects=True)
+    except requests.RequestException:
+        return
+    if response.ok:
+        _periksa_header(url, response.headers.get('Content-Type'), response.headers.get('Content-Length'))
+
+def _unduh(url, validator=None):
+    # Satu permintaan GET lengkap dengan retry; validator berisi If-None-Match/If-Modified-Since untuk permintaan kondisional.
+    # Balikin (hasil, header), hasil None kalau server menjawab 304 Not Modified. Respons yang bukan HTML atau melebihi
+    # MAKS_UKURAN_RESPONS gak diunduh sampai habis, tapi memunculkan KontenDitolak.
+    headers = HEADER.copy()
+    headers["User-Agent"] = random.choice(AGEN_PENGGUNA)
+    headers.update(validator or {})
+    try:
+        if _perlu_periksa_head(url):
+            _probe_head(url, headers)
+    except KontenDitolak:
+        metrik.tambah('konten_ditolak')
+        raise
+
+    for percobaan in range(KONFIGURASI['MAKS_PERCOBAAN']):
+        try:
+            with metrik.ukur('antre_host'):
+                penjadwal.tunggu(urlparse(url).netloc)
+            metrik.tambah('permintaan')
+            # stream=True biar waktu sampai header (TTFB) dan waktu unduh badan respons bisa diukur terpisah
+            response = dapatkan_sesi().get(
+                url,
+                headers=headers,
+                timeout=KINERJA_KONFIGURASI['TIMEOUT_PERMINTAAN'],
+                stream=True
+            )
+            metrik.catat('ttfb', response.elapsed.total_seconds())
+            header = dict(response.headers)
+            if validator and response.status_code == 304:
+                metrik.tambah('respons_304')
+                response.close()
+                _catat_header(url, header)
+                return None, header
+            with response:
+                # Di dalam with supaya respons 4xx/5xx juga ditutup dan koneksinya balik ke pool sebelum retry
+                response.raise_for_status()
+                _periksa_header(url, response.headers.get('Content-Type'), response.headers.get('Content-Length'))
+                pembaca = PembacaBadan(url, response.headers.get('Content-Type'))
+                with metrik.ukur('unduh'):
+                    for potongan in response.iter_content(KONFIGURASI['UKURAN_POTONGAN_UNDUH']):
+                        pembaca.tambah(potongan)
+            waktu_muat = response.elapsed.total_seconds()
+            ukuran_konten = pembaca.ukuran
+            metrik.tambah('byte_diunduh', ukuran_konten)
+            konten_html = pembaca.teks()
+            sumber_eksternal = _hitung_sumber_eksternal(konten_html)
+            
+            hasil = (konten_html, waktu_muat, ukuran_konten, sumber_eksternal)
+            _catat_header(url, header)
+            return hasil, header
+        except KontenDitolak:
+            metrik.tambah('konten_ditolak')
+            raise
+        except requests.RequestException as e:
+            metrik.tambah('permintaan_gagal')
+            if percobaan == KONFIGURASI['MAKS_PERCOBAAN'] - 1:
+                if isinstance(e, requests.Timeout):
+                    kode_error = KODE_ERROR['BATAS_WAKTU_TERLAMPAUI']
+                elif isinstance(e, requests.exceptions.SSLError):
+                    kode_error = KODE_ERROR['KESALAHAN_SSL']
+                else:
+                    kode_error = KODE_ERROR['KONEKSI_GAGAL']
+                pesan_error = dapatkan_pesan_error(kode_error)
+                logging.error(f"Gagal mengambil {url}: {pesan_error}")
+                raise Exception(pesan_error)
+            time.sleep(2 ** percobaan)  # Exponential backoff
+
+def ambil_kode_sumber(url, gunakan_cache=True):
+    if gunakan_cache:
+        hasil = _baca_cache(url)
+        if hasil is not None:
+            return hasil
+
+    hasil, header = _unduh(url)
+    if gunakan_cache:
+        _tulis_cache(url, hasil, header)
+    return hasil
+
+async def ambil_kode_sumber_async(sesi, url, pool_cpu, gunakan_cache=True, validator=None):
+    # Versi asyncio dari ambil_kode_sumber, hasilnya sama persis (konten, waktu muat, ukuran, sumber eksternal).
+    # Dengan validator permintaannya kondisional dan hasilnya None kalau server menjawab 304.
+    import aiohttp
+
+    loop = asyncio.get_running_loop()
+    if gunakan_cache:
+        hasil = await loop.run_in_executor(pool_cpu, _baca_cache, url)
+        if hasil is not None:
+            return hasil
+
+    if KEAMANAN_KONFIGURASI['GUNAKAN_TOR']:
+        # aiohttp gak bisa SOCKS tanpa paket tambahan, jadi lewat jalur requests aja
+        if validator:
+            hasil, _ = await loop.run_in_executor(pool_cpu, _unduh, url, validator)
+            return hasil
+        return await loop.run_in_executor(pool_cpu, ambil_kode_sumber, url, gunakan_cache)
+
+    headers = HEADER.copy()
+    headers["User-Agent"] = random.choice(AGEN_PENGGUNA)
+    headers.update(validator or {})
+    proxy = KONFIGURASI['PROXY'].get(urlparse(url).scheme) if KONFIGURASI['GUNAKAN_PROXY'] else None
+
+    try:
+        if _perlu_periksa_head(url):
+            with metrik.ukur('antre_host'):
+                await penjadwal.tunggu_async(urlparse(url).netloc)
+            metrik.tambah('permintaan_head')
+            try:
+                async with sesi.head(url, headers=headers, proxy=proxy, allow_redirects=True) as kepala:
+                    if kepala.ok:
+                        _periksa_header(url, kepala.headers.get('Content-Type'), kepala.headers.get('Content-Length'))
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                pass
+    except KontenDitolak:
+        metrik.tambah('konten_ditolak')
+        raise
+
+    for percobaan in range(KONFIGURASI['MAKS_PERCOBAAN']):
+        try:
+            with metrik.ukur('antre_host'):
+                await penjadwal.tunggu_async(urlparse(url).netloc)
+            metrik.tambah('permintaan')
+            mulai = time.perf_counter()
+            async with sesi.get(url, headers=headers, proxy=proxy) as response:
+                waktu_muat = time.perf_counter() - mulai
+                metrik.catat('ttfb', waktu_muat)
+                if validator and response.status == 304:
+                    metrik.tambah('respons_304')
+                    _catat_header(url, dict(response.headers))
+                    return None
+                response.raise_for_status()
+                _periksa_header(url, response.headers.get('Content-Type'), response.headers.get('Content-Length'))
+                pembaca = PembacaBadan(url, response.headers.get('Content-Type'))
+                with metrik.ukur('unduh'):
+                    async for potongan in response.content.iter_chunked(KONFIGURASI['UKURAN_POTONGAN_UNDUH']):
+                        pembaca.tambah(potongan)
+                header = dict(response.headers)
+
+            konten_html = pembaca.teks()
+            ukuran_konten = pembaca.ukuran
+            metrik.tambah('byte_diunduh', ukuran_konten)
+            sumber_eksternal = _hitung_sumber_eksternal(konten_html)
+
+            hasil = (konten_html, waktu_muat, ukuran_konten, sumber_eksternal)
+            _catat_header(url, header)
+
+            if gunakan_cache:
+                await loop.run_in_executor(pool_cpu, _tulis_cache, url, hasil, header)
+
+            return hasil
+        except KontenDitolak:
+            metrik.tambah('konten_ditolak')
+            raise
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            metrik.tambah('permintaan_gagal')
+            if percobaan == KONFIGURASI['MAKS_PERCOBAAN'] - 1:
+                if isinstance(e, asyncio.TimeoutError):
+                    kode_error = KODE_ERROR['BATAS_WAKTU_TERLAMPAUI']
+                elif isinstance(e, aiohttp.ClientSSLError):
+                    kode_error = KODE_ERROR['KESALAHAN_SSL']
+                else:
+                    kode_error = KODE_ERROR['KONEKSI_GAGAL']
+                pesan_error = dapatkan_pesan_error(kode_error)
+                logging.error(f"Gagal mengambil {url}: {pesan_error}")
+                raise Exception(pesan_error)
+            await asyncio.sleep(2 ** percobaan)  # Exponential backoff
+
+def _buat_trace_metrik():
+    # Hook aiohttp buat waktu DNS dan buka koneksi, yang gak kelihatan dari luar sesi.get
+    import aiohttp
+
+    def mulai_ukur(kunci):
+        async def hook(sesi, konteks_trace, params):
+            setattr(konteks_trace, kunci, time.perf_counter())
+        return hook
+
+    def akhiri_ukur(kunci, tahap):
+        async def hook(sesi, konteks_trace, params):
+            mulai = getattr(konteks_trace, kunci, None)
+            if mulai is not None:
+                metrik.catat(tahap, time.perf_counter() - mulai)
+            if tahap == 'koneksi':
+                metrik.tambah('koneksi_baru')
+        return hook
+
+    trace = aiohttp.TraceConfig()
+    trace.on_dns_resolvehost_start.append(mulai_ukur('mulai_dns'))
+    trace.on_dns_resolvehost_end.append(akhiri_ukur('mulai_dns', 'dns'))
+    trace.on_connection_create_start.append(mulai_ukur('mulai_koneksi'))
+    trace.on_connection_create_end.append(akhiri_ukur('mulai_koneksi', 'koneksi'))
+    return trace
+
+def parse_html(konten_html):
+    return dapatkan_dokumen(konten_html).sup
+
+def ekstrak_elemen_spesifik(sup):
+    deskripsi_meta = sup.find('meta', attrs={'name': 'description'})
+    kata_kunci_meta = sup.find('meta', attrs={'name': 'keywords'})
+    tag_h1 = sup.find_all('h1')
+    
+    hasil = {
+        'deskripsi_meta': deskripsi_meta['content'] if deskripsi_meta else None,
+        'kata_kunci_meta': kata_kunci_meta['content'] if kata_kunci_meta else None,
+        'tag_h1': [h1.text for h1 in tag_h1]
+    }
+    
+    if PARSING_KONFIGURASI['EKSTRAK_JAVASCRIPT']:
+        hasil['javascript'] = [script.string for script in sup.find_all('script') if script.string]
+    
+    if PARSING_KONFIGURASI['EKSTRAK_CSS']:
+        hasil['css'] = [style.string for style in sup.find_all('style') if style.string]
+    
+    if PARSING_KONFIGURASI['EKSTRAK_KOMENTAR']:
+        hasil['komentar'] = sup.find_all(text=lambda text: isinstance(text, Comment))
+    
+    return hasil
+
+def _buka_keluaran(nama_file):
+    # Buka berkas teks tujuan; kalau KOMPRESI_OUTPUT nyala, kompresi jalan di pass yang sama (gak ditulis dua kali)
+    if nama_file == '-':
+        # '-' berarti stdout, gak dikompres dan gak ikut ditutup
+        return nama_file, open(sys.stdout.fileno(), 'w', encoding='utf-8', newline='', closefd=False), []
+    if not OUTPUT_KONFIGURASI['KOMPRESI_OUTPUT']:
+        return nama_file, open(nama_file, 'w', encoding='utf-8', newline=''), []
+
+    format_kompresi = OUTPUT_KONFIGURASI['FORMAT_KOMPRESI']
+    if format_kompresi == 'gzip':
+        nama_akhir = f"{nama_file}.gz"
+        return nama_akhir, gzip.open(nama_akhir, 'wt', encoding='utf-8', newline=''), []
+    if format_kompresi == 'zstd':
+        import zstandard
+        nama_akhir = f"{nama_file}.zst"
+        mentah = open(nama_akhir, 'wb')
+        penulis_zstd = zstandard.ZstdCompressor().stream_writer(mentah)
+        return nama_akhir, io.TextIOWrapper(penulis_zstd, encoding='utf-8', newline=''), []
+
+    nama_akhir = f"{nama_file}.zip"
+    arsip = zipfile.ZipFile(nama_akhir, 'w', zipfile.ZIP_DEFLATED)
+    anggota = arsip.open(os.path.basename(nama_file), 'w', force_zip64=True)
+    return nama_akhir, io.TextIOWrapper(anggota, encoding='utf-8', newline=''), [arsip]
+
+class PenulisEkspor:
+    # Penulis streaming: rekaman ditulis satu per satu, bisa langsung dipakai sebagai sink crawler
+    def __init__(self, nama_file):
+        self.nama_file, self._berkas, self._penutup = _buka_keluaran(nama_file)
+        self.jumlah = 0
+        self._mulai()
+
+    def _mulai(self):
+        pass
+
+    def _tulis(self, rekaman):
+        raise NotImplementedError
+
+    def _akhiri(self):
+        pass
+
+    def tulis(self, rekaman):
+        with metrik.ukur('ekspor'):
+            self._tulis(rekaman)
+        self.jumlah += 1
+
+    __call__ = tulis
+
+    def tutup(self):
+        self._akhiri()
+        self._berkas.close()
+        for penutup in self._penutup:
+            penutup.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.tutup()
+
+class PenulisJSON(PenulisEkspor):
+    def _mulai(self):
+        self._berkas.write('[')
+
+    def _tulis(self, rekaman):
+        self._berkas.write(',\n' if self.jumlah else '\n')
+        self._berkas.write(json.dumps(rekaman, ensure_ascii=False, indent=4, default=_ke_json))
+
+    def _akhiri(self):
+        self._berkas.write('\n]\n' if self.jumlah else ']\n')
+
+class PenulisJSONL(PenulisEkspor):
+    def _tulis(self, rekaman):
+        self._berkas.write(json.dumps(rekaman, ensure_ascii=False, default=_ke_json))
+        self._berkas.write('\n')
+
+KOLOM_CSV = ['url', 'judul', 'deskripsi_meta', 'kata_kunci_meta', 'tag_h1', 'lainnya']
+
+class PenulisCSV(PenulisEkspor):
+    # Skema kolom tetap biar tiap baris sejajar; kunci di luar skema masuk ke kolom 'lainnya' sebagai JSON
+    def _mulai(self):
+        self._csv = csv.writer(self._berkas)
+        self._csv.writerow(KOLOM_CSV)
+
+    def _tulis(self, rekaman):
+        datar = dict(rekaman)
+        datar.update(datar.pop('elemen', None) or {})
+        baris = []
+        for kolom in KOLOM_CSV[:-1]:
+            nilai = datar.pop(kolom, None)
+            if nilai is None:
+                nilai = ''
+            elif isinstance(nilai, (list, dict)):
+                nilai = json.dumps(nilai, ensure_ascii=False)
+            baris.append(nilai)
+        baris.append(json.dumps(datar, ensure_ascii=False) if datar else '')
+        self._csv.writerow(baris)
+
+class PenulisXML(PenulisEkspor):
+    def _mulai(self):
+        self._berkas.write("<?xml version='1.0' encoding='utf-8'?>\n<data_website>\n")
+
+    def _elemen(self, nama, nilai):
+        elemen = ET.Element(nama)
+        if isinstance(nilai, Mapping):
+            for kunci, anak in nilai.items():
+                elemen.append(self._elemen(kunci, anak))
+        elif isinstance(nilai, (list, tuple)):
+            for anak in nilai:
+                elemen.append(self._elemen('item', anak))
+        elif nilai is not None:
+            elemen.text = str(nilai)
+        return elemen
+
+    def _tulis(self, rekaman):
+        self._berkas.write(ET.tostring(self._elemen('halaman', rekaman), encoding='unicode'))
+        self._berkas.write('\n')
+
+    def _akhiri(self):
+        self._berkas.write('</data_website>\n')
+
+PENULIS_EKSPOR = {
+    'json': PenulisJSON,
+    'jsonl': PenulisJSONL,
+    'csv': PenulisCSV,
+    'xml': PenulisXML
+}
+
+class PenulisGabungan:
+    # Satu sink yang meneruskan tiap rekaman ke beberapa penulis sekaligus
+    def __init__(self, daftar_penulis):
+        self.daftar_penulis = daftar_penulis
+        self.nama_file = ', '.join(penulis.nama_file for penulis in daftar_penulis)
+
+    @property
+    def jumlah(self):
+        return self.daftar_penulis[0].jumlah
+
+    def tulis(self, rekaman):
+        for penulis in self.daftar_penulis:
+            penulis.tulis(rekaman)
+
+    __call__ = tulis
+
+    def tutup(self):
+        for penulis in self.daftar_penulis:
+            penulis.tutup()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.tutup()
+
+def buka_penulis_ekspor(tipe_format, nama_file):
+    return PENULIS_EKSPOR[tipe_format](nama_file)
+
+def ekspor_ke_format(data, tipe_format, nama_file):
+    if isinstance(data, dict):
+        data = [data]
+    with buka_penulis_ekspor(tipe_format, nama_file) as penulis:
+        for rekaman in data:
+            penulis.tulis(rekaman)
+
+    if nama_file == '-':
+        # Ke stdout gak dikompres, pesan konfirmasi juga gak perlu biar gak nyampur sama datanya
+        return
+    if OUTPUT_KONFIGURASI['KOMPRESI_OUTPUT']:
+        console.print(f"[bold green]File telah dikompres dan disimpan sebagai {penulis.nama_file}[/bold green]")
+    else:
+        console.print(f"[bold green]File telah disimpan sebagai {penulis.nama_file}[/bold green]")
+
+PORT_BAWAAN = {'http': 80, 'https': 443}
+
+def normalisasi_url(url):
+    # Bentuk kanonik URL: skema/host huruf kecil, tanpa port bawaan, query diurutkan, fragment & garis miring akhir dibuang
+    bagian = urlparse(url)
+    skema = bagian.scheme.lower()
+    host = (bagian.hostname or '').lower()
+    if ':' in host:
+        host = f"[{host}]"
+    if bagian.port and bagian.port != PORT_BAWAAN.get(skema):
+        host = f"{host}:{bagian.port}"
+    path = bagian.path or '/'
+    if CRAWLING_KONFIGURASI['HAPUS_GARIS_MIRING_AKHIR'] and len(path) > 1:
+        path = path.rstrip('/') or '/'
+    query = urlencode(sorted(parse_qsl(bagian.query, keep_blank_values=True)))
+    fragment = '' if CRAWLING_KONFIGURASI['ABAIKAN_FRAGMENT'] else bagian.fragment
+    return urlunparse((skema, host, path, bagian.params, query, fragment))
+
+def dalam_cakupan(url, awalan):
+    # url & awalan sudah dinormalisasi. Dicocokkan per batas segmen path, jadi awalan .../blog (garis miring
+    # akhirnya dibuang normalisasi) gak ikut menangkap .../blogger atau .../blog-arsip. Kedalaman path dibatasi
+    # MAKS_KEDALAMAN, sama untuk tautan yang ditemukan maupun URL dari sitemap.
+    if not url.startswith(awalan):
+        return False
+    sisa = url[len(awalan):]
+    if sisa and not awalan.endswith('/') and sisa[0] not in '/?#;':
+        return False
+    return len(urlparse(url).path.split('/')) <= CRAWLING_KONFIGURASI['MAKS_KEDALAMAN']
+
+class FilterBloom:
+    # Set probabilistik berukuran tetap buat crawl yang sangat besar (bisa false positive, gak pernah false negative)
+    def __init__(self, kapasitas, tingkat_false_positive):
+        self.jumlah_bit = max(8, int(-kapasitas * math.log(tingkat_false_positive) / (math.log(2) ** 2)))
+        self.jumlah_hash = max(1, round(self.jumlah_bit / kapasitas * math.log(2)))
+        self._bit = bytearray((self.jumlah_bit + 7) // 8)
+
+    def _posisi(self, item):
+        ringkasan = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(ringkasan[:8], 'little')
+        h2 = int.from_bytes(ringkasan[8:], 'little') | 1
+        for i in range(self.jumlah_hash):
+            yield (h1 + i * h2) % self.jumlah_bit
+
+    def add(self, item):
+        for posisi in self._posisi(item):
+            self._bit[posisi >> 3] |= 1 << (posisi & 7)
+
+    def __contains__(self, item):
+        return all(self._bit[posisi >> 3] & (1 << (posisi & 7)) for posisi in self._posisi(item))
+
+class FrontierCrawl:
+    # Antrean per kedalaman (deque, O(1)) + himpunan "sudah terlihat" yang mencakup URL di antrean maupun yang sudah dikunjungi
+    def __init__(self, gunakan_bloom=CRAWLING_KONFIGURASI['GUNAKAN_BLOOM_FILTER']):
+        self._antrean = []
+        self._kedalaman_min = 0
+        self._jumlah = 0
+        if gunakan_bloom:
+            self._terlihat = FilterBloom(CRAWLING_KONFIGURASI['KAPASITAS_BLOOM'],
+                                         CRAWLING_KONFIGURASI['TINGKAT_FALSE_POSITIVE_BLOOM'])
+        else:
+            self._terlihat = set()
+
+    def tambah(self, url, kedalaman=0):
+        # Balikin URL yang sudah dinormalisasi kalau baru masuk antrean, None kalau sudah pernah terlihat
+        url = normalisasi_url(url)
+        if url in self._terlihat:
+            return None
+        self._terlihat.add(url)
+        while len(self._antrean) <= kedalaman:
+            self._antrean.append(deque())
+        self._antrean[kedalaman].append(url)
+        self._kedalaman_min = min(self._kedalaman_min, kedalaman)
+        self._jumlah += 1
+        return url
+
+    def tandai_terlihat(self, url):
+        self._terlihat.add(normalisasi_url(url))
+
+    def ambil(self):
+        while not self._antrean[self._kedalaman_min]:
+            self._kedalaman_min += 1
+        self._jumlah -= 1
+        return self._antrean[self._kedalaman_min].popleft(), self._kedalaman_min
+
+    def __len__(self):
+        return self._jumlah
+
+class PenyimpananRobots:
+    # robots.txt diambil sekali per host lalu disimpan sampai TTL habis; Crawl-delay diteruskan ke penjadwal
+    def __init__(self, ttl=CRAWLING_KONFIGURASI['TTL_ROBOTS_TXT'], agen=CRAWLING_KONFIGURASI['AGEN_ROBOTS_TXT']):
+        self.ttl = ttl
+        self.agen = agen
+        self._kunci = threading.Lock()
+        self._kunci_host = {}
+        self._host = {}
+
+    def _ambil(self, skema, host):
+        parser = RobotFileParser(f"{skema}://{host}/robots.txt")
+        headers = HEADER.copy()
+        headers["User-Agent"] = random.choice(AGEN_PENGGUNA)
+        try:
+            penjadwal.tunggu(host)
+            response = dapatkan_sesi().get(parser.url, headers=headers,
+                                           timeout=KINERJA_KONFIGURASI['TIMEOUT_PERMINTAAN'])
+            if response.status_code in (401, 403):
+                parser.disallow_all = True
+            elif response.status_code >= 400:
+                parser.allow_all = True
+            else:
+                parser.parse(response.text.splitlines())
+        except requests.RequestException as e:
+            # robots.txt gak bisa diambil: anggap semua boleh biar crawl gak macet total
+            logging.warning(f"Gagal mengambil {parser.url}: {str(e)}")
+            parser.allow_all = True
+
+        jeda = parser.crawl_delay(self.agen)
+        if jeda:
+            penjadwal.atur_jeda(host, float(jeda))
+        return parser
+
+    def dapatkan(self, url):
+        bagian = urlparse(url)
+        host = bagian.netloc
+        with self._kunci:
+            entri = self._host.get(host)
+            if entri and entri[1] > time.monotonic():
+                return entri[0]
+            kunci_host = self._kunci_host.setdefault(host, threading.Lock())
+
+        # Satu host cuma diambil satu thread, thread lain nunggu hasilnya
+        with kunci_host:
+            with self._kunci:
+                entri = self._host.get(host)
+                if entri and entri[1] > time.monotonic():
+                    return entri[0]
+            parser = self._ambil(bagian.scheme or 'http', host)
+            with self._kunci:
+                self._host[host] = (parser, time.monotonic() + self.ttl)
+            return parser
+
+    def boleh_diambil(self, url):
+        return self.dapatkan(url).can_fetch(self.agen, url)
+
+    def sitemap(self, url):
+        return self.dapatkan(url).site_maps() or []
+
+robots = PenyimpananRobots()
+
+def _nama_tag(elemen):
+    return elemen.tag.rsplit('}', 1)[-1]
+
+def baca_sitemap(url_sitemap, maks_url=CRAWLING_KONFIGURASI['MAKS_URL_SITEMAP']):
+    # Generator URL dari sitemap.xml / sitemap index (juga .gz); XML dibaca bertahap, gak dibangun jadi pohon penuh
+    antrean = deque([url_sitemap])
+    terlihat = {url_sitemap}
+    jumlah = 0
+    while antrean:
+        url = antrean.popleft()
+        headers = HEADER.copy()
+        headers["User-Agent"] = random.choice(AGEN_PENGGUNA)
+        try:
+            penjadwal.tunggu(urlparse(url).netloc)
+            response = dapatkan_sesi().get(url, headers=headers, timeout=KINERJA_KONFIGURASI['TIMEOUT_PERMINTAAN'])
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logging.warning(f"Gagal mengambil sitemap {url}: {str(e)}")
+            continue
+
+        konten = response.content
+        if konten[:2] == b'\x1f\x8b':
+            konten = gzip.decompress(konten)
+        try:
+            for _, elemen in ET.iterparse(io.BytesIO(konten)):
+                nama = _nama_tag(elemen)
+                if nama in ('url', 'sitemap'):
+                    lokasi = next((anak.text.strip() for anak in elemen if _nama_tag(anak) == 'loc' and anak.text), None)
+                    if lokasi and nama == 'sitemap':
+                        if lokasi not in terlihat:
+                            terlihat.add(lokasi)
+                            antrean.append(lokasi)
+                    elif lokasi:
+                        yield lokasi
+                        jumlah += 1
+                        if maks_url and jumlah >= maks_url:
+                            return
+                    elemen.clear()
+        except ET.ParseError as e:
+            logging.warning(f"Sitemap {url} tidak valid: {str(e)}")
+
+def temukan_sitemap(url_dasar):
+    # Pakai sitemap yang diumumkan robots.txt, kalau gak ada coba /sitemap.xml
+    daftar = robots.sitemap(url_dasar) if CRAWLING_KONFIGURASI['HORMATI_ROBOTS_TXT'] else []
+    if not daftar:
+        bagian = urlparse(url_dasar)
+        daftar = [f"{bagian.scheme}://{bagian.netloc}/sitemap.xml"]
+    return daftar
+
+def url_sitemap_dalam_cakupan(url_dasar):
+    # URL sitemap yang sudah dinormalisasi dan lolos filter cakupan/kedalaman yang sama dengan penemuan tautan
+    awalan = normalisasi_url(url_dasar)
+    for url_sitemap in temukan_sitemap(url_dasar):
+        for url in baca_sitemap(url_sitemap):
+            try:
+                url = normalisasi_url(url)
+            except ValueError:
+                continue
+            if dalam_cakupan(url, awalan):
+                yield url
+
+JUMLAH_SLOT_MINHASH = 128
+_GESER_SLOT = JUMLAH_SLOT_MINHASH.bit_length() - 1
+
+def _hash_kata(kata):
+    return hashlib.blake2b(' '.join(kata).encode('utf-8'), digest_size=8).hexdigest()
+
+def sidik_konten(teks):
+    # Hash persis + tanda tangan MinHash (satu permutasi, 128 slot x 8 bit) dari shingle kata; teks pendek cuma
+    # dapat hash persis karena perkiraan kemiripannya gak stabil
+    kata = teks.lower().split()
+    hash_konten = _hash_kata(kata)
+    panjang = CRAWLING_KONFIGURASI['PANJANG_SHINGLE']
+    if len(kata) < CRAWLING_KONFIGURASI['MIN_KATA_MINHASH']:
+        return hash_konten, None
+    shingle = {' '.join(kata[i:i + panjang]) for i in range(len(kata) - panjang + 1)}
+    gabungan = b''.join(hashlib.blake2b(fitur.encode('utf-8'), digest_size=8).digest() for fitur in shingle)
+    # Bit bawah hash menentukan slot, sisanya nilai yang diminimumkan per slot
+    minimum = [None] * JUMLAH_SLOT_MINHASH
+    topeng = JUMLAH_SLOT_MINHASH - 1
+    for nilai in memoryview(gabungan).cast('Q'):
+        slot = nilai & topeng
+        if minimum[slot] is None or nilai < minimum[slot]:
+            minimum[slot] = nilai
+    # Slot kosong (halaman pendek) meminjam slot terisi berikutnya ditambah jaraknya, biar dua halaman mirip
+    # tetap kosong/terisi di tempat yang sama dan perkiraan Jaccard-nya gak bias
+    tanda = bytearray(JUMLAH_SLOT_MINHASH)
+    for slot in range(JUMLAH_SLOT_MINHASH):
+        jarak = 0
+        while minimum[(slot + jarak) % JUMLAH_SLOT_MINHASH] is None:
+            jarak += 1
+        tanda[slot] = ((minimum[(slot + jarak) % JUMLAH_SLOT_MINHASH] >> _GESER_SLOT) + jarak * 0x9E3779B1) & 0xFF
+    return hash_konten, tanda.hex()
+
+class IndeksDuplikat:
+    # Indeks sidik konten: lookup hash persis O(1), lalu LSH di atas tanda tangan MinHash: 16 pita x 8 slot. Halaman
+    # dengan Jaccard shingle >= ~0.8 hampir pasti berbagi satu pita, yang jauh di bawahnya jarang jadi kandidat.
+    # Kandidat baru dicek pakai perkiraan Jaccard dari semua slot (dikoreksi untuk tabrakan 8 bit).
+    JUMLAH_PITA = 16
+
+    def __init__(self, ambang=None):
+        self.ambang = CRAWLING_KONFIGURASI['AMBANG_KEMIRIPAN'] if ambang is None else ambang
+        self._persis = {}
+        self._pita = [{} for _ in range(self.JUMLAH_PITA)]
+
+    def _daftar_pita(self, tanda):
+        lebar = JUMLAH_SLOT_MINHASH // self.JUMLAH_PITA
+        return [tanda[lebar * i:lebar * (i + 1)] for i in range(self.JUMLAH_PITA)]
+
+    @staticmethod
+    def kemiripan(tanda_a, tanda_b):
+        sama = sum(map(eq, tanda_a, tanda_b)) / JUMLAH_SLOT_MINHASH
+        return max(0.0, (sama - 1 / 256) / (1 - 1 / 256))
+
+    def cari(self, hash_konten, minhash=None):
+        kanonik = self._persis.get(hash_konten)
+        if kanonik or minhash is None:
+            return kanonik
+        tanda = bytes.fromhex(minhash)
+        diperiksa = set()
+        for indeks, kunci in zip(self._pita, self._daftar_pita(tanda)):
+            for kandidat, url in indeks.get(kunci, ()):
+                if url in diperiksa:
+                    continue
+                diperiksa.add(url)
+                if self.kemiripan(kandidat, tanda) >= self.ambang:
+                    return url
+        return None
+
+    def tambah(self, url, hash_konten, minhash=None):
+        self._persis.setdefault(hash_konten, url)
+        if minhash is not None:
+            tanda = bytes.fromhex(minhash)
+            for indeks, kunci in zip(self._pita, self._daftar_pita(tanda)):
+                indeks.setdefault(kunci, []).append((tanda, url))
+
+    def periksa(self, url, hash_konten, minhash=None):
+        # Balikin URL kanonik kalau konten ini duplikat, kalau bukan didaftarkan sebagai kanonik baru
+        kanonik = self.cari(hash_konten, minhash)
+        if kanonik is None:
+            self.tambah(url, hash_konten, minhash)
+        return kanonik
+
+class _Kosong:
+    # Penanda field yang gak diisi (beda dari None, yang tetap nilai sah); di-pickle sebagai referensi global
+    def __repr__(self):
+        return '<kosong>'
+
+    def __reduce__(self):
+        return '_KOSONG'
+
+_KOSONG = _Kosong()
+
+@dataclass(slots=True, eq=False)
+class RekamanHalaman(MutableMapping):
+    # Rekaman hasil crawl yang ringkas: slot tetap (tanpa dict per objek), URL & judul di-intern. Tetap bisa diakses
+    # seperti dict (rekaman['url'], .get, dict(rekaman)) jadi penulis ekspor, database, dan checkpoint gak perlu berubah.
+    url: str = _KOSONG
+    judul: str = _KOSONG
+    elemen: dict = _KOSONG
+    statistik: dict = _KOSONG
+    analisis: dict = _KOSONG
+    tautan: list = _KOSONG
+    hash_konten: str = _KOSONG
+    minhash: str = _KOSONG
+    teks: str = _KOSONG
+    teknologi: dict = _KOSONG
+    duplikat_dari: str = _KOSONG
+    ditolak: str = _KOSONG
+    _teks: str = _KOSONG
+
+    def __post_init__(self):
+        # str() juga melepas NavigableString dari pohon soup-nya, biar dokumennya bisa dibebaskan
+        if isinstance(self.url, str):
+            self.url = sys.intern(str(self.url))
+        if isinstance(self.judul, str):
+            self.judul = sys.intern(str(self.judul))
+
+    @classmethod
+    def dari_dict(cls, data):
+        # Rekaman lama (checkpoint, crawl inkremental) yang punya kunci di luar skema dibiarkan tetap dict
+        if not set(data) <= NAMA_FIELD_REKAMAN:
+            return data
+        return cls(**data)
+
+    def __getitem__(self, kunci):
+        if kunci not in NAMA_FIELD_REKAMAN:
+            raise KeyError(kunci)
+        nilai = getattr(self, kunci)
+        if nilai is _KOSONG:
+            raise KeyError(kunci)
+        return nilai
+
+    def __setitem__(self, kunci, nilai):
+        if kunci not in NAMA_FIELD_REKAMAN:
+            raise KeyError(kunci)
+        setattr(self, kunci, nilai)
+
+    def __delitem__(self, kunci):
+        self[kunci]
+        setattr(self, kunci, _KOSONG)
+
+    def __iter__(self):
+        return (nama for nama in URUTAN_FIELD_REKAMAN if getattr(self, nama) is not _KOSONG)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __reduce__(self):
+        return (_rekaman_dari_dict, (dict(self),))
+
+    def __repr__(self):
+        return f"RekamanHalaman({dict(self)!r})"
+
+URUTAN_FIELD_REKAMAN = tuple(field.name for field in fields(RekamanHalaman))
+NAMA_FIELD_REKAMAN = frozenset(URUTAN_FIELD_REKAMAN)
+
+def _rekaman_dari_dict(data):
+    return RekamanHalaman(**data)
+
+def _ke_json(objek):
+    # default= untuk json.dumps: rekaman ringkas diserialisasi sebagai dict biasa
+    if isinstance(objek, Mapping):
+        return dict(objek)
+    raise TypeError(f"Objek {type(objek).__name__} tidak bisa diserialisasi ke JSON")
+
+def _proses_halaman(url, url_dasar, konten_html, waktu_muat=None, ukuran_konten=None, header=None):
+    with metrik.ukur('proses_halaman'):
+        return _urai_halaman(url, url_dasar, konten_html, waktu_muat, ukuran_konten, header)
+
+def _urai_halaman(url, url_dasar, konten_html, waktu_muat=None, ukuran_konten=None, header=None):
+    dokumen = dapatkan_dokumen(konten_html)
+    rekaman = RekamanHalaman(url=url, judul=dokumen.judul, elemen=dokumen.elemen)
+    if header is not None:
+        # Header cuma dikirim untuk host yang teknologinya belum terdeteksi (lihat _header_teknologi)
+        try:
+            with metrik.ukur('deteksi_teknologi'):
+                rekaman['teknologi'] = layanan_teknologi.deteksi_per_host(url, konten_html, header)
+        except Exception as e:
+            logging.error(f"Gagal mendeteksi teknologi {url}: {str(e)}")
+            layanan_teknologi.simpan_host(url, {})
+    if CRAWLING_KONFIGURASI['STATISTIK_HALAMAN']:
+        rekaman['statistik'] = {'waktu_muat': waktu_muat, 'ukuran_konten': ukuran_konten, 'jumlah_tag': dokumen.jumlah_tag,
+                                'jumlah_tautan': dokumen.jumlah_tautan, 'jumlah_gambar': dokumen.jumlah_gambar}
+    if CRAWLING_KONFIGURASI['DETEKSI_DUPLIKAT']:
+        with metrik.ukur('sidik_konten'):
+            rekaman['hash_konten'], rekaman['minhash'] = sidik_konten(dokumen.teks)
+    if ANALISIS_KONFIGURASI['SIMPAN_TEKS']:
+        rekaman['teks'] = dokumen.teks
+    if ANALISIS_KONFIGURASI['ANALISIS_SAAT_CRAWL']:
+        if CRAWLING_KONFIGURASI['DETEKSI_DUPLIKAT']:
+            # Analisis ditunda sampai halaman lolos cek duplikat (lihat KonteksCrawl.saring_duplikat)
+            rekaman['_teks'] = dokumen.teks
+        else:
+            rekaman['analisis'] = analisis_teks(dokumen.teks)
+    awalan = normalisasi_url(url_dasar)
+    tautan_absolut, tautan_baru = [], []
+    for href in dokumen.tautan:
+        try:
+            # Tautan relatif diselesaikan terhadap halaman tempat tautan itu ditemukan
+            url_absolut = urljoin(url, href)
+            url_lengkap = normalisasi_url(url_absolut)
+        except ValueError:
+            # href rusak (port di luar jangkauan, IPv6 gak ditutup, ...) dilewati saja, halamannya tetap diproses
+            continue
+        tautan_absolut.append(url_absolut)
+        if dalam_cakupan(url_lengkap, awalan):
+            tautan_baru.append(url_lengkap)
+    if DATABASE_KONFIGURASI['GUNAKAN_DATABASE'] and DATABASE_KONFIGURASI['SIMPAN_TAUTAN']:
+        rekaman['tautan'] = tautan_absolut
+    return rekaman, tautan_baru
+
+def _header_teknologi(url):
+    # Header respons yang sudah dipegang, untuk deteksi teknologi di langkah parsing; None kalau fiturnya mati atau
+    # host ini sudah terdeteksi
+    if not ANALISIS_KONFIGURASI['DETEKSI_TEKNOLOGI_SAAT_CRAWL'] or layanan_teknologi.hasil_host(url) is not None:
+        return None
+    return ambil_header_respons(url)
+
+def _proses_batch_halaman(batch):
+    # Dijalankan di proses pekerja: yang balik cuma dict dan daftar URL, pohon soup gak ikut di-pickle.
+    # Galat ditangkap per halaman, jadi satu halaman bermasalah gak menghanguskan seluruh batch.
+    hasil = []
+    for halaman in batch:
+        try:
+            hasil.append(_proses_halaman(*halaman))
+        except Exception as e:
+            logging.error(f"Gagal memproses {halaman[0]}: {str(e)}")
+            hasil.append((None, []))
+    return hasil
+
+
+def _bagi_batch(item, jumlah_bagian):
+    ukuran = max(1, math.ceil(len(item) / jumlah_bagian))
+    return [item[i:i + ukuran] for i in range(0, len(item), ukuran)]
+
+def _konfigurasi_proses():
+    # Dict konfigurasi yang dibaca kode di proses pekerja pool
+    return (KONFIGURASI, CRAWLING_KONFIGURASI, PARSING_KONFIGURASI, ANALISIS_KONFIGURASI, DATABASE_KONFIGURASI,
+            KINERJA_KONFIGURASI, VISUALISASI_KONFIGURASI)
+
+def _pasang_konfigurasi(salinan):
+    # Initializer pool: proses 'spawn' membaca ulang berkas *_config.py dari disk, jadi nilai yang diubah saat
+    # runtime (opsi CLI, benchmark, pekerja terdistribusi) ditimpakan ke dict modul di proses anak
+    global penjadwal
+    for tujuan, isi in zip(_konfigurasi_proses(), salinan):
+        tujuan.update(isi)
+    # Penjadwal dibuat dari konfigurasi saat modul diimpor; proses anak belum pernah meminta apa-apa, jadi aman diganti
+    penjadwal = PenjadwalDomain(KONFIGURASI['BATAS_PERMINTAAN'], CRAWLING_KONFIGURASI['JEDA_ANTAR_PERMINTAAN'],
+                                CRAWLING_KONFIGURASI['KAPASITAS_BURST_PER_HOST'])
+
+def buat_pool_proses(jumlah_proses=None):
+    # Pakai 'spawn' biar proses pekerja gak mewarisi lock yang lagi dipegang thread fetcher. Konfigurasi disalin
+    # sekarang juga, karena proses anak baru dibuat saat tugas pertama masuk.
+    return concurrent.futures.ProcessPoolExecutor(max_workers=jumlah_proses or KINERJA_KONFIGURASI['JUMLAH_PROSES'],
+                                                  mp_context=multiprocessing.get_context('spawn'),
+                                                  initializer=_pasang_konfigurasi,
+                                                  initargs=(tuple(dict(isi) for isi in _konfigurasi_proses()),))
+
+class PenyimpananStatusCrawl:
+    # Checkpoint crawl ke SQLite: URL yang ditemukan/selesai dan rekaman hasil, ditulis per batch dalam satu transaksi
+    def __init__(self, nama_crawl):
+        os.makedirs(CRAWLING_KONFIGURASI['DIREKTORI_CHECKPOINT'], exist_ok=True)
+        self.path = os.path.join(CRAWLING_KONFIGURASI['DIREKTORI_CHECKPOINT'], f"{nama_crawl}.db")
+        # Mesin asyncio memanggilnya dari thread pencatat; aksesnya tetap berurutan, gak pernah dari dua thread sekaligus
+        self._koneksi = sqlite3.connect(self.path, check_same_thread=False)
+        self._koneksi.execute('PRAGMA journal_mode=WAL')
+        self._koneksi.execute('CREATE TABLE IF NOT EXISTS meta (kunci TEXT PRIMARY KEY, nilai TEXT)')
+        self._koneksi.execute(
+            'CREATE TABLE IF NOT EXISTS url (url TEXT PRIMARY KEY, kedalaman INTEGER NOT NULL, selesai INTEGER NOT NULL)')
+        self._koneksi.execute('CREATE TABLE IF NOT EXISTS hasil (id INTEGER PRIMARY KEY AUTOINCREMENT, data TEXT NOT NULL)')
+        self._koneksi.commit()
+        self._ditemukan = []
+        self._selesai = []
+        self._rekaman = []
+
+    def baca_meta(self):
+        return {kunci: json.loads(nilai) for kunci, nilai in self._koneksi.execute('SELECT kunci, nilai FROM meta')}
+
+    def tulis_meta(self, **meta):
+        with self._koneksi:
+            self._koneksi.executemany('INSERT OR REPLACE INTO meta (kunci, nilai) VALUES (?, ?)',
+                                      [(kunci, json.dumps(nilai)) for kunci, nilai in meta.items()])
+
+    def baca_url(self):
+        return self._koneksi.execute('SELECT url, kedalaman, selesai FROM url')
+
+    def baca_hasil(self):
+        for (data,) in self._koneksi.execute('SELECT data FROM hasil ORDER BY id'):
+            yield RekamanHalaman.dari_dict(json.loads(data))
+
+    def catat_ditemukan(self, url, kedalaman):
+        self._ditemukan.append((url, kedalaman))
+
+    def catat_selesai(self, url, rekaman):
+        self._selesai.append((url,))
+        if rekaman:
+            self._rekaman.append((json.dumps(rekaman, ensure_ascii=False, default=_ke_json),))
+
+    def checkpoint(self, **meta):
+        with self._koneksi:
+            self._koneksi.executemany('INSERT OR IGNORE INTO url (url, kedalaman, selesai) VALUES (?, ?, 0)',
+                                      self._ditemukan)
+            self._koneksi.executemany('UPDATE url SET selesai = 1 WHERE url = ?', self._selesai)
+            self._koneksi.executemany('INSERT INTO hasil (data) VALUES (?)', self._rekaman)
+            self._koneksi.executemany('INSERT OR REPLACE INTO meta (kunci, nilai) VALUES (?, ?)',
+                                      [(kunci, json.dumps(nilai)) for kunci, nilai in meta.items()])
+        self._ditemukan.clear()
+        self._selesai.clear()
+        self._rekaman.clear()
+
+    def tutup(self):
+        self._koneksi.close()
+
+class PenyimpananInkremental:
+    # Status per URL untuk crawl ulang: validator HTTP, hash respons, rekaman & tautan terakhir, dan interval kunjung
+    # yang dipelajari dari seberapa sering halaman itu berubah
+    def __init__(self, path=CRAWLING_KONFIGURASI['FILE_INKREMENTAL']):
+        self.path = path
+        self._kunci = threading.Lock()
+        self._koneksi = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._koneksi.execute('PRAGMA journal_mode=WAL')
+        self._koneksi.execute('PRAGMA synchronous=NORMAL')
+        self._koneksi.execute("""
+            CREATE TABLE IF NOT EXISTS halaman (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                hash_respons TEXT,
+                dicek REAL NOT NULL,
+                diubah REAL NOT NULL,
+                interval REAL NOT NULL,
+                data BLOB
+            )
+        """)
+
+    def ambil(self, url):
+        with self._kunci:
+            baris = self._koneksi.execute(
+                'SELECT etag, last_modified, hash_respons, dicek, diubah, interval, data FROM halaman WHERE url = ?',
+                (url,)).fetchone()
+        if baris is None:
+            return None
+        etag, last_modified, hash_respons, dicek, diubah, interval, data = baris
+        rekaman, tautan = json.loads(zlib.decompress(data)) if data else (None, [])
+        if rekaman is not None:
+            rekaman = RekamanHalaman.dari_dict(rekaman)
+        return {'etag': etag, 'last_modified': last_modified, 'hash_respons': hash_respons, 'dicek': dicek,
+                'diubah': diubah, 'interval': interval, 'rekaman': rekaman, 'tautan': tautan}
+
+    def simpan(self, url, etag, last_modified, hash_respons, interval, rekaman, tautan):
+        # Dipanggil kalau halaman baru atau berubah
+        data = zlib.compress(json.dumps([rekaman, tautan], ensure_ascii=False, default=_ke_json).encode('utf-8'), 6)
+        sekarang = time.time()
+        with self._kunci:
+            self._koneksi.execute(
+                'INSERT OR REPLACE INTO halaman (url, etag, last_modified, hash_respons, dicek, diubah, interval, data) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (url, etag, last_modified, hash_respons, sekarang, sekarang, interval, data))
+
+    def tandai_tetap(self, url, interval):
+        with self._kunci:
+            self._koneksi.execute('UPDATE halaman SET dicek = ?, interval = ? WHERE url = ?',
+                                  (time.time(), interval, url))
+
+    def tutup(self):
+        with self._kunci:
+            self._koneksi.close()
+
+def _header_validator(entri):
+    validator = {}
+    if entri and entri['rekaman'] is not None:
+        if entri['etag']:
+            validator['If-None-Match'] = entri['etag']
+        if entri['last_modified']:
+            validator['If-Modified-Since'] = entri['last_modified']
+    return validator
+
+def _hash_respons(konten_html):
+    return hashlib.blake2b(konten_html.encode('utf-8', 'replace'), digest_size=16).hexdigest()
+
+class HalamanTetap:
+    # Hasil ambil untuk halaman yang gak berubah (belum waktunya dicek, 304, atau hash sama): pakai rekaman lama
+    def __init__(self, rekaman, tautan):
+        self.rekaman = rekaman
+        self.tautan = tautan
+
+class KonteksCrawl:
+    # Status satu kali crawl yang dipakai bareng mesin thread maupun asyncio
+    def __init__(self, url_dasar, maks_halaman, sink=None, nama_crawl=None,
+                 gunakan_sitemap=CRAWLING_KONFIGURASI['GUNAKAN_SITEMAP'],
+                 inkremental=CRAWLING_KONFIGURASI['CRAWL_INKREMENTAL'], hemat_memori=False):
+        self.url_dasar = url_dasar
+        self.maks_halaman = maks_halaman
+        self.sink = sink
+        self.hemat_memori = hemat_memori
+        self.jumlah_rekaman = 0
+        self.frontier = FrontierCrawl()
+        self.hasil = []
+        self.jumlah_diambil = 0
+        self.jumlah_ditolak_robots = 0
+        self.jumlah_duplikat = 0
+        self.jumlah_tidak_berubah = 0
+        self.inkremental = PenyimpananInkremental() if inkremental else None
+        self._validator_baru = {}
+        self.indeks_duplikat = IndeksDuplikat() if CRAWLING_KONFIGURASI['DETEKSI_DUPLIKAT'] else None
+        self.gunakan_multiprocessing = KINERJA_KONFIGURASI['GUNAKAN_MULTIPROCESSING']
+        self._sejak_checkpoint = 0
+        self.status = PenyimpananStatusCrawl(nama_crawl) if nama_crawl else None
+        self._mulai(gunakan_sitemap)
+
+    def _mulai(self, gunakan_sitemap):
+        # Isi antrean awal: dari checkpoint kalau crawl ini dilanjutkan, kalau gak dari URL dasar (dan sitemap)
+        if CRAWLING_KONFIGURASI['HORMATI_ROBOTS_TXT']:
+            # robots.txt host utama diambil di depan, jadi gak sampai nahan event loop di tengah crawl
+            robots.dapatkan(self.url_dasar)
+
+        if self.status and self.status.baca_meta():
+            self._pulihkan()
+        else:
+            if self.status:
+                self.status.tulis_meta(url_dasar=self.url_dasar, maks_halaman=self.maks_halaman, jumlah_diambil=0)
+            self.tambah_url(self.url_dasar, 0)
+            if gunakan_sitemap:
+                self.isi_dari_sitemap()
+
+    def isi_dari_sitemap(self):
+        # Berhenti begitu antrean sudah memuat maks_halaman URL; sisa sitemap gak perlu dibaca atau dicek robots-nya
+        jumlah = 0
+        for url in url_sitemap_dalam_cakupan(self.url_dasar):
+            if len(self.frontier) >= self.maks_halaman:
+                break
+            if self.tambah_url(url, 1):
+                jumlah += 1
+        logging.info(f"{jumlah} URL dari sitemap masuk antrean {self.url_dasar}")
+
+    def _pulihkan(self):
+        for url, kedalaman, selesai in self.status.baca_url():
+            if selesai:
+                self.frontier.tandai_terlihat(url)
+                self.jumlah_diambil += 1
+            else:
+                self.frontier.tambah(url, kedalaman)
+        for rekaman in self.status.baca_hasil():
+            self.jumlah_rekaman += 1
+            if not self.hemat_memori:
+                self.hasil.append(rekaman)
+            if self.indeks_duplikat is not None and rekaman.get('hash_konten'):
+                self.indeks_duplikat.tambah(rekaman['url'], rekaman['hash_konten'], rekaman.get('minhash'))
+            if self.sink:
+                self.sink(rekaman)
+        if not self.jumlah_diambil and not self.frontier:
+            self.tambah_url(self.url_dasar, 0)
+        logging.info(f"Melanjutkan crawl {self.url_dasar}: {self.jumlah_diambil} halaman selesai, "
+                     f"{len(self.frontier)} URL di antrean")
+
+    def tambah_url(self, url, kedalaman):
+        if CRAWLING_KONFIGURASI['HORMATI_ROBOTS_TXT'] and not robots.boleh_diambil(url):
+            # URL terlarang langsung dibuang sebelum ada permintaan, dan ditandai biar gak dicek ulang
+            self.frontier.tandai_terlihat(url)
+            self.jumlah_ditolak_robots += 1
+            metrik.tambah('ditolak_robots')
+            return None
+        url = self.frontier.tambah(url, kedalaman)
+        if url and self.status:
+            self.status.catat_ditemukan(url, kedalaman)
+        return url
+
+    def bisa_ambil(self):
+        return bool(self.frontier) and self.jumlah_diambil < self.maks_halaman
+
+    def dasar_untuk(self, url):
+        # URL dasar yang membatasi tautan internal halaman ini
+        return self.url_dasar
+
+    def ambil_url(self):
+        self.jumlah_diambil += 1
+        return self.frontier.ambil()
+
+    def ambil_halaman(self, url):
+        # Dipanggil di thread pekerja; di mode inkremental bisa balikin HalamanTetap tanpa parsing ulang
+        if self.inkremental is None:
+            return ambil_kode_sumber(url)
+        entri = self.inkremental.ambil(url)
+        tetap = self._cek_jadwal(url, entri)
+        if tetap:
+            return tetap
+        hasil, header = _unduh(url, _header_validator(entri))
+        if hasil is not None:
+            _tulis_cache(url, hasil, header)
+        return self._bandingkan(url, entri, hasil, header)
+
+    async def ambil_halaman_async(self, sesi, url, pool_cpu):
+        if self.inkremental is None:
+            return await ambil_kode_sumber_async(sesi, url, pool_cpu)
+        loop = asyncio.get_running_loop()
+        entri = await loop.run_in_executor(pool_cpu, self.inkremental.ambil, url)
+        tetap = self._cek_jadwal(url, entri)
+        if tetap:
+            return tetap
+        hasil = await ambil_kode_sumber_async(sesi, url, pool_cpu, gunakan_cache=False,
+                                              validator=_header_validator(entri))
+        header = ambil_header_respons(url)
+        if hasil is not None:
+            await loop.run_in_executor(pool_cpu, _tulis_cache, url, hasil, header)
+        return await loop.run_in_executor(pool_cpu, self._bandingkan, url, entri, hasil, header)
+
+    def _cek_jadwal(self, url, entri):
+        # Halaman yang belum lewat interval kunjungnya gak perlu diminta sama sekali
+        if entri and entri['rekaman'] is not None and time.time() < entri['dicek'] + entri['interval']:
+            return HalamanTetap(entri['rekaman'], entri['tautan'])
+        return None
+
+    def _bandingkan(self, url, entri, hasil, header):
+        header = {kunci.lower(): nilai for kunci, nilai in (header or {}).items()}
+        if hasil is None or (entri and entri['rekaman'] is not None and
+                             entri['hash_respons'] == _hash_respons(hasil[0])):
+            # 304 atau isi persis sama: interval kunjung diperpanjang
+            interval = min(entri['interval'] * 1.5, CRAWLING_KONFIGURASI['INTERVAL_KUNJUNG_MAKS'])
+            self.inkremental.tandai_tetap(url, interval)
+            return HalamanTetap(entri['rekaman'], entri['tautan'])
+
+        if entri:
+            interval = max(entri['interval'] * 0.5, CRAWLING_KONFIGURASI['INTERVAL_KUNJUNG_MIN'])
+        else:
+            interval = CRAWLING_KONFIGURASI['INTERVAL_KUNJUNG_AWAL']
+        # Disimpan setelah halaman selesai diproses (lihat catat_halaman)
+        self._validator_baru[url] = (header.get('etag'), header.get('last-modified'), _hash_respons(hasil[0]), interval)
+        return hasil
+
+    def catat_tetap(self, url, kedalaman, tetap):
+        self.jumlah_tidak_berubah += 1
+        metrik.tambah('halaman_tidak_berubah')
+        rekaman = tetap.rekaman
+        if self.indeks_duplikat is not None and rekaman and rekaman.get('hash_konten'):
+            self.indeks_duplikat.tambah(rekaman['url'], rekaman['hash_konten'], rekaman.get('minhash'))
+        self.catat_halaman(url, kedalaman, rekaman, tetap.tautan)
+
+    def saring_duplikat(self, rekaman, tautan_baru):
+        # Balikin (rekaman, tautan_baru, teks_untuk_analisis); duplikat jadi rekaman rujukan tanpa tautan & analisis
+        if not rekaman:
+            return rekaman, tautan_baru, None
+        teks = rekaman.pop('_teks', None)
+        if self.indeks_duplikat is None or 'hash_konten' not in rekaman:
+            return rekaman, tautan_baru, teks
+        kanonik = self.indeks_duplikat.periksa(rekaman['url'], rekaman['hash_konten'], rekaman['minhash'])
+        if kanonik is None:
+            return rekaman, tautan_baru, teks
+        self.jumlah_duplikat += 1
+        metrik.tambah('halaman_duplikat')
+        return RekamanHalaman(url=rekaman['url'], duplikat_dari=kanonik), [], None
+
+    def catat_halaman(self, url, kedalaman, rekaman, tautan_baru):
+        metrik.tambah('halaman_selesai')
+        validator = self._validator_baru.pop(url, None)
+        if validator and rekaman:
+            self.inkremental.simpan(url, *validator, rekaman, tautan_baru)
+        if rekaman:
+            if rekaman.get('teknologi') is not None:
+                # Dari pool proses hasil deteksinya baru sampai lewat rekaman; dicatat biar host ini gak dideteksi lagi
+                layanan_teknologi.simpan_host(url, rekaman['teknologi'])
+            self.jumlah_rekaman += 1
+            if not self.hemat_memori:
+                self.hasil.append(rekaman)
+            if self.sink:
+                self.sink(rekaman)
+            simpan_ke_database(rekaman)
+        for url_lengkap in tautan_baru:
+            self.tambah_url(url_lengkap, kedalaman + 1)
+
+        if self.status:
+            self.status.catat_selesai(url, rekaman)
+            self._sejak_checkpoint += 1
+            if self._sejak_checkpoint >= CRAWLING_KONFIGURASI['INTERVAL_CHECKPOINT']:
+                self.status.checkpoint(jumlah_diambil=self.jumlah_diambil)
+                self._sejak_checkpoint = 0
+
+    def selesai(self):
+        if self.inkremental:
+            self.inkremental.tutup()
+        if self.status:
+            self.status.checkpoint(jumlah_diambil=self.jumlah_diambil)
+            self.status.tutup()
+
+async def _jelajahi_async(konteks, progress, task):
+    import aiohttp
+
+    loop = asyncio.get_running_loop()
+    konkurensi = KINERJA_KONFIGURASI['MAKS_KONKURENSI']
+
+    timeout = aiohttp.ClientTimeout(total=KINERJA_KONFIGURASI['TIMEOUT_PERMINTAAN'])
+    connector = aiohttp.TCPConnector(limit=konkurensi, limit_per_host=KINERJA_KONFIGURASI['UKURAN_POOL_PER_HOST'],
+                                     ssl=None if KEAMANAN_KONFIGURASI['VERIFIKASI_SSL'] else False)
+
+    # Parsing jalan di thread pool (atau pool proses kalau GUNAKAN_MULTIPROCESSING) biar event loop tetap bebas buat I/O.
+    # Pembukuan konteks (robots.txt, checkpoint SQLite, sink/database, sewa frontier bersama) bisa blocking, jadi
+    # dijalankan berurutan di satu thread pencatat; loop cuma menunggunya, fetch yang lain tetap jalan.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=konkurensi) as pool_cpu, \
+            concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='pencatat-crawl') as pencatat, \
+            (buat_pool_proses() if konteks.gunakan_multiprocessing else contextlib.nullcontext(pool_cpu)) as pool_proses:
+        async with aiohttp.ClientSession(timeout=timeout, connector=connector,
+                                         trace_configs=[_buat_trace_metrik()]) as sesi:
+            # Seperti mesin thread: unduhan dikumpulkan lalu dikirim per UKURAN_CHUNK, jadi pool proses cuma kena satu
+            # pickle/IPC per batch. Tanpa multiprocessing tiap halaman langsung diurai di thread pool.
+            if pool_proses is pool_cpu:
+                ukuran_chunk, jumlah_bagian = 1, konkurensi
+            else:
+                ukuran_chunk, jumlah_bagian = KINERJA_KONFIGURASI['UKURAN_CHUNK'], KINERJA_KONFIGURASI['JUMLAH_PROSES']
+
+            async def ambil(url):
+                try:
+                    return await konteks.ambil_halaman_async(sesi, url, pool_cpu)
+                except KontenDitolak as e:
+                    return RekamanHalaman(url=url, ditolak=e.alasan)
+
+            async def jalankan_di_pool(fungsi, *argumen):
+                hasil, mentah = await loop.run_in_executor(pool_proses, _jalankan_terukur, fungsi, *argumen)
+                metrik.gabung(mentah)
+                return hasil
+
+            def ambil_antrean(jumlah):
+                # Di thread pencatat: bisa_ambil bisa mengambil robots.txt atau menyewa dari frontier bersama
+                daftar = []
+                while len(daftar) < jumlah and konteks.bisa_ambil():
+                    daftar.append(konteks.ambil_url())
+                return daftar, konteks.bisa_ambil()
+
+            def catat_semua(daftar):
+                for catat, *argumen in daftar:
+                    catat(*argumen)
+
+            def selesaikan(url, kedalaman, rekaman, tautan_baru):
+                antre_catat.append((konteks.catat_halaman, url, kedalaman, rekaman, tautan_baru))
+
+            def setelah_urai(url, kedalaman, rekaman, tautan_baru):
+                # Cek duplikat dulu (cuma indeks di memori); halaman kanonik lanjut dianalisis
+                rekaman, tautan_baru, teks = konteks.saring_duplikat(rekaman, tautan_baru)
+                if teks is None:
+                    selesaikan(url, kedalaman, rekaman, tautan_baru)
+                else:
+                    berjalan[asyncio.ensure_future(jalankan_di_pool(analisis_teks, teks))] = (
+                        'analisis', (url, kedalaman, rekaman, tautan_baru))
+
+            berjalan = {}
+            penampung = []
+            while True:
+                jumlah_ambil = sum(1 for jenis, _ in berjalan.values() if jenis == 'ambil')
+                baru, masih_ada = await loop.run_in_executor(pencatat, ambil_antrean, konkurensi - jumlah_ambil)
+                for url, kedalaman in baru:
+                    berjalan[asyncio.ensure_future(ambil(url))] = ('ambil', (url, kedalaman))
+                jumlah_ambil += len(baru)
+
+                # Halaman dikumpulkan sampai ukuran_chunk, atau dikirim lebih cepat kalau frontier butuh tautan baru
+                if penampung and (len(penampung) >= ukuran_chunk or not masih_ada or not jumlah_ambil):
+                    for batch in _bagi_batch(penampung, jumlah_bagian):
+                        tugas_batch = jalankan_di_pool(_proses_batch_halaman,
+                                                       [(url, konteks.dasar_untuk(url), *unduhan, _header_teknologi(url))
+                                                        for url, _, unduhan in batch])
+                        berjalan[asyncio.ensure_future(tugas_batch)] = ('proses', [(url, kedalaman)
+                                                                                   for url, kedalaman, _ in batch])
+                    penampung = []
+                if not berjalan:
+                    break
+
+                selesai, _ = await asyncio.wait(berjalan, return_when=asyncio.FIRST_COMPLETED)
+                antre_catat = []
+                for tugas in selesai:
+                    jenis, data = berjalan.pop(tugas)
+                    if jenis == 'proses':
+                        try:
+                            hasil_batch = tugas.result()
+                        except Exception as e:
+                            console.print(f"[bold red]Kesalahan memproses batch halaman: {str(e)}[/bold red]")
+                            hasil_batch = [(None, [])] * len(data)
+                        for (url, kedalaman), (rekaman, tautan_baru) in zip(data, hasil_batch):
+                            setelah_urai(url, kedalaman, rekaman, tautan_baru)
+                        continue
+                    if jenis == 'analisis':
+                        url, kedalaman, rekaman, tautan_baru = data
+                        try:
+                            rekaman['analisis'] = tugas.result()
+                        except Exception as e:
+                            console.print(f"[bold red]Kesalahan menganalisis {url}: {str(e)}[/bold red]")
+                        selesaikan(url, kedalaman, rekaman, tautan_baru)
+                        continue
+
+                    url, kedalaman = data
+                    try:
+                        hasil = tugas.result()
+                    except Exception as e:
+                        console.print(f"[bold red]Kesalahan menjelajahi {url}: {str(e)}[/bold red]")
+                        hasil = None
+                    if isinstance(hasil, HalamanTetap):
+                        antre_catat.append((konteks.catat_tetap, url, kedalaman, hasil))
+                    elif isinstance(hasil, RekamanHalaman):
+                        # Konten ditolak: dicatat sebagai rekaman dengan alasannya, tanpa tautan
+                        selesaikan(url, kedalaman, hasil, [])
+                    elif not hasil or not hasil[0]:
+                        selesaikan(url, kedalaman, None, [])
+                    else:
+                        penampung.append((url, kedalaman, hasil[:3]))
+                if antre_catat:
+                    await loop.run_in_executor(pencatat, catat_semua, antre_catat)
+                    progress.update(task, advance=len(antre_catat), statistik=metrik.baris_status())
+
+def _jelajahi_thread(konteks, progress, task):
+    konkurensi = KINERJA_KONFIGURASI['MAKS_KONKURENSI']
+    pool_proses = buat_pool_proses() if konteks.gunakan_multiprocessing else None
+    ukuran_chunk = KINERJA_KONFIGURASI['UKURAN_CHUNK']
+
+    def selesaikan(url, kedalaman, rekaman, tautan_baru):
+        konteks.catat_halaman(url, kedalaman, rekaman, tautan_baru)
+        progress.update(task, advance=1, statistik=metrik.baris_status())
+
+    def setelah_urai(url, kedalaman, rekaman, tautan_baru):
+        # Cek duplikat dulu; cuma halaman kanonik yang lanjut dianalisis
+        rekaman, tautan_baru, teks = konteks.saring_duplikat(rekaman, tautan_baru)
+        if teks is None:
+            selesaikan(url, kedalaman, rekaman, tautan_baru)
+        elif pool_proses:
+            berjalan[pool_proses.submit(_jalankan_terukur, analisis_teks, teks)] = ('analisis', (url, kedalaman, rekaman,
+                                                                                              tautan_baru))
+        else:
+            rekaman['analisis'] = analisis_teks(teks)
+            selesaikan(url, kedalaman, rekaman, tautan_baru)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=konkurensi) as executor:
+        # Jeda antar permintaan diatur penjadwal per host, jadi di sini cukup jaga beberapa permintaan tetap jalan
+        berjalan = {}
+        penampung = []
+        try:
+            while True:
+                jumlah_ambil = sum(1 for jenis, _ in berjalan.values() if jenis == 'ambil')
+                while konteks.bisa_ambil() and jumlah_ambil < konkurensi:
+                    url, kedalaman = konteks.ambil_url()
+                    berjalan[executor.submit(konteks.ambil_halaman, url)] = ('ambil', (url, kedalaman))
+                    jumlah_ambil += 1
+
+                # Halaman dikumpulkan sampai UKURAN_CHUNK, atau dikirim lebih cepat kalau frontier butuh tautan baru
+                if penampung and (len(penampung) >= ukuran_chunk or not konteks.bisa_ambil() or not jumlah_ambil):
+                    for batch in _bagi_batch(penampung, KINERJA_KONFIGURASI['JUMLAH_PROSES']):
+                        future = pool_proses.submit(_jalankan_terukur, _proses_batch_halaman,
+                                                    [(url, konteks.dasar_untuk(url), *unduhan, _header_teknologi(url))
+                                                     for url, _, unduhan in batch])
+                        berjalan[future] = ('proses', [(url, kedalaman) for url, kedalaman, _ in batch])
+                    penampung = []
+                if not berjalan:
+                    break
+
+                selesai, _ = concurrent.futures.wait(berjalan, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in selesai:
+                    jenis, data = berjalan.pop(future)
+                    if jenis == 'proses':
+                        try:
+                            hasil_batch, mentah = future.result()
+                            metrik.gabung(mentah)
+                        except Exception as e:
+                            console.print(f"[bold red]Kesalahan memproses batch halaman: {str(e)}[/bold red]")
+                            hasil_batch = [(None, [])] * len(data)
+                        for (url, kedalaman), (rekaman, tautan_baru) in zip(data, hasil_batch):
+                            setelah_urai(url, kedalaman, rekaman, tautan_baru)
+                        continue
+                    if jenis == 'analisis':
+                        url, kedalaman, rekaman, tautan_baru = data
+                        try:
+                            rekaman['analisis'], mentah = future.result()
+                            metrik.gabung(mentah)
+                        except Exception as e:
+                            console.print(f"[bold red]Kesalahan menganalisis {url}: {str(e)}[/bold red]")
+                        selesaikan(url, kedalaman, rekaman, tautan_baru)
+                        continue
+
+                    url, kedalaman = data
+                    try:
+                        hasil = future.result()
+                    except KontenDitolak as e:
+                        # Dicatat sebagai rekaman dengan alasannya, tanpa tautan
+                        selesaikan(url, kedalaman, RekamanHalaman(url=url, ditolak=e.alasan), [])
+                        continue
+                    except Exception as e:
+                        console.print(f"[bold red]Kesalahan menjelajahi {url}: {str(e)}[/bold red]")
+                        hasil = (None, 0, 0, 0)
+                    if isinstance(hasil, HalamanTetap):
+                        konteks.catat_tetap(url, kedalaman, hasil)
+                        progress.update(task, advance=1, statistik=metrik.baris_status())
+                        continue
+                    konten_html = hasil[0]
+                    if not konten_html:
+                        selesaikan(url, kedalaman, None, [])
+                    elif pool_proses:
+                        penampung.append((url, kedalaman, hasil[:3]))
+                    else:
+                        try:
+                            rekaman, tautan_baru = _proses_halaman(url, konteks.dasar_untuk(url), *hasil[:3],
+                                                                   _header_teknologi(url))
+                        except Exception as e:
+                            console.print(f"[bold red]Kesalahan menjelajahi {url}: {str(e)}[/bold red]")
+                            rekaman, tautan_baru = None, []
+                        setelah_urai(url, kedalaman, rekaman, tautan_baru)
+        finally:
+            if pool_proses:
+                pool_proses.shutdown(cancel_futures=True)
+
+def jelajahi_tautan_internal(url_dasar, maks_halaman=CRAWLING_KONFIGURASI['MAKS_HALAMAN_PER_DOMAIN'], sink=None,
+                             nama_crawl=None, gunakan_sitemap=CRAWLING_KONFIGURASI['GUNAKAN_SITEMAP'],
+                             inkremental=CRAWLING_KONFIGURASI['CRAWL_INKREMENTAL'],
+                             hemat_memori=CRAWLING_KONFIGURASI['HEMAT_MEMORI']):
+    # sink: callable opsional yang dipanggil untuk tiap rekaman begitu halaman selesai diproses
+    # nama_crawl: kalau diisi, status crawl di-checkpoint ke disk dan bisa dilanjutkan lewat lanjutkan_jelajah
+    # gunakan_sitemap: antrean awal diisi dari sitemap.xml, jadi halaman hub gak perlu diambil satu-satu
+    # inkremental: pakai permintaan kondisional & hasil crawl sebelumnya, halaman yang gak berubah gak diproses ulang
+    # hemat_memori: rekaman cuma dikirim ke sink, gak dikumpulkan; yang dibalikin list kosong
+    if hemat_memori and sink is None:
+        raise ValueError("Mode hemat memori butuh sink, atau pakai jelajahi_bertahap")
+    # Metrik dihitung per crawl; laporan JSON-nya ditulis ke FILE_LAPORAN_METRIK begitu crawl selesai
+    metrik.reset()
+    jalankan_server_metrik()
+    konteks = KonteksCrawl(url_dasar, maks_halaman, sink, nama_crawl, gunakan_sitemap, inkremental, hemat_memori)
+
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+        TextColumn("{task.fields[statistik]}"),
+    ) as progress:
+        task = progress.add_task("[cyan]Menjelajahi tautan internal...", total=maks_halaman,
+                                 completed=konteks.jumlah_diambil, statistik='')
+
+        try:
+            if KINERJA_KONFIGURASI['GUNAKAN_ASYNCIO']:
+                asyncio.run(_jelajahi_async(konteks, progress, task))
+            else:
+                _jelajahi_thread(konteks, progress, task)
+        finally:
+            konteks.selesai()
+
+    logging.info(f"Statistik koneksi setelah menjelajahi {url_dasar}: {statistik_koneksi()}")
+    if konteks.jumlah_ditolak_robots:
+        logging.info(f"{konteks.jumlah_ditolak_robots} URL dilewati karena robots.txt")
+    if konteks.jumlah_tidak_berubah:
+        logging.info(f"{konteks.jumlah_tidak_berubah} halaman tidak berubah sejak crawl sebelumnya, gak diproses ulang")
+    if konteks.jumlah_duplikat:
+        logging.info(f"{konteks.jumlah_duplikat} halaman duplikat disimpan sebagai rujukan ke halaman kanonik")
+    if KINERJA_KONFIGURASI['FILE_LAPORAN_METRIK']:
+        metrik.tulis_laporan(KINERJA_KONFIGURASI['FILE_LAPORAN_METRIK'], url_dasar=url_dasar,
+                             jumlah_halaman=konteks.jumlah_diambil, koneksi=statistik_koneksi())
+    return konteks.hasil
+
+def jelajahi_bertahap(url_dasar, maks_halaman=CRAWLING_KONFIGURASI['MAKS_HALAMAN_PER_DOMAIN'], **opsi):
+    # Generator: rekaman di-yield begitu halaman selesai, crawl jalan di thread latar. Antrean dibatasi, jadi kalau
+    # pemakai generator lambat, crawler ikut ditahan dan memori tetap kecil.
+    antrean = queue.Queue(maxsize=CRAWLING_KONFIGURASI['UKURAN_ANTREAN_BERTAHAP'])
+    selesai = object()
+    berhenti = threading.Event()
+    galat = []
+
+    def kirim(rekaman):
+        # Kalau generator ditinggal (break), crawl dihentikan lewat exception dari sink
+        while not berhenti.is_set():
+            try:
+                antrean.put(rekaman, timeout=0.2)
+                return
+            except queue.Full:
+                pass
+        raise InterruptedError("Generator crawl ditutup")
+
+    def jalankan():
+        try:
+            jelajahi_tautan_internal(url_dasar, maks_halaman, sink=kirim, hemat_memori=True, **opsi)
+        except BaseException as e:
+            galat.append(e)
+        finally:
+            antrean.put(selesai)
+
+    thread = threading.Thread(target=jalankan, name='crawl-bertahap', daemon=True)
+    thread.start()
+    try:
+        while True:
+            rekaman = antrean.get()
+            if rekaman is selesai:
+                break
+            yield rekaman
+    finally:
+        if thread.is_alive():
+            berhenti.set()
+            while thread.is_alive():
+                try:
+                    antrean.get(timeout=0.2)
+                except queue.Empty:
+                    pass
+        thread.join()
+    if galat:
+        raise galat[0]
+
+def lanjutkan_jelajah(nama_crawl, sink=None, hemat_memori=CRAWLING_KONFIGURASI['HEMAT_MEMORI']):
+    status = PenyimpananStatusCrawl(nama_crawl)
+    meta = status.baca_meta()
+    status.tutup()
+    if not meta:
+        raise Exception(f"Crawl '{nama_crawl}' tidak ditemukan")
+    return jelajahi_tautan_internal(meta['url_dasar'], meta['maks_halaman'], sink=sink, nama_crawl=nama_crawl,
+                                    hemat_memori=hemat_memori)
+
+class FrontierBersama:
+    # Frontier & himpunan "sudah terlihat" yang dipakai bareng koordinator dan semua pekerja lewat satu berkas SQLite.
+    # URL dibagi ke partisi berdasarkan hash host. Pekerja menyewa satu partisi sekaligus sekumpulan URL-nya dengan batas
+    # waktu: satu host cuma diambil satu pekerja (jeda per host tetap terjaga), dan URL milik pekerja yang mati balik ke
+    # antrean begitu sewanya habis.
+    ANTRE, DISEWA, SELESAI, GAGAL, DILEWATI = range(5)
+    NAMA_STATUS = ('antre', 'disewa', 'selesai', 'gagal', 'dilewati')
+
+    def __init__(self, path=CRAWLING_KONFIGURASI['FILE_FRONTIER_BERSAMA'],
+                 jumlah_partisi=CRAWLING_KONFIGURASI['JUMLAH_PARTISI']):
+        self.path = path
+        self.timeout_sewa = CRAWLING_KONFIGURASI['TIMEOUT_SEWA']
+        # check_same_thread=False: pekerja asyncio menyewa lewat thread pencatat, tapi tetap satu panggilan dalam satu waktu
+        self._koneksi = sqlite3.connect(path, timeout=60, check_same_thread=False, isolation_level=None)
+        self._koneksi.execute('PRAGMA journal_mode=WAL')
+        self._koneksi.execute('PRAGMA synchronous=NORMAL')
+        with self._transaksi() as koneksi:
+            koneksi.execute('CREATE TABLE IF NOT EXISTS meta (kunci TEXT PRIMARY KEY, nilai TEXT)')
+            koneksi.execute('CREATE TABLE IF NOT EXISTS dasar (url_dasar TEXT PRIMARY KEY, maks INTEGER NOT NULL, '
+                            'diambil INTEGER NOT NULL DEFAULT 0)')
+            koneksi.execute('CREATE TABLE IF NOT EXISTS partisi (partisi INTEGER PRIMARY KEY, pekerja TEXT, batas_sewa REAL)')
+            koneksi.execute("""
+                CREATE TABLE IF NOT EXISTS url (
+                    url TEXT PRIMARY KEY,
+                    url_dasar TEXT NOT NULL,
+                    partisi INTEGER NOT NULL,
+                    kedalaman INTEGER NOT NULL,
+                    status INTEGER NOT NULL,
+                    pekerja TEXT,
+                    batas_sewa REAL,
+                    percobaan INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            koneksi.execute('CREATE INDEX IF NOT EXISTS url_partisi ON url (partisi, status)')
+            koneksi.execute('CREATE INDEX IF NOT EXISTS url_status ON url (status)')
+            koneksi.execute('CREATE TABLE IF NOT EXISTS hasil (id INTEGER PRIMARY KEY AUTOINCREMENT, data TEXT NOT NULL)')
+            # Jadwal jeda per host (epoch), biar pekerja yang mewarisi partisi tetap menghormati jeda pekerja sebelumnya
+            koneksi.execute('CREATE TABLE IF NOT EXISTS host (host TEXT PRIMARY KEY, boleh_setelah REAL NOT NULL)')
+            # Jumlah partisi dikunci saat frontier dibuat, biar semua node membagi host dengan cara yang sama
+            baris = koneksi.execute("SELECT nilai FROM meta WHERE kunci = 'jumlah_partisi'").fetchone()
+            if baris is None:
+                koneksi.execute("INSERT INTO meta (kunci, nilai) VALUES ('jumlah_partisi', ?)", (str(jumlah_partisi),))
+                koneksi.executemany('INSERT INTO partisi (partisi) VALUES (?)', [(i,) for i in range(jumlah_partisi)])
+            else:
+                jumlah_partisi = int(baris[0])
+        self.jumlah_partisi = jumlah_partisi
+
+    @contextlib.contextmanager
+    def _transaksi(self):
+        # BEGIN IMMEDIATE: kunci tulis diambil di depan, jadi dua pekerja gak bisa menyewa URL yang sama
+        self._koneksi.execute('BEGIN IMMEDIATE')
+        try:
+            yield self._koneksi
+        except BaseException:
+            self._koneksi.execute('ROLLBACK')
+            raise
+        self._koneksi.execute('COMMIT')
+
+    def partisi_untuk(self, url):
+        return zlib.crc32(urlparse(url).netloc.encode('utf-8')) % self.jumlah_partisi
+
+    def tambah_dasar(self, url_dasar, maks_halaman):
+        # Balikin True kalau URL dasar baru didaftarkan (False kalau frontier ini sedang dilanjutkan)
+        url_dasar = normalisasi_url(url_dasar)
+        with self._transaksi() as koneksi:
+            baru = koneksi.execute('INSERT OR IGNORE INTO dasar (url_dasar, maks) VALUES (?, ?)',
+                                   (url_dasar, maks_halaman)).rowcount
+            self._tambah(koneksi, [(url_dasar, url_dasar, 0)])
+        return bool(baru)
+
+    def tambah(self, daftar):
+        # daftar: (url, url_dasar, kedalaman); URL yang sudah pernah terlihat diabaikan
+        with self._transaksi() as koneksi:
+            self._tambah(koneksi, daftar)
+
+    def _tambah(self, koneksi, daftar):
+        # URL dasar yang kuotanya sudah habis langsung ditandai dilewati, gak perlu ikut disewa
+        koneksi.executemany(
+            'INSERT OR IGNORE INTO url (url, url_dasar, partisi, kedalaman, status) '
+            'SELECT ?, url_dasar, ?, ?, CASE WHEN diambil < maks THEN ? ELSE ? END FROM dasar WHERE url_dasar = ?',
+            [(url, self.partisi_untuk(url), kedalaman, self.ANTRE, self.DILEWATI, url_dasar)
+             for url, url_dasar, kedalaman in daftar])
+
+    def sewa(self, pekerja, jumlah=CRAWLING_KONFIGURASI['UKURAN_SEWA']):
+        # Balikin daftar (url, url_dasar, kedalaman) dari satu partisi. Partisi yang belum dipegang didahulukan biar
+        # pekerja menggarap beberapa host sekaligus; partisi yang sudah gak punya URL disewa pekerja ini dilepas.
+        sekarang = time.time()
+        batas = sekarang + self.timeout_sewa
+        with self._transaksi() as koneksi:
+            koneksi.execute(
+                'UPDATE partisi SET pekerja = NULL WHERE pekerja = ? AND NOT EXISTS (SELECT 1 FROM url WHERE '
+                'url.partisi = partisi.partisi AND url.status = ? AND url.pekerja = ?)',
+                (pekerja, self.DISEWA, pekerja))
+            milik = [partisi for (partisi,) in koneksi.execute(
+                'SELECT partisi FROM partisi WHERE pekerja = ? AND batas_sewa >= ?', (pekerja, sekarang))]
+            bebas = [partisi for (partisi,) in koneksi.execute(
+                'SELECT partisi FROM partisi WHERE pekerja IS NULL OR batas_sewa < ? ORDER BY random()', (sekarang,))]
+            for partisi in bebas + milik:
+                disewa = self._sewa_partisi(koneksi, partisi, pekerja, jumlah, sekarang, batas)
+                if disewa:
+                    koneksi.execute('UPDATE partisi SET pekerja = ?, batas_sewa = ? WHERE partisi = ?',
+                                    (pekerja, batas, partisi))
+                    return disewa
+        return []
+
+    def _sewa_partisi(self, koneksi, partisi, pekerja, jumlah, sekarang, batas):
+        maks_percobaan = CRAWLING_KONFIGURASI['MAKS_PERCOBAAN_URL']
+        while True:
+            baris = koneksi.execute(
+                'SELECT url, url_dasar, kedalaman, status, percobaan FROM url '
+                'WHERE partisi = ? AND (status = ? OR (status = ? AND batas_sewa < ?)) LIMIT ?',
+                (partisi, self.ANTRE, self.DISEWA, sekarang, jumlah)).fetchall()
+            if not baris:
+                return []
+            disewa, gagal, dilewati = [], [], []
+            sisa = {}
+            for url, url_dasar, kedalaman, status, percobaan in baris:
+                if percobaan >= maks_percobaan:
+                    # Sewanya sudah berkali-kali kedaluwarsa; bisa jadi halaman ini yang bikin pekerja crash
+                    gagal.append((self.GAGAL, url))
+                    continue
+                if status == self.ANTRE:
+                    if url_dasar not in sisa:
+                        sisa[url_dasar] = koneksi.execute('SELECT maks - diambil FROM dasar WHERE url_dasar = ?',
+                                                          (url_dasar,)).fetchone()[0]
+                    if sisa[url_dasar] <= 0:
+                        dilewati.append((self.DILEWATI, url))
+                        continue
+                    sisa[url_dasar] -= 1
+                    koneksi.execute('UPDATE dasar SET diambil = diambil + 1 WHERE url_dasar = ?', (url_dasar,))
+                disewa.append((url, url_dasar, kedalaman))
+            koneksi.executemany('UPDATE url SET status = ?, pekerja = NULL WHERE url = ?', gagal + dilewati)
+            koneksi.executemany(
+                'UPDATE url SET status = ?, pekerja = ?, batas_sewa = ?, percobaan = percobaan + 1 WHERE url = ?',
+                [(self.DISEWA, pekerja, batas, url) for url, _, _ in disewa])
+            if disewa:
+                return disewa
+
+    def catat(self, pekerja, halaman, tautan, jadwal_host=None):
+        # halaman: (url, rekaman JSON atau None); tautan: (url, url_dasar, kedalaman); jadwal_host: {host: epoch}.
+        # Sekalian memperpanjang sewa.
+        with self._transaksi() as koneksi:
+            koneksi.executemany(
+                'INSERT INTO host (host, boleh_setelah) VALUES (?, ?) '
+                'ON CONFLICT (host) DO UPDATE SET boleh_setelah = MAX(boleh_setelah, excluded.boleh_setelah)',
+                list((jadwal_host or {}).items()))
+            for url, data in halaman:
+                # Kalau sewanya sudah diambil alih pekerja lain, hasil dari pekerja ini dibuang biar gak dobel
+                diperbarui = koneksi.execute(
+                    'UPDATE url SET status = ?, pekerja = NULL WHERE url = ? AND pekerja = ? AND status = ?',
+                    (self.SELESAI, url, pekerja, self.DISEWA)).rowcount
+                if diperbarui and data is not None:
+                    koneksi.execute('INSERT INTO hasil (data) VALUES (?)', (data,))
+            self._tambah(koneksi, tautan)
+            self._perpanjang(koneksi, pekerja)
+
+    def jadwal_host(self, daftar_host):
+        # Cuma baca (WAL), jadi gak ikut antre kunci tulis
+        daftar_host = list(daftar_host)
+        if not daftar_host:
+            return {}
+        return dict(self._koneksi.execute(
+            f"SELECT host, boleh_setelah FROM host WHERE host IN ({', '.join('?' * len(daftar_host))})", daftar_host))
+
+    def perpanjang(self, pekerja):
+        with self._transaksi() as koneksi:
+            self._perpanjang(koneksi, pekerja)
+
+    def _perpanjang(self, koneksi, pekerja):
+        batas = time.time() + self.timeout_sewa
+        koneksi.execute('UPDATE partisi SET batas_sewa = ? WHERE pekerja = ?', (batas, pekerja))
+        koneksi.execute('UPDATE url SET batas_sewa = ? WHERE pekerja = ? AND status = ?', (batas, pekerja, self.DISEWA))
+
+    def lepas(self, pekerja):
+        # Pekerja berhenti dengan rapi: URL yang belum sempat diambil dikembalikan tanpa dihitung sebagai percobaan
+        with self._transaksi() as koneksi:
+            koneksi.execute(
+                'UPDATE dasar SET diambil = diambil - (SELECT COUNT(*) FROM url WHERE url.url_dasar = dasar.url_dasar '
+                'AND url.pekerja = ? AND url.status = ?)', (pekerja, self.DISEWA))
+            koneksi.execute('UPDATE url SET status = ?, pekerja = NULL, percobaan = percobaan - 1 '
+                            'WHERE pekerja = ? AND status = ?', (self.ANTRE, pekerja, self.DISEWA))
+            koneksi.execute('UPDATE partisi SET pekerja = NULL WHERE pekerja = ?', (pekerja,))
+
+    def selesai_semua(self):
+        baris = self._koneksi.execute('SELECT EXISTS (SELECT 1 FROM url WHERE status IN (?, ?))',
+                                      (self.ANTRE, self.DISEWA)).fetchone()
+        return not baris[0]
+
+    def statistik(self):
+        jumlah = dict.fromkeys(self.NAMA_STATUS, 0)
+        for status, banyak in self._koneksi.execute('SELECT status, COUNT(*) FROM url GROUP BY status'):
+            jumlah[self.NAMA_STATUS[status]] = banyak
+        return jumlah
+
+    def baca_hasil(self):
+        for (data,) in self._koneksi.execute('SELECT data FROM hasil ORDER BY id'):
+            yield RekamanHalaman.dari_dict(json.loads(data))
+
+    def tutup(self):
+        self._koneksi.close()
+
+class KonteksPekerja(KonteksCrawl):
+    # Konteks crawl satu pekerja terdistribusi: URL disewa dari FrontierBersama, rekaman & tautan baru dikirim balik per
+    # batch. Mesin crawl thread/asyncio dipakai apa adanya lewat antarmuka KonteksCrawl.
+    def __init__(self, frontier, id_pekerja):
+        self.bersama = frontier
+        self.id_pekerja = id_pekerja
+        self._antrean = deque()
+        self._dasar = {}
+        self._terlihat = set()
+        self._halaman = []
+        self._tautan = []
+        self._host_diminta = set()
+        self._terakhir_kirim = time.monotonic()
+        self._sewa_berikutnya = 0
+        self._isi_berikutnya = 0
+        # Sewa ulang cuma kalau antrean lokal di bawah air rendah, biar pekerja gak berebut kunci tulis tiap putaran
+        self._air_rendah = max(1, KINERJA_KONFIGURASI['MAKS_KONKURENSI'] // 2)
+        super().__init__(None, math.inf, hemat_memori=True, gunakan_sitemap=False, inkremental=False)
+        # Skala didapat dari jumlah pekerja, jadi tiap pekerja cukup parsing di prosesnya sendiri
+        self.gunakan_multiprocessing = False
+
+    def _mulai(self, gunakan_sitemap):
+        # Antrean diisi dari frontier bersama lewat bisa_ambil
+        pass
+
+    def bisa_ambil(self):
+        # Antrean lokal mulai tipis: kirim yang tertunda lalu sewa batch baru. Selama antrean belum kosong sewa dibatasi
+        # sekali per JEDA_ISI_ULANG_SEWA; kalau frontier lagi kosong, jangan ditanya lagi sebelum 1 detik.
+        # Heartbeat sewa juga ditumpangkan di sini, karena dipanggil tiap putaran mesin crawl.
+        sekarang = time.monotonic()
+        perlu_isi = not self._antrean or (len(self._antrean) < self._air_rendah and sekarang >= self._isi_berikutnya)
+        if perlu_isi and sekarang >= self._sewa_berikutnya:
+            if self._halaman or self._tautan or self._host_diminta:
+                self.kirim()
+            baru = self.bersama.sewa(self.id_pekerja)
+            for url, url_dasar, _ in baru:
+                self._dasar[url] = url_dasar
+            if baru:
+                # Jeda host yang terakhir dipakai pekerja lain ikut dihormati
+                host_baru = {urlparse(url).netloc for url, _, _ in baru}
+                for host, waktu in self.bersama.jadwal_host(host_baru).items():
+                    penjadwal.tunda_sampai(host, waktu)
+                self._antrean = self._selang_seling(list(self._antrean) + [(url, kedalaman) for url, _, kedalaman in baru])
+                self._isi_berikutnya = sekarang + CRAWLING_KONFIGURASI['JEDA_ISI_ULANG_SEWA']
+            else:
+                self._sewa_berikutnya = sekarang + 1
+        self._kirim_bila_perlu()
+        return bool(self._antrean)
+
+    @staticmethod
+    def _selang_seling(daftar):
+        # Urutan diselang-seling per host, biar thread fetch gak antre jeda host yang sama sementara host lain nganggur
+        per_host = OrderedDict()
+        for url, kedalaman in daftar:
+            per_host.setdefault(urlparse(url).netloc, deque()).append((url, kedalaman))
+        hasil = deque()
+        while per_host:
+            for host in list(per_host):
+                hasil.append(per_host[host].popleft())
+                if not per_host[host]:
+                    del per_host[host]
+        return hasil
+
+    def ambil_url(self):
+        self.jumlah_diambil += 1
+        url, kedalaman = self._antrean.popleft()
+        self._host_diminta.add(urlparse(url).netloc)
+        return url, kedalaman
+
+    def dasar_untuk(self, url):
+        return self._dasar[url]
+
+    def tambah_url(self, url, kedalaman, url_dasar):
+        if url in self._terlihat:
+            return
+        self._terlihat.add(url)
+        if CRAWLING_KONFIGURASI['HORMATI_ROBOTS_TXT'] and not robots.boleh_diambil(url):
+            self.jumlah_ditolak_robots += 1
+            metrik.tambah('ditolak_robots')
+            return
+        self._tautan.append((url, url_dasar, kedalaman))
+
+    def catat_halaman(self, url, kedalaman, rekaman, tautan_baru):
+        metrik.tambah('halaman_selesai')
+        url_dasar = self._dasar.pop(url)
+        if rekaman:
+            self.jumlah_rekaman += 1
+            simpan_ke_database(rekaman)
+        self._halaman.append((url, json.dumps(rekaman, ensure_ascii=False, default=_ke_json) if rekaman else None))
+        for url_lengkap in tautan_baru:
+            self.tambah_url(url_lengkap, kedalaman + 1, url_dasar)
+        self._kirim_bila_perlu()
+
+    def _kirim_bila_perlu(self):
+        # Dikirim per batch; jedanya sekalian jadi detak jantung yang memperpanjang sewa
+        if (len(self._halaman) >= CRAWLING_KONFIGURASI['INTERVAL_CHECKPOINT'] or
+                time.monotonic() - self._terakhir_kirim >= self.bersama.timeout_sewa / 4):
+            self.kirim()
+
+    def kirim(self):
+        if self._halaman or self._tautan or self._host_diminta:
+            self.bersama.catat(self.id_pekerja, self._halaman, self._tautan, penjadwal.jadwal(self._host_diminta))
+            self._halaman = []
+            self._tautan = []
+            self._host_diminta = set()
+        else:
+            self.bersama.perpanjang(self.id_pekerja)
+        self._terakhir_kirim = time.monotonic()
+
+    def selesai(self):
+        self.kirim()
+        self.bersama.lepas(self.id_pekerja)
+
+def jalankan_pekerja(path=CRAWLING_KONFIGURASI['FILE_FRONTIER_BERSAMA'], id_pekerja=None, tampilkan_progress=True,
+                     konfigurasi=None):
+    # Satu pekerja: sewa URL, jelajahi pakai mesin crawl biasa, kirim balik hasilnya; berhenti kalau frontier sudah habis.
+    # Bisa dijalankan di mesin lain selama berkas frontier-nya sama (lihat subperintah `pekerja`).
+    # konfigurasi: salinan dict konfigurasi koordinator (lihat _konfigurasi_proses) untuk pekerja yang di-spawn lokal
+    if konfigurasi is not None:
+        _pasang_konfigurasi(konfigurasi)
+    id_pekerja = id_pekerja or f"{socket.gethostname()}-{os.getpid()}"
+    frontier = FrontierBersama(path)
+    konteks = KonteksPekerja(frontier, id_pekerja)
+    try:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            TextColumn("{task.completed} halaman"),
+            TextColumn("{task.fields[statistik]}"),
+            console=Console(stderr=True),
+            disable=not tampilkan_progress,
+        ) as progress:
+            task = progress.add_task(f"[cyan]Pekerja {id_pekerja}...", total=None, statistik='')
+            while True:
+                if KINERJA_KONFIGURASI['GUNAKAN_ASYNCIO']:
+                    asyncio.run(_jelajahi_async(konteks, progress, task))
+                else:
+                    _jelajahi_thread(konteks, progress, task)
+                konteks.kirim()
+                if frontier.selesai_semua():
+                    break
+                # Frontier kosong tapi pekerja lain masih memegang sewa: tunggu tautan baru atau sewa yang kedaluwarsa
+                time.sleep(1)
+    finally:
+        konteks.selesai()
+        frontier.tutup()
+    logging.info(f"Pekerja {id_pekerja} selesai: {konteks.jumlah_diambil} halaman")
+    return konteks.jumlah_diambil
+
+def jelajahi_terdistribusi(daftar_url_dasar, maks_halaman=CRAWLING_KONFIGURASI['MAKS_HALAMAN_PER_DOMAIN'], sink=None,
+                           path=CRAWLING_KONFIGURASI['FILE_FRONTIER_BERSAMA'],
+                           jumlah_pekerja=CRAWLING_KONFIGURASI['JUMLAH_PEKERJA'],
+                           gunakan_sitemap=CRAWLING_KONFIGURASI['GUNAKAN_SITEMAP']):
+    # Koordinator: isi frontier bersama, jalankan pekerja lokal, tunggu sampai frontier habis, lalu gabungkan hasil
+    # semua pekerja ke sink (atau dibalikin sebagai list kalau sink kosong). maks_halaman berlaku per URL dasar.
+    # jumlah_pekerja=0: koordinator cuma menunggu pekerja di mesin lain. Berkas frontier yang sudah ada dilanjutkan.
+    frontier = FrontierBersama(path)
+    for url_dasar in daftar_url_dasar:
+        if not frontier.tambah_dasar(url_dasar, maks_halaman) or not gunakan_sitemap:
+            continue
+        awalan = normalisasi_url(url_dasar)
+        # URL dasar sudah ada di frontier, jadi sitemap cukup menyumbang maks_halaman - 1 URL
+        dari_sitemap = {}
+        for url in url_sitemap_dalam_cakupan(url_dasar):
+            if len(dari_sitemap) >= maks_halaman - 1:
+                break
+            if url != awalan and url not in dari_sitemap and (not CRAWLING_KONFIGURASI['HORMATI_ROBOTS_TXT'] or
+                                                              robots.boleh_diambil(url)):
+                dari_sitemap[url] = (url, awalan, 1)
+        frontier.tambah(list(dari_sitemap.values()))
+        logging.info(f"{len(dari_sitemap)} URL dari sitemap masuk antrean {url_dasar}")
+
+    konteks_proses = multiprocessing.get_context('spawn')
+    awalan_id = f"{socket.gethostname()}-{os.getpid()}"
+
+    # Proses 'spawn' membaca ulang berkas config, jadi nilai yang diubah saat runtime ikut dikirim ke pekerja
+    konfigurasi = tuple(dict(isi) for isi in _konfigurasi_proses())
+
+    def mulai_pekerja(nomor):
+        proses = konteks_proses.Process(target=jalankan_pekerja, args=(path, f"{awalan_id}-{nomor}", False, konfigurasi),
+                                        name=f"pekerja-crawl-{nomor}")
+        proses.start()
+        return proses
+
+    daftar_proses = [mulai_pekerja(nomor) for nomor in range(jumlah_pekerja)]
+    try:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            TextColumn("{task.completed} halaman"),
+            TextColumn("{task.fields[statistik]}"),
+            # Ke stderr, biar hasil gabungan bisa dialirkan lewat stdout
+            console=Console(stderr=True),
+        ) as progress:
+            task = progress.add_task(f"[cyan]Koordinator ({jumlah_pekerja} pekerja lokal)...", total=None, statistik='')
+            while not frontier.selesai_semua():
+                time.sleep(1)
+                for nomor, proses in enumerate(daftar_proses):
+                    if proses.exitcode not in (None, 0):
+                        # Sewa milik pekerja yang crash diambil alih setelah TIMEOUT_SEWA; penggantinya langsung jalan
+                        logging.warning(f"Pekerja {nomor} berhenti dengan kode {proses.exitcode}, dijalankan ulang")
+                        daftar_proses[nomor] = mulai_pekerja(nomor)
+                statistik = frontier.statistik()
+                progress.update(task, completed=statistik['selesai'],
+                                statistik=f"antre {statistik['antre']} | disewa {statistik['disewa']} | "
+                                          f"gagal {statistik['gagal']}")
+    finally:
+        for proses in daftar_proses:
+            proses.join()
+
+    logging.info(f"Crawl terdistribusi selesai: {frontier.statistik()}")
+    hasil = []
+    for rekaman in frontier.baca_hasil():
+        if sink:
+            sink(rekaman)
+        else:
+            hasil.append(rekaman)
+    frontier.tutup()
+    return hasil
+
+def _sampel_teks(teks, panjang):
+    # Spasi dirapikan, lalu ambil potongan awal/tengah/akhir biar deteksi bahasa gak perlu baca seluruh dokumen
+    teks = ' '.join(teks.split())
+    if len(teks) <= panjang:
+        return teks
+    potongan = panjang // 3
+    tengah = len(teks) // 2
+    return ' '.join((teks[:potongan], teks[tengah - potongan // 2:tengah + potongan // 2], teks[-potongan:]))
+
+def deteksi_bahasa(teks):
+    from langdetect import detect
+
+    sampel = _sampel_teks(teks, ANALISIS_KONFIGURASI['PANJANG_SAMPEL_BAHASA'])
+    try:
+        return detect(sampel)
+    except Exception:
+        return "Tidak diketahui"
+
+class LayananTeknologi:
+    # Database fingerprint Wappalyzer dimuat & dikompilasi sekali per proses; halaman dibangun dari respons yang sudah diambil
+    def __init__(self):
+        self._wappalyzer = None
+        self._kunci = threading.Lock()
+        self._per_host = {}
+
+    def _dapatkan_wappalyzer(self):
+        with self._kunci:
+            if self._wappalyzer is None:
+                from Wappalyzer import Wappalyzer
+                self._wappalyzer = Wappalyzer.latest()
+            return self._wappalyzer
+
+    def deteksi(self, url, konten_html, header=None):
+        from Wappalyzer import WebPage
+
+        halaman_web = WebPage(url, konten_html, requests.structures.CaseInsensitiveDict(header or {}))
+        return self._dapatkan_wappalyzer().analyze_with_versions_and_categories(halaman_web)
+
+    def hasil_host(self, url):
+        with self._kunci:
+            return self._per_host.get(urlparse(url).netloc)
+
+    def simpan_host(self, url, teknologi):
+        with self._kunci:
+            self._per_host.setdefault(urlparse(url).netloc, teknologi)
+
+    def deteksi_per_host(self, url, konten_html, header=None):
+        teknologi = self.hasil_host(url)
+        if teknologi is not None:
+            return teknologi
+        teknologi = self.deteksi(url, konten_html, header)
+        self.simpan_host(url, teknologi)
+        return teknologi
+
+    def deteksi_batch(self, halaman):
+        # halaman: iterable (url, konten_html, header); tiap host cukup dianalisis sekali
+        return {url: self.deteksi_per_host(url, konten_html, header) for url, konten_html, header in halaman}
+
+layanan_teknologi = LayananTeknologi()
+
+def deteksi_teknologi_crawl(hasil_crawl):
+    # Teknologi per host dari hasil crawl (DETEKSI_TEKNOLOGI_SAAT_CRAWL), tanpa permintaan baru. Host yang belum
+    # terdeteksi cuma dianalisis kalau responsnya masih ada di cache.
+    hasil = {}
+    for rekaman in hasil_crawl:
+        url = rekaman['url']
+        teknologi = rekaman.get('teknologi')
+        if teknologi is None:
+            teknologi = layanan_teknologi.hasil_host(url)
+        if teknologi is None:
+            tersimpan = _baca_cache(url)
+            if tersimpan is None or not tersimpan[0]:
+                continue
+            teknologi = layanan_teknologi.deteksi_per_host(url, tersimpan[0], ambil_header_respons(url))
+        hasil[url] = teknologi
+    return hasil
+
+def deteksi_bahasa_dan_teknologi(url, konten_html, header=None):
+    # Bahasa dideteksi dari teks yang sudah diekstrak, bukan dari markup mentah
+    bahasa = deteksi_bahasa(dapatkan_dokumen(konten_html).teks)
+    
+    if header is None:
+        header = ambil_header_respons(url)
+    teknologi = layanan_teknologi.deteksi(url, konten_html, header)
+    
+    return bahasa, teknologi
+
+_cache_analisis = OrderedDict()
+_kunci_cache_analisis = threading.Lock()
+
+def analisis_teks(teks):
+    # Satu TextBlob per dokumen untuk semua analisis; hasil disimpan per hash konten biar teks yang sama gak dianalisis ulang
+    kunci = hashlib.sha1(teks.encode('utf-8', 'replace')).hexdigest()
+    with _kunci_cache_analisis:
+        if kunci in _cache_analisis:
+            _cache_analisis.move_to_end(kunci)
+            metrik.tambah('cache_analisis_hit')
+            return _cache_analisis[kunci]
+    metrik.tambah('cache_analisis_miss')
+
+    with metrik.ukur('analisis'):
+        hasil = _analisis_teks_baru(teks)
+
+    with _kunci_cache_analisis:
+        _cache_analisis[kunci] = hasil
+        while len(_cache_analisis) > ANALISIS_KONFIGURASI['MAKS_CACHE_ANALISIS']:
+            _cache_analisis.popitem(last=False)
+    return hasil
+
+def _analisis_teks_baru(teks):
+    from textblob import TextBlob
+
+    blob = TextBlob(teks)
+    hasil = {'sentimen': None, 'kata_kunci': [], 'ringkasan': None, 'bahasa': None}
+    if ANALISIS_KONFIGURASI['ANALISIS_SENTIMEN']:
+        hasil['sentimen'] = blob.sentiment.polarity
+    if ANALISIS_KONFIGURASI['EKSTRAKSI_KATA_KUNCI']:
+        hasil['kata_kunci'] = [str(kata) for kata in blob.noun_phrases[:ANALISIS_KONFIGURASI['MAKS_KATA_KUNCI']]]
+    if ANALISIS_KONFIGURASI['RINGKASAN_OTOMATIS']:
+        kalimat = blob.sentences[:ANALISIS_KONFIGURASI['PANJANG_RINGKASAN']]
+        hasil['ringkasan'] = " ".join(str(k) for k in kalimat)
+    if ANALISIS_KONFIGURASI['DETEKSI_BAHASA']:
+        hasil['bahasa'] = deteksi_bahasa(teks)
+    return hasil
+
+def analisis_sentimen(teks):
+    return analisis_teks(teks)['sentimen']
+
+def ekstraksi_kata_kunci(teks):
+    return analisis_teks(teks)['kata_kunci']
+
+def ringkas_teks(teks):
+    return analisis_teks(teks)['ringkasan']
+
+def analisis_korpus(hasil_crawl):
+    # Analisis seluruh hasil crawl tanpa mengambil ulang halaman: pakai analisis yang sudah ada, teks di rekaman
+    # (SIMPAN_TEKS), atau respons yang masih ada di cache selama isinya masih cocok dengan hash_konten rekaman.
+    # Duplikat cuma dihitung sekali.
+    hasil = {}
+    terlewat = 0
+    for rekaman in hasil_crawl:
+        if rekaman.get('duplikat_dari'):
+            continue
+        if rekaman.get('analisis') is not None:
+            hasil[rekaman['url']] = rekaman['analisis']
+            continue
+        teks = rekaman.get('teks')
+        if teks is None:
+            tersimpan = _baca_cache(rekaman['url'])
+            if tersimpan is not None:
+                teks = dapatkan_dokumen(tersimpan[0]).teks
+                if rekaman.get('hash_konten') and _hash_kata(teks.lower().split()) != rekaman['hash_konten']:
+                    teks = None
+        if teks is None:
+            terlewat += 1
+            continue
+        hasil[rekaman['url']] = analisis_teks(teks)
+    if terlewat:
+        logging.warning(f"{terlewat} halaman gak dianalisis karena teksnya gak tersimpan di rekaman maupun cache; "
+                        f"nyalakan SIMPAN_TEKS atau ANALISIS_SAAT_CRAWL saat crawl")
+    return hasil
+
+class BackendDatabase:
+    # Antarmuka backend: tiap mesin database cukup menyediakan koneksi, skema, dan SQL upsert-nya sendiri
+    placeholder = '?'
+    skema = []
+    sql_halaman = ''
+
+    def __init__(self, konfigurasi):
+        self.konfigurasi = konfigurasi
+        self.koneksi = None
+
+    def sambung(self):
+        raise NotImplementedError
+
+    def siapkan_skema(self):
+        kursor = self.koneksi.cursor()
+        for perintah in self.skema:
+            kursor.execute(perintah)
+        self.koneksi.commit()
+
+    def tulis_batch(self, batch):
+        p = self.placeholder
+        baris_halaman = []
+        baris_tautan = []
+        baris_meta = []
+        sekarang = time.time()
+        # URL yang muncul dua kali dalam satu batch cuma diambil versi terakhirnya; kalau gak, baris induknya memang
+        # di-upsert tapi baris tautan/meta-nya ikut tersisip dua kali
+        for url, rekaman in {rekaman['url']: rekaman for rekaman in batch}.items():
+            baris_halaman.append((url, rekaman.get('judul'), json.dumps(rekaman, ensure_ascii=False, default=_ke_json),
+                                  sekarang))
+            for tujuan in rekaman.get('tautan') or []:
+                baris_tautan.append((url, tujuan))
+            for nama, nilai in (rekaman.get('elemen') or {}).items():
+                for isi in (nilai if isinstance(nilai, list) else [nilai]):
+                    if isinstance(isi, str):
+                        baris_meta.append((url, nama, isi))
+
+        # Halaman yang di-crawl ulang: baris anak lama dihapus dulu biar gak dobel
+        daftar_url = [(url,) for url, _, _, _ in baris_halaman]
+        kursor = self.koneksi.cursor()
+        kursor.executemany(self.sql_halaman, baris_halaman)
+        kursor.executemany(f'DELETE FROM tautan WHERE url_halaman = {p}', daftar_url)
+        kursor.executemany(f'DELETE FROM meta WHERE url_halaman = {p}', daftar_url)
+        kursor.executemany(f'INSERT INTO tautan (url_halaman, url_tujuan) VALUES ({p}, {p})', baris_tautan)
+        kursor.executemany(f'INSERT INTO meta (url_halaman, nama, nilai) VALUES ({p}, {p}, {p})', baris_meta)
+        self.koneksi.commit()
+        return len(baris_halaman) + len(baris_tautan) + len(baris_meta)
 
-from konfigurasi import KONFIGURASI, AGEN_PENGGUNA, HEADER, KODE_ERROR, dapatkan_pesan_error
-from output_config import OUTPUT_KONFIGURASI
-from crawling_config import CRAWLING_KONFIGURASI
-from parsing_config import PARSING_KONFIGURASI
-from database_config import DATABASE_KONFIGURASI
-from notification_config import NOTIFIKASI_KONFIGURASI
-from security_config import KEAMANAN_KONFIGURASI
-from analysis_config import ANALISIS_KONFIGURASI
-from performance_config import KINERJA_KONFIGURASI
-from storage_config import PENYIMPANAN_KONFIGURASI
-from visualization_config import VISUALISASI_KONFIGURASI
+    def tutup(self):
+        if self.koneksi is not None:
+            self.koneksi.close()
 
-def CEK_INSTALL_DEPENDESI():
-    required = {
-        'requests', 'beautifulsoup4', 'rich', 'langdetect', 'python-Wappalyzer',
-        'ratelimit', 'textblob', 'matplotlib', 'boto3', 'google-cloud-storage',
-        'azure-storage-blob', 'python-telegram-bot'
-    }
-    installed = {pkg.key for pkg in pkg_resources.working_set}
-    missing = required - installed
+class BackendSQLite(BackendDatabase):
+    skema = [
+        'CREATE TABLE IF NOT EXISTS halaman (url TEXT PRIMARY KEY, judul TEXT, data TEXT, waktu_simpan REAL)',
+        'CREATE TABLE IF NOT EXISTS tautan (url_halaman TEXT NOT NULL, url_tujuan TEXT NOT NULL)',
+        'CREATE INDEX IF NOT EXISTS idx_tautan_halaman ON tautan(url_halaman)',
+        'CREATE TABLE IF NOT EXISTS meta (url_halaman TEXT NOT NULL, nama TEXT NOT NULL, nilai TEXT)',
+        'CREATE INDEX IF NOT EXISTS idx_meta_halaman ON meta(url_halaman)'
+    ]
+    sql_halaman = ('INSERT INTO halaman (url, judul, data, waktu_simpan) VALUES (?, ?, ?, ?) '
+                   'ON CONFLICT(url) DO UPDATE SET judul = excluded.judul, data = excluded.data, '
+                   'waktu_simpan = excluded.waktu_simpan')
 
-    if missing:
-        print("Tunggu sebentar lagi install dependesi...")
-        python = sys.executable
-        subprocess.check_call([python, '-m', 'pip', 'install', *missing], stdout=subprocess.DEVNULL)
-        print("Dependensi berhasil diinstal.")
-    
-    global Console, Panel, Progress, SpinnerColumn, BarColumn, TextColumn, Syntax, Table
-    from rich.console import Console
-    from rich.panel import Panel
-    from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn
-    from rich.syntax import Syntax
-    from rich.table import Table
-    from langdetect import detect
-    from Wappalyzer import Wappalyzer, WebPage
+    def sambung(self):
+        self.koneksi = sqlite3.connect(f"{self.konfigurasi['NAMA_DATABASE']}.db")
+        self.koneksi.execute('PRAGMA journal_mode=WAL')
+        self.koneksi.execute('PRAGMA synchronous=NORMAL')
 
-CEK_INSTALL_DEPENDESI()
+class BackendMySQL(BackendDatabase):
+    placeholder = '%s'
+    skema = [
+        'CREATE TABLE IF NOT EXISTS halaman (url VARCHAR(768) PRIMARY KEY, judul TEXT, data LONGTEXT, waktu_simpan DOUBLE)',
+        'CREATE TABLE IF NOT EXISTS tautan (url_halaman VARCHAR(768) NOT NULL, url_tujuan TEXT NOT NULL, '
+        'INDEX idx_tautan_halaman (url_halaman))',
+        'CREATE TABLE IF NOT EXISTS meta (url_halaman VARCHAR(768) NOT NULL, nama VARCHAR(255) NOT NULL, nilai TEXT, '
+        'INDEX idx_meta_halaman (url_halaman))'
+    ]
+    sql_halaman = ('INSERT INTO halaman (url, judul, data, waktu_simpan) VALUES (%s, %s, %s, %s) '
+                   'ON DUPLICATE KEY UPDATE judul = VALUES(judul), data = VALUES(data), waktu_simpan = VALUES(waktu_simpan)')
 
-console = Console()
+    def sambung(self):
+        import pymysql
 
-# Konfigurasi logging
-logging.basicConfig(filename=KONFIGURASI['LOG_FILE'], level=KONFIGURASI['LOG_LEVEL'],
-                    format='%(asctime)s - %(levelname)s - %(message)s')
+        self.koneksi = pymysql.connect(host=self.konfigurasi['HOST'], port=self.konfigurasi['PORT'],
+                                       user=self.konfigurasi['USERNAME'], password=self.konfigurasi['PASSWORD'],
+                                       database=self.konfigurasi['NAMA_DATABASE'], charset='utf8mb4')
 
-# Cache buat nyimpen hasil
-hasil_cache = {}
+class BackendPostgreSQL(BackendDatabase):
+    placeholder = '%s'
+    skema = [
+        'CREATE TABLE IF NOT EXISTS halaman (url TEXT PRIMARY KEY, judul TEXT, data TEXT, waktu_simpan DOUBLE PRECISION)',
+        'CREATE TABLE IF NOT EXISTS tautan (url_halaman TEXT NOT NULL, url_tujuan TEXT NOT NULL)',
+        'CREATE INDEX IF NOT EXISTS idx_tautan_halaman ON tautan(url_halaman)',
+        'CREATE TABLE IF NOT EXISTS meta (url_halaman TEXT NOT NULL, nama TEXT NOT NULL, nilai TEXT)',
+        'CREATE INDEX IF NOT EXISTS idx_meta_halaman ON meta(url_halaman)'
+    ]
+    sql_halaman = ('INSERT INTO halaman (url, judul, data, waktu_simpan) VALUES (%s, %s, %s, %s) '
+                   'ON CONFLICT (url) DO UPDATE SET judul = EXCLUDED.judul, data = EXCLUDED.data, '
+                   'waktu_simpan = EXCLUDED.waktu_simpan')
 
-def url_valid(url):
-    parsed = urlparse(url)
-    return bool(parsed.netloc) and bool(parsed.scheme)
+    def sambung(self):
+        import psycopg2
 
-@lru_cache(maxsize=100)
-@sleep_and_retry
-@limits(calls=KONFIGURASI['BATAS_PERMINTAAN'], period=60)
-def ambil_kode_sumber(url, gunakan_cache=True):
-    if gunakan_cache:
-        if KONFIGURASI['GUNAKAN_CACHE_FILE']:
-            try:
-                with open(KONFIGURASI['CACHE_FILE'], 'r') as f:
-                    cache_file = json.load(f)
-                if url in cache_file and time.time() - cache_file[url]['waktu'] < KONFIGURASI['CACHE_EXPIRY']:
-                    return cache_file[url]['data']
-            except (FileNotFoundError, json.JSONDecodeError):
-                pass
-        elif url in hasil_cache and time.time() - hasil_cache[url]['waktu'] < KONFIGURASI['CACHE_EXPIRY']:
-            return hasil_cache[url]['data']
+        self.koneksi = psycopg2.connect(host=self.konfigurasi['HOST'], port=self.konfigurasi['PORT'],
+                                        user=self.konfigurasi['USERNAME'], password=self.konfigurasi['PASSWORD'],
+                                        dbname=self.konfigurasi['NAMA_DATABASE'])
 
-    headers = HEADER.copy()
-    headers["User-Agent"] = random.choice(AGEN_PENGGUNA)
+BACKEND_DATABASE = {
+    'sqlite': BackendSQLite,
+    'mysql': BackendMySQL,
+    'postgresql': BackendPostgreSQL
+}
 
-    for percobaan in range(KONFIGURASI['MAKS_PERCOBAAN']):
-        try:
-            session = requests.Session()
-            if KEAMANAN_KONFIGURASI['GUNAKAN_TOR']:
-                session.proxies = {'http': KEAMANAN_KONFIGURASI['TOR_PROXY'], 'https': KEAMANAN_KONFIGURASI['TOR_PROXY']}
-            
-            response = session.get(
-                url,
-                headers=headers,
-                timeout=KINERJA_KONFIGURASI['TIMEOUT_PERMINTAAN'],
-                proxies=KONFIGURASI['PROXY'] if KONFIGURASI['GUNAKAN_PROXY'] else None,
-                verify=KEAMANAN_KONFIGURASI['VERIFIKASI_SSL']
-            )
-            response.raise_for_status()
-            
-            waktu_muat = response.elapsed.total_seconds()
-            ukuran_konten = len(response.content)
-            soup = BeautifulSoup(response.text, PARSING_KONFIGURASI['PARSER'])
-            sumber_eksternal = len([link for link in soup.find_all('link') if link.get('href', '').startswith('http')])
-            
-            hasil = (response.text, waktu_muat, ukuran_konten, sumber_eksternal)
-            
-            if gunakan_cache:
-                if KONFIGURASI['GUNAKAN_CACHE_FILE']:
-                    try:
-                        with open(KONFIGURASI['CACHE_FILE'], 'r') as f:
-                            cache_file = json.load(f)
-                    except (FileNotFoundError, json.JSONDecodeError):
-                        cache_file = {}
-                    cache_file[url] = {'data': hasil, 'waktu': time.time()}
-                    with open(KONFIGURASI['CACHE_FILE'], 'w') as f:
-                        json.dump(cache_file, f)
-                else:
-                    hasil_cache[url] = {'data': hasil, 'waktu': time.time()}
-            
-            return hasil
-        except requests.RequestException as e:
-            if percobaan == KONFIGURASI['MAKS_PERCOBAAN'] - 1:
-                if isinstance(e, requests.Timeout):
-                    kode_error = KODE_ERROR['BATAS_WAKTU_TERLAMPAUI']
-                elif isinstance(e, requests.SSLError):
-                    kode_error = KODE_ERROR['KESALAHAN_SSL']
-                else:
-                    kode_error = KODE_ERROR['KONEKSI_GAGAL']
-                pesan_error = dapatkan_pesan_error(kode_error)
-                logging.error(f"Gagal mengambil {url}: {pesan_error}")
-                raise Exception(pesan_error)
-            time.sleep(2 ** percobaan)  # Exponential backoff
+class PenulisDatabase:
+    # Thread latar yang menguras antrean terbatas dan menulis per batch, jadi loop fetch gak nunggu database
+    _SELESAI = object()
 
-def parse_html(konten_html):
-    return BeautifulSoup(konten_html, PARSING_KONFIGURASI['PARSER'])
+    def __init__(self, backend, ukuran_batch=DATABASE_KONFIGURASI['UKURAN_BATCH'],
+                 ukuran_antrean=DATABASE_KONFIGURASI['UKURAN_ANTREAN']):
+        self.backend = backend
+        self.ukuran_batch = ukuran_batch
+        self.jumlah_baris = 0
+        self._pernah_penuh = False
+        self._antrean = queue.Queue(maxsize=ukuran_antrean)
+        self._thread = threading.Thread(target=self._jalan, name='penulis-database', daemon=True)
+        self._thread.start()
 
-def ekstrak_elemen_spesifik(sup):
-    deskripsi_meta = sup.find('meta', attrs={'name': 'description'})
-    kata_kunci_meta = sup.find('meta', attrs={'name': 'keywords'})
-    tag_h1 = sup.find_all('h1')
-    
-    hasil = {
-        'deskripsi_meta': deskripsi_meta['content'] if deskripsi_meta else None,
-        'kata_kunci_meta': kata_kunci_meta['content'] if kata_kunci_meta else None,
-        'tag_h1': [h1.text for h1 in tag_h1]
-    }
-    
-    if PARSING_KONFIGURASI['EKSTRAK_JAVASCRIPT']:
-        hasil['javascript'] = [script.string for script in sup.find_all('script') if script.string]
-    
-    if PARSING_KONFIGURASI['EKSTRAK_CSS']:
-        hasil['css'] = [style.string for style in sup.find_all('style') if style.string]
-    
-    if PARSING_KONFIGURASI['EKSTRAK_KOMENTAR']:
-        hasil['komentar'] = sup.find_all(text=lambda text: isinstance(text, Comment))
-    
-    return hasil
+    def tulis(self, rekaman):
+        try:
+            self._antrean.put_nowait(rekaman)
+        except queue.Full:
+            # Antrean penuh berarti database jauh ketinggalan; tahan sebentar daripada memori membengkak
+            if not self._pernah_penuh:
+                logging.warning("Antrean database penuh, crawler ditahan sampai penulis latar menyusul")
+                self._pernah_penuh = True
+            self._antrean.put(rekaman)
 
-def ekspor_ke_format(data, tipe_format, nama_file):
-    if tipe_format == 'json':
-        with open(nama_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
-    elif tipe_format == 'xml':
-        root = ET.Element("data_website")
-        for kunci, nilai in data.items():
-            anak = ET.SubElement(root, kunci)
-            anak.text = str(nilai)
-        tree = ET.ElementTree(root)
-        tree.write(nama_file, encoding='utf-8', xml_declaration=True)
-    elif tipe_format == 'csv':
-        with open(nama_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(data.keys())
-            writer.writerow(data.values())
-    
-    if OUTPUT_KONFIGURASI['KOMPRESI_OUTPUT']:
-        with zipfile.ZipFile(f"{nama_file}.zip", 'w', zipfile.ZIP_DEFLATED) as zipf:
-            zipf.write(nama_file, os.path.basename(nama_file))
-        os.remove(nama_file)
-        console.print(f"[bold green]File telah dikompres dan disimpan sebagai {nama_file}.zip[/bold green]")
-    else:
-        console.print(f"[bold green]File telah disimpan sebagai {nama_file}[/bold green]")
+    def _jalan(self):
+        try:
+            self.backend.sambung()
+            self.backend.siapkan_skema()
+        except Exception as e:
+            logging.error(f"Gagal menyiapkan database: {str(e)}")
+            self.backend = None
 
-def jelajahi_tautan_internal(url_dasar, maks_halaman=CRAWLING_KONFIGURASI['MAKS_HALAMAN_PER_DOMAIN']):
-    dikunjungi = set()
-    akan_dikunjungi = [url_dasar]
-    hasil = []
+        selesai = False
+        while not selesai:
+            batch = []
+            item = self._antrean.get()
+            while True:
+                if item is self._SELESAI:
+                    selesai = True
+                    break
+                batch.append(item)
+                if len(batch) >= self.ukuran_batch:
+                    break
+                try:
+                    item = self._antrean.get_nowait()
+                except queue.Empty:
+                    break
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-    ) as progress:
-        task = progress.add_task("[cyan]Menjelajahi tautan internal...", total=maks_halaman)
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=KINERJA_KONFIGURASI['MAKS_KONKURENSI']) as executor:
-            while akan_dikunjungi and len(dikunjungi) < maks_halaman:
-                url = akan_dikunjungi.pop(0)
-                if url not in dikunjungi:
-                    dikunjungi.add(url)
-                    future = executor.submit(ambil_kode_sumber, url)
-                    try:
-                        konten_html, _, _, _ = future.result()
-                        if konten_html:
-                            sup = parse_html(konten_html)
-                            hasil.append({
-                                'url': url,
-                                'judul': sup.title.string if sup.title else None,
-                                'elemen': ekstrak_elemen_spesifik(sup)
-                            })
-                            for tautan in sup.find_all('a', href=True):
-                                url_lengkap = urljoin(url_dasar, tautan['href'])
-                                if (url_lengkap.startswith(url_dasar) and
-                                    url_lengkap not in dikunjungi and
-                                    len(urlparse(url_lengkap).path.split('/')) <= CRAWLING_KONFIGURASI['MAKS_KEDALAMAN']):
-                                    akan_dikunjungi.append(url_lengkap)
-                    except Exception as e:
-                        console.print(f"[bold red]Kesalahan menjelajahi {url}: {str(e)}[/bold red]")
-                    
-                    progress.update(task, advance=1)
-                    time.sleep(CRAWLING_KONFIGURASI['JEDA_ANTAR_PERMINTAAN'])
-    
-    return hasil
+            if batch and self.backend is not None:
+                try:
+                    with metrik.ukur('database'):
+                        self.jumlah_baris += self.backend.tulis_batch(batch)
+                except Exception as e:
+                    logging.error(f"Gagal menulis {len(batch)} rekaman ke database: {str(e)}")
 
-def deteksi_bahasa_dan_teknologi(url, konten_html):
-    try:
-        bahasa = detect(konten_html)
-    except:
-        bahasa = "Tidak diketahui"
-    
-    wappalyzer = Wappalyzer.latest()
-    halaman_web = WebPage.new_from_url(url)
-    teknologi = wappalyzer.analyze_with_versions_and_categories(halaman_web)
-    
-    return bahasa, teknologi
+        if self.backend is not None:
+            self.backend.tutup()
 
-def analisis_sentimen(teks):
-    if ANALISIS_KONFIGURASI['ANALISIS_SENTIMEN']:
-        analisis = TextBlob(teks)
-        return analisis.sentiment.polarity
-    return None
+    def tutup(self):
+        self._antrean.put(self._SELESAI)
+        self._thread.join()
 
-def ekstraksi_kata_kunci(teks):
-    if ANALISIS_KONFIGURASI['EKSTRAKSI_KATA_KUNCI']:
-        kata_kunci = TextBlob(teks).noun_phrases
-        return kata_kunci[:ANALISIS_KONFIGURASI['MAKS_KATA_KUNCI']]
-    return []
+_penulis_database = None
+_kunci_penulis_database = threading.Lock()
 
-def ringkas_teks(teks):
-    if ANALISIS_KONFIGURASI['RINGKASAN_OTOMATIS']:
-        kalimat = TextBlob(teks).sentences
-        return " ".join(str(kalimat[i]) for i in range(min(ANALISIS_KONFIGURASI['PANJANG_RINGKASAN'], len(kalimat))))
-    return None
+def dapatkan_penulis_database():
+    global _penulis_database
+    with _kunci_penulis_database:
+        if _penulis_database is None:
+            backend = BACKEND_DATABASE[DATABASE_KONFIGURASI['JENIS_DATABASE']](DATABASE_KONFIGURASI)
+            _penulis_database = PenulisDatabase(backend)
+            atexit.register(tutup_penulis_database)
+        return _penulis_database
+
+def tutup_penulis_database():
+    # Tunggu semua rekaman di antrean tertulis, lalu tutup koneksi
+    global _penulis_database
+    with _kunci_penulis_database:
+        penulis, _penulis_database = _penulis_database, None
+    if penulis is not None:
+        penulis.tutup()
 
 def simpan_ke_database(data):
     if DATABASE_KONFIGURASI['GUNAKAN_DATABASE']:
-        # Implementasi penyimpanan ke database sesuai dengan jenis database yang dipilih
-        pass
+        penulis = dapatkan_penulis_database()
+        for rekaman in (data if isinstance(data, list) else [data]):
+            penulis.tulis(rekaman)
+
+class SaluranEmail:
+    # Koneksi SMTP dibuka sekali (STARTTLS + login) lalu dipakai ulang; kalau diputus server, disambung ulang sekali
+    nama = 'email'
+
+    def __init__(self):
+        self._server = None
 
-def kirim_notifikasi(pesan):
-    if NOTIFIKASI_KONFIGURASI['KIRIM_EMAIL']:
+    def _sambung(self):
+        server = smtplib.SMTP(NOTIFIKASI_KONFIGURASI['SMTP_SERVER'], NOTIFIKASI_KONFIGURASI['SMTP_PORT'],
+                              timeout=NOTIFIKASI_KONFIGURASI['TIMEOUT_KIRIM'])
+        if NOTIFIKASI_KONFIGURASI['SMTP_STARTTLS']:
+            server.starttls()
+        if NOTIFIKASI_KONFIGURASI['EMAIL_PASSWORD']:
+            server.login(NOTIFIKASI_KONFIGURASI['EMAIL_PENGIRIM'], NOTIFIKASI_KONFIGURASI['EMAIL_PASSWORD'])
+        return server
+
+    def kirim(self, subjek, isi):
+        msg = MIMEText(isi)
+        msg['Subject'] = subjek
+        msg['From'] = NOTIFIKASI_KONFIGURASI['EMAIL_PENGIRIM']
+        msg['To'] = NOTIFIKASI_KONFIGURASI['EMAIL_PENERIMA']
+        for percobaan in range(2):
+            if self._server is None:
+                self._server = self._sambung()
+            try:
+                self._server.send_message(msg)
+                return
+            except (smtplib.SMTPServerDisconnected, ConnectionError):
+                # Koneksi idle biasanya diputus server; sambung ulang sekali
+                self._server = None
+                if percobaan:
+                    raise
+
+    def tutup(self):
+        if self._server is not None:
+            try:
+                self._server.quit()
+            except (smtplib.SMTPException, OSError):
+                self._server.close()
+            self._server = None
+
+class SaluranTelegram:
+    # Satu Bot dan satu event loop dipakai terus di thread pengirim, gak bikin loop baru lewat asyncio.run tiap pesan
+    nama = 'telegram'
+    MAKS_PANJANG = 4096
+
+    def __init__(self):
+        self._bot = None
+        self._loop = None
+
+    def kirim(self, subjek, isi):
+        if self._bot is None:
+            import telegram
+
+            self._loop = asyncio.new_event_loop()
+            base_url = NOTIFIKASI_KONFIGURASI['TELEGRAM_BASE_URL']
+            self._bot = telegram.Bot(token=NOTIFIKASI_KONFIGURASI['TELEGRAM_BOT_TOKEN'],
+                                     **({'base_url': base_url} if base_url else {}))
+            self._loop.run_until_complete(self._bot.initialize())
+        teks = f"{subjek}\n\n{isi}"
+        # Batas panjang pesan Telegram; digest panjang dipecah
+        for awal in range(0, len(teks), self.MAKS_PANJANG):
+            self._loop.run_until_complete(self._bot.send_message(
+                chat_id=NOTIFIKASI_KONFIGURASI['TELEGRAM_CHAT_ID'], text=teks[awal:awal + self.MAKS_PANJANG],
+                read_timeout=NOTIFIKASI_KONFIGURASI['TIMEOUT_KIRIM']))
+
+    def tutup(self):
+        if self._bot is not None:
+            try:
+                self._loop.run_until_complete(self._bot.shutdown())
+            finally:
+                self._loop.close()
+            self._bot = None
+            self._loop = None
+
+class PengirimNotifikasi:
+    # Thread latar: pesan masuk antrean, dikumpulkan selama JENDELA_DIGEST (atau sampai MAKS_PESAN_PER_DIGEST), lalu
+    # dikirim sebagai satu digest lewat semua saluran. Pemanggil gak pernah nunggu jaringan.
+    _SELESAI = object()
+
+    def __init__(self, daftar_saluran, jendela=NOTIFIKASI_KONFIGURASI['JENDELA_DIGEST'],
+                 maks_pesan=NOTIFIKASI_KONFIGURASI['MAKS_PESAN_PER_DIGEST'],
+                 ukuran_antrean=NOTIFIKASI_KONFIGURASI['UKURAN_ANTREAN']):
+        self.daftar_saluran = daftar_saluran
+        self.jendela = jendela
+        self.maks_pesan = maks_pesan
+        self.jumlah_digest = 0
+        self._dibuang = 0
+        self._kunci = threading.Lock()
+        self._antrean = queue.Queue(maxsize=ukuran_antrean)
+        self._thread = threading.Thread(target=self._jalan, name='pengirim-notifikasi', daemon=True)
+        self._thread.start()
+
+    def kirim(self, pesan):
         try:
-            msg = MIMEText(pesan)
-            msg['Subject'] = "Notifikasi Phantom Web"
-            msg['From'] = NOTIFIKASI_KONFIGURASI['EMAIL_PENGIRIM']
-            msg['To'] = NOTIFIKASI_KONFIGURASI['EMAIL_PENERIMA']
-
-            with smtplib.SMTP(NOTIFIKASI_KONFIGURASI['SMTP_SERVER'], NOTIFIKASI_KONFIGURASI['SMTP_PORT']) as server:
-                server.starttls()
-                server.login(NOTIFIKASI_KONFIGURASI['EMAIL_PENGIRIM'], NOTIFIKASI_KONFIGURASI['EMAIL_PASSWORD'])
-                server.send_message(msg)
-            console.print("[bold green]Notifikasi email berhasil dikirim.[/bold green]")
-        except Exception as e:
-            console.print(f"[bold red]Gagal mengirim notifikasi email: {str(e)}[/bold red]")
+            self._antrean.put_nowait((time.time(), pesan))
+        except queue.Full:
+            # Notifikasi gak boleh menahan crawl; yang dibuang disebut di digest berikutnya
+            with self._kunci:
+                self._dibuang += 1
+
+    def flush(self, timeout=None):
+        # Kirim yang sudah antre sekarang juga tanpa nunggu jendela habis; balikin False kalau timeout
+        penanda = threading.Event()
+        self._antrean.put(penanda)
+        return penanda.wait(timeout)
+
+    def _jalan(self):
+        selesai = False
+        while not selesai:
+            batch = []
+            penanda = None
+            item = self._antrean.get()
+            batas = time.monotonic() + self.jendela
+            while True:
+                if item is self._SELESAI:
+                    selesai = True
+                    break
+                if isinstance(item, threading.Event):
+                    penanda = item
+                    break
+                batch.append(item)
+                sisa = batas - time.monotonic()
+                if len(batch) >= self.maks_pesan or sisa <= 0:
+                    break
+                try:
+                    item = self._antrean.get(timeout=sisa)
+                except queue.Empty:
+                    break
+
+            with self._kunci:
+                dibuang, self._dibuang = self._dibuang, 0
+            if batch or dibuang:
+                self._kirim_digest(batch, dibuang)
+            if penanda is not None:
+                penanda.set()
+
+        for saluran in self.daftar_saluran:
+            try:
+                saluran.tutup()
+            except Exception as e:
+                logging.warning(f"Gagal menutup saluran notifikasi {saluran.nama}: {str(e)}")
+
+    def _kirim_digest(self, batch, dibuang):
+        if len(batch) == 1 and not dibuang:
+            subjek, isi = "Notifikasi Phantom Web", batch[0][1]
+        else:
+            subjek = f"Notifikasi Phantom Web ({len(batch) + dibuang} pesan)"
+            baris = [f"[{time.strftime('%H:%M:%S', time.localtime(waktu))}] {pesan}" for waktu, pesan in batch]
+            if dibuang:
+                baris.append(f"... dan {dibuang} pesan lain dibuang karena antrean notifikasi penuh")
+            isi = '\n'.join(baris)
+        self.jumlah_digest += 1
+        for saluran in self.daftar_saluran:
+            try:
+                with metrik.ukur('notifikasi'):
+                    saluran.kirim(subjek, isi)
+                logging.info(f"Notifikasi {saluran.nama} terkirim ({len(batch)} pesan)")
+            except Exception as e:
+                logging.error(f"Gagal mengirim notifikasi {saluran.nama}: {str(e)}")
+
+    def tutup(self):
+        # Pesan yang masih antre dikirim dulu, lalu koneksi SMTP/Telegram ditutup
+        self._antrean.put(self._SELESAI)
+        self._thread.join()
+
+_pengirim_notifikasi = None
+_kunci_pengirim_notifikasi = threading.Lock()
+
+def dapatkan_pengirim_notifikasi():
+    global _pengirim_notifikasi
+    with _kunci_pengirim_notifikasi:
+        if _pengirim_notifikasi is None:
+            daftar_saluran = []
+            if NOTIFIKASI_KONFIGURASI['KIRIM_EMAIL']:
+                daftar_saluran.append(SaluranEmail())
+            if NOTIFIKASI_KONFIGURASI['KIRIM_TELEGRAM']:
+                daftar_saluran.append(SaluranTelegram())
+            _pengirim_notifikasi = PengirimNotifikasi(daftar_saluran)
+            atexit.register(tutup_pengirim_notifikasi)
+        return _pengirim_notifikasi
+
+def tutup_pengirim_notifikasi():
+    global _pengirim_notifikasi
+    with _kunci_pengirim_notifikasi:
+        pengirim, _pengirim_notifikasi = _pengirim_notifikasi, None
+    if pengirim is not None:
+        pengirim.tutup()
+
+def kirim_notifikasi(pesan, segera=False):
+    # Pesan diantrekan ke pengirim latar dan dikirim sebagai digest; segera=True menunggu sampai terkirim
+    if not (NOTIFIKASI_KONFIGURASI['KIRIM_EMAIL'] or NOTIFIKASI_KONFIGURASI['KIRIM_TELEGRAM']):
+        return
+    pengirim = dapatkan_pengirim_notifikasi()
+    pengirim.kirim(pesan)
+    if segera:
+        pengirim.flush()
+
+@lru_cache(maxsize=None)
+def _dapatkan_klien_penyimpanan(jenis):
+    # Klien dibuat sekali per proses lalu dipakai ulang untuk semua unggahan
+    if jenis == 's3':
+        import boto3
+
+        return boto3.client('s3',
+                            aws_access_key_id=PENYIMPANAN_KONFIGURASI['AWS_ACCESS_KEY'],
+                            aws_secret_access_key=PENYIMPANAN_KONFIGURASI['AWS_SECRET_KEY'],
+                            endpoint_url=PENYIMPANAN_KONFIGURASI['S3_ENDPOINT_URL'])
+    if jenis == 'gcs':
+        from google.cloud import storage
+
+        client = storage.Client.from_service_account_json(PENYIMPANAN_KONFIGURASI['GCS_PRIVATE_KEY'])
+        return client.bucket(PENYIMPANAN_KONFIGURASI['BUCKET_NAMA'])
+    if jenis == 'azure':
+        from azure.storage.blob import BlobServiceClient
 
-    if NOTIFIKASI_KONFIGURASI['KIRIM_TELEGRAM']:
+        blob_service_client = BlobServiceClient.from_connection_string(PENYIMPANAN_KONFIGURASI['AZURE_CONNECTION_STRING'])
+        return blob_service_client.get_container_client(PENYIMPANAN_KONFIGURASI['BUCKET_NAMA'])
+    raise ValueError(f"Jenis penyimpanan tidak dikenal: {jenis}")
+
+class UnggahanBertahapS3:
+    def __init__(self, kunci):
+        self.kunci = kunci
+        self.klien = _dapatkan_klien_penyimpanan('s3')
+        self.id_unggahan = self.klien.create_multipart_upload(
+            Bucket=PENYIMPANAN_KONFIGURASI['BUCKET_NAMA'], Key=kunci,
+            ContentType='application/x-ndjson', ContentEncoding='gzip')['UploadId']
+
+    def unggah_bagian(self, nomor, data):
+        respons = self.klien.upload_part(Bucket=PENYIMPANAN_KONFIGURASI['BUCKET_NAMA'], Key=self.kunci,
+                                         PartNumber=nomor, UploadId=self.id_unggahan, Body=data)
+        return {'PartNumber': nomor, 'ETag': respons['ETag']}
+
+    def selesaikan(self, daftar_bagian):
+        self.klien.complete_multipart_upload(Bucket=PENYIMPANAN_KONFIGURASI['BUCKET_NAMA'], Key=self.kunci,
+                                             UploadId=self.id_unggahan,
+                                             MultipartUpload={'Parts': sorted(daftar_bagian, key=lambda b: b['PartNumber'])})
+
+    def batalkan(self):
+        self.klien.abort_multipart_upload(Bucket=PENYIMPANAN_KONFIGURASI['BUCKET_NAMA'], Key=self.kunci,
+                                          UploadId=self.id_unggahan)
+
+class UnggahanBertahapAzure:
+    def __init__(self, kunci):
+        self.blob_client = _dapatkan_klien_penyimpanan('azure').get_blob_client(kunci)
+
+    def unggah_bagian(self, nomor, data):
+        from azure.storage.blob import BlobBlock
+
+        id_blok = base64.b64encode(f"{nomor:08d}".encode()).decode()
+        self.blob_client.stage_block(id_blok, data)
+        return (nomor, BlobBlock(block_id=id_blok))
+
+    def selesaikan(self, daftar_bagian):
+        from azure.storage.blob import ContentSettings
+
+        self.blob_client.commit_block_list([blok for _, blok in sorted(daftar_bagian, key=lambda b: b[0])],
+                                           content_settings=ContentSettings(content_type='application/x-ndjson',
+                                                                            content_encoding='gzip'))
+
+    def batalkan(self):
+        pass  # blok yang belum di-commit dibuang otomatis oleh Azure
+
+UNGGAHAN_BERTAHAP = {
+    's3': UnggahanBertahapS3,
+    'azure': UnggahanBertahapAzure
+}
+
+_pengunggah = None
+_kunci_pengunggah = threading.Lock()
+
+def _dapatkan_pengunggah():
+    global _pengunggah
+    with _kunci_pengunggah:
+        if _pengunggah is None:
+            _pengunggah = concurrent.futures.ThreadPoolExecutor(
+                max_workers=PENYIMPANAN_KONFIGURASI['UNGGAHAN_PARALEL'], thread_name_prefix='pengunggah')
+        return _pengunggah
+
+class PenulisUnggahan(PenulisJSONL):
+    # NDJSON gzip ditulis ke berkas spool. Spool dipecah jadi bagian (tiap bagian berisi member gzip utuh, jadi
+    # gabungannya tetap gzip yang valid), dan tiap bagian yang penuh langsung diunggah di latar selagi crawl jalan.
+    def __init__(self, nama_file, jenis=None):
+        self.jenis = jenis or PENYIMPANAN_KONFIGURASI['JENIS_PENYIMPANAN']
+        self.kunci = nama_file if nama_file.endswith('.ndjson.gz') else f"{nama_file}.ndjson.gz"
+        if PENYIMPANAN_KONFIGURASI['SIMPAN_HASIL_SEMENTARA']:
+            direktori = OUTPUT_KONFIGURASI['DIREKTORI_OUTPUT']
+            os.makedirs(direktori, exist_ok=True)
+        else:
+            direktori = tempfile.gettempdir()
+        self.nama_file = os.path.join(direktori, os.path.basename(self.kunci))
+        self.ukuran_bagian = PENYIMPANAN_KONFIGURASI['UKURAN_BAGIAN_UNGGAH']
+        self.jumlah = 0
+        self.future = None
+        self._penutup = []
+        self._spool = open(self.nama_file, 'wb')
+        self._awal_bagian = 0
+        self._nomor_bagian = 0
+        self._bagian_berjalan = []
+        klas_unggahan = UNGGAHAN_BERTAHAP.get(self.jenis)
+        self._unggahan = klas_unggahan(self.kunci) if klas_unggahan else None
+        self._buka_member()
+
+    def _buka_member(self):
+        self._mentah_member = 0
+        self._berkas = io.TextIOWrapper(gzip.GzipFile(fileobj=self._spool, mode='wb'), encoding='utf-8', newline='')
+
+    def _tulis(self, rekaman):
+        baris = json.dumps(rekaman, ensure_ascii=False, default=_ke_json) + '\n'
+        self._berkas.write(baris)
+        self._mentah_member += len(baris)
+        if self._mentah_member >= self.ukuran_bagian:
+            self._berkas.close()
+            if self._unggahan and self._spool.tell() - self._awal_bagian >= self.ukuran_bagian:
+                self._kirim_bagian()
+            self._buka_member()
+
+    def _kirim_bagian(self):
+        # Bagian dibaca ulang dari spool, jadi memori cuma sebesar bagian yang sedang diunggah
+        akhir = self._spool.tell()
+        self._spool.flush()
+        self._nomor_bagian += 1
+        self._bagian_berjalan.append(_dapatkan_pengunggah().submit(
+            self._unggah_rentang, self._nomor_bagian, self._awal_bagian, akhir - self._awal_bagian))
+        self._awal_bagian = akhir
+        # Tahan penulis kalau unggahan ketinggalan jauh
+        while len([f for f in self._bagian_berjalan if not f.done()]) > PENYIMPANAN_KONFIGURASI['UNGGAHAN_PARALEL'] * 2:
+            concurrent.futures.wait(self._bagian_berjalan, return_when=concurrent.futures.FIRST_COMPLETED)
+
+    def _unggah_rentang(self, nomor, awal, ukuran):
+        with open(self.nama_file, 'rb') as f:
+            f.seek(awal)
+            data = f.read(ukuran)
+        with metrik.ukur('unggah'):
+            hasil = self._unggahan.unggah_bagian(nomor, data)
+        metrik.tambah('byte_diunggah', len(data))
+        return hasil
+
+    def _selesaikan(self):
         try:
-            bot = telegram.Bot(token=NOTIFIKASI_KONFIGURASI['TELEGRAM_BOT_TOKEN'])
-            asyncio.run(bot.send_message(chat_id=NOTIFIKASI_KONFIGURASI['TELEGRAM_CHAT_ID'], text=pesan))
-            console.print("[bold green]Notifikasi Telegram berhasil dikirim.[/bold green]")
+            if self._unggahan:
+                self._unggahan.selesaikan([future.result() for future in self._bagian_berjalan])
+            else:
+                with open(self.nama_file, 'rb') as f:
+                    blob = _dapatkan_klien_penyimpanan(self.jenis).blob(self.kunci, chunk_size=self.ukuran_bagian)
+                    blob.content_encoding = 'gzip'
+                    blob.upload_from_file(f, content_type='application/x-ndjson')
         except Exception as e:
-            console.print(f"[bold red]Gagal mengirim notifikasi Telegram: {str(e)}[/bold red]")
+            logging.error(f"Gagal mengunggah {self.kunci}: {str(e)}")
+            if self._unggahan:
+                self._unggahan.batalkan()
+            raise
+
+        if PENYIMPANAN_KONFIGURASI['HAPUS_HASIL_SETELAH_UPLOAD'] or not PENYIMPANAN_KONFIGURASI['SIMPAN_HASIL_SEMENTARA']:
+            os.remove(self.nama_file)
+        logging.info(f"Unggahan {self.kunci} selesai ({self.jumlah} rekaman)")
+        return self.kunci
 
-def simpan_hasil(data, nama_file):
+    def tutup(self):
+        self._berkas.close()
+        if self._unggahan and (self._spool.tell() > self._awal_bagian or not self._bagian_berjalan):
+            self._kirim_bagian()
+        self._spool.close()
+        # Unggahan diselesaikan di latar; future-nya dibalikin biar pemanggil bisa menunggu & melaporkan galatnya
+        self.future = _dapatkan_pengunggah().submit(self._selesaikan)
+        return self.future
+
+def simpan_hasil(data, nama_file, tunggu=True):
+    # Penyimpanan cloud: NDJSON gzip dialirkan lewat unggahan bertahap; tunggu=False balikin future biar bisa jalan di latar
     if PENYIMPANAN_KONFIGURASI['JENIS_PENYIMPANAN'] == 'lokal':
         with open(nama_file, 'w', encoding='utf-8') as f:
             json.dump(data, f, ensure_ascii=False, indent=4)
-    elif PENYIMPANAN_KONFIGURASI['JENIS_PENYIMPANAN'] == 's3':
-        s3 = boto3.client('s3',
-                          aws_access_key_id=PENYIMPANAN_KONFIGURASI['AWS_ACCESS_KEY'],
-                          aws_secret_access_key=PENYIMPANAN_KONFIGURASI['AWS_SECRET_KEY'])
-        s3.put_object(Bucket=PENYIMPANAN_KONFIGURASI['BUCKET_NAMA'],
-                      Key=nama_file,
-                      Body=json.dumps(data, ensure_ascii=False, indent=4))
-    elif PENYIMPANAN_KONFIGURASI['JENIS_PENYIMPANAN'] == 'gcs':
-        client = storage.Client.from_service_account_json(PENYIMPANAN_KONFIGURASI['GCS_PRIVATE_KEY'])
-        bucket = client.get_bucket(PENYIMPANAN_KONFIGURASI['BUCKET_NAMA'])
-        blob = bucket.blob(nama_file)
-        blob.upload_from_string(json.dumps(data, ensure_ascii=False, indent=4))
-    elif PENYIMPANAN_KONFIGURASI['JENIS_PENYIMPANAN'] == 'azure':
-        blob_service_client = BlobServiceClient.from_connection_string(PENYIMPANAN_KONFIGURASI['AZURE_CONNECTION_STRING'])
-        container_client = blob_service_client.get_container_client(PENYIMPANAN_KONFIGURASI['BUCKET_NAMA'])
-        blob_client = container_client.get_blob_client(nama_file)
-        blob_client.upload_blob(json.dumps(data, ensure_ascii=False, indent=4))
-
-def buat_visualisasi(data):
-    if VISUALISASI_KONFIGURASI['BUAT_GRAFIK']:
-        plt.figure(figsize=(10, 6))
-        plt.style.use(VISUALISASI_KONFIGURASI['WARNA_TEMA'])
-        
+        return None
+
+    with PenulisUnggahan(nama_file) as penulis:
+        for rekaman in (data if isinstance(data, list) else [data]):
+            penulis.tulis(rekaman)
+    if tunggu:
+        penulis.future.result()
+    return penulis.future
+
+def _nama_berkas_grafik(direktori, nama, ekstensi=None):
+    # Nama unik (waktu + acak) biar render paralel maupun run berikutnya gak saling timpa
+    ekstensi = ekstensi or VISUALISASI_KONFIGURASI['FORMAT_GRAFIK']
+    return os.path.join(direktori, f"{nama}-{time.strftime('%Y%m%d-%H%M%S')}-{os.urandom(3).hex()}.{ekstensi}")
+
+def buat_visualisasi(data, tampilkan=VISUALISASI_KONFIGURASI['TAMPILKAN_GRAFIK']):
+    # Grafik satu halaman (menu 6). Tanpa tampilkan, pyplot gak disentuh sama sekali, jadi aman di server tanpa layar.
+    if not VISUALISASI_KONFIGURASI['BUAT_GRAFIK']:
+        return None
+    import matplotlib.style
+    from matplotlib.figure import Figure
+
+    with matplotlib.style.context(VISUALISASI_KONFIGURASI['WARNA_TEMA']):
+        if tampilkan:
+            import matplotlib.pyplot as plt
+            fig = plt.figure(figsize=(10, 6))
+        else:
+            fig = Figure(figsize=(10, 6))
+        ax = fig.add_subplot()
+
         if 'pie' in VISUALISASI_KONFIGURASI['JENIS_GRAFIK']:
-            plt.pie(data.values(), labels=data.keys(), autopct='%1.1f%%')
-            plt.title('Distribusi Data')
-        
+            ax.pie(list(data.values()), labels=list(data.keys()), autopct='%1.1f%%')
+            ax.set_title('Distribusi Data')
+
         if 'bar' in VISUALISASI_KONFIGURASI['JENIS_GRAFIK']:
-            plt.bar(data.keys(), data.values())
-            plt.title('Grafik Batang Data')
-        
+            ax.bar(list(data.keys()), list(data.values()))
+            ax.set_title('Grafik Batang Data')
+
         if 'line' in VISUALISASI_KONFIGURASI['JENIS_GRAFIK']:
-            plt.plot(data.keys(), data.values())
-            plt.title('Grafik Garis Data')
-        
+            ax.plot(list(data.keys()), list(data.values()))
+            ax.set_title('Grafik Garis Data')
+
         if VISUALISASI_KONFIGURASI['TAMPILKAN_LEGENDA']:
-            plt.legend()
-        
-        plt.tight_layout()
-        
-        if VISUALISASI_KONFIGURASI['SIMPAN_GRAFIK']:
-            plt.savefig(f"grafik.{VISUALISASI_KONFIGURASI['FORMAT_GRAFIK']}", dpi=VISUALISASI_KONFIGURASI['DPI_GRAFIK'])
-            console.print(f"[bold green]Grafik telah disimpan sebagai grafik.{VISUALISASI_KONFIGURASI['FORMAT_GRAFIK']}[/bold green]")
-        
+            ax.legend()
+
+        fig.tight_layout()
+
+    nama_file = None
+    if VISUALISASI_KONFIGURASI['SIMPAN_GRAFIK']:
+        os.makedirs(VISUALISASI_KONFIGURASI['DIREKTORI_GRAFIK'], exist_ok=True)
+        nama_file = _nama_berkas_grafik(VISUALISASI_KONFIGURASI['DIREKTORI_GRAFIK'], 'grafik')
+        fig.savefig(nama_file, dpi=VISUALISASI_KONFIGURASI['DPI_GRAFIK'])
+        console.print(f"[bold green]Grafik telah disimpan sebagai {nama_file}[/bold green]")
+
+    if tampilkan:
         plt.show()
+    return nama_file
+
+KOLOM_METRIK_HALAMAN = {
+    'waktu_muat': 'Waktu Muat (s)',
+    'ukuran_konten': 'Ukuran Konten (byte)',
+    'jumlah_tag': 'Jumlah Tag',
+    'jumlah_tautan': 'Jumlah Tautan',
+    'jumlah_gambar': 'Jumlah Gambar'
+}
+
+class AgregatMetrikCrawl:
+    # Metrik per halaman satu crawl dikumpulkan per kolom (array 'd', 8 byte per angka), lalu histogram & persentil
+    # dihitung sekaligus pakai NumPy. Bisa langsung dipakai sebagai sink crawler, jadi rekamannya gak perlu disimpan.
+    def __init__(self):
+        self._kolom = {nama: array.array('d') for nama in KOLOM_METRIK_HALAMAN}
+        self.jumlah_halaman = 0
+
+    def tambah(self, rekaman):
+        statistik = rekaman.get('statistik')
+        if not statistik:
+            return
+        self.jumlah_halaman += 1
+        for nama, kolom in self._kolom.items():
+            nilai = statistik.get(nama)
+            kolom.append(math.nan if nilai is None else nilai)
+
+    __call__ = tambah
+
+    def larik(self):
+        # Salinan, biar array di atas tetap bisa ditambah setelah ini
+        import numpy as np
+        return {nama: np.frombuffer(kolom, dtype=np.float64).copy() for nama, kolom in self._kolom.items()}
+
+    def ringkasan(self, persentil=VISUALISASI_KONFIGURASI['PERSENTIL_DASHBOARD']):
+        import numpy as np
+        hasil = {'jumlah_halaman': self.jumlah_halaman}
+        for nama, nilai in self.larik().items():
+            nilai = nilai[np.isfinite(nilai)]
+            if not nilai.size:
+                hasil[nama] = {'jumlah': 0}
+                continue
+            hasil[nama] = {'jumlah': int(nilai.size), 'rata_rata': float(nilai.mean()), 'min': float(nilai.min()),
+                           'maks': float(nilai.max()), 'total': float(nilai.sum())}
+            for p, titik in zip(persentil, np.percentile(nilai, persentil)):
+                hasil[nama][f'p{p}'] = float(titik)
+        return hasil
+
+    def histogram(self, jumlah_bin=VISUALISASI_KONFIGURASI['JUMLAH_BIN_HISTOGRAM']):
+        import numpy as np
+        hasil = {}
+        for nama, nilai in self.larik().items():
+            nilai = nilai[np.isfinite(nilai)]
+            if nilai.size:
+                hasil[nama] = np.histogram(nilai, bins=jumlah_bin)
+        return hasil
+
+def _gambar_grafik(tugas):
+    # Satu grafik dashboard: cuma Figure + backend Agg (tanpa pyplot), bisa jalan di proses pekerja.
+    # Data yang dikirim sudah diringkas (histogram, persentil, sampel), bukan rekaman mentah.
+    import matplotlib.style
+    from matplotlib.figure import Figure
+
+    jenis, judul, data, nama_file = tugas
+    with matplotlib.style.context(VISUALISASI_KONFIGURASI['WARNA_TEMA']):
+        fig = Figure(figsize=(10, 6))
+        ax = fig.add_subplot()
+        if jenis == 'histogram':
+            jumlah, tepi = data
+            ax.stairs(jumlah, tepi, fill=True)
+            ax.set_xlabel(judul)
+            ax.set_ylabel('Jumlah halaman')
+        elif jenis == 'persentil':
+            label, nilai = data
+            ax.bar(label, nilai)
+            ax.set_ylabel(judul)
+        elif jenis == 'sebar':
+            x, y, label_x, label_y = data
+            ax.scatter(x, y, s=4, alpha=0.4)
+            ax.set_xlabel(label_x)
+            ax.set_ylabel(label_y)
+        ax.set_title(judul)
+        fig.tight_layout()
+        fig.savefig(nama_file, dpi=VISUALISASI_KONFIGURASI['DPI_GRAFIK'])
+    return nama_file
+
+def buat_dashboard_crawl(sumber, direktori=VISUALISASI_KONFIGURASI['DIREKTORI_GRAFIK'],
+                         jumlah_proses=VISUALISASI_KONFIGURASI['PROSES_RENDER']):
+    # sumber: AgregatMetrikCrawl, atau iterable rekaman hasil crawl. Semua grafik dirender sekali jalan tanpa jendela;
+    # ringkasannya ikut disimpan sebagai JSON. Balikin (ringkasan, daftar berkas).
+    import numpy as np
+
+    if isinstance(sumber, AgregatMetrikCrawl):
+        agregat = sumber
+    else:
+        agregat = AgregatMetrikCrawl()
+        for rekaman in sumber:
+            agregat.tambah(rekaman)
+    ringkasan = agregat.ringkasan()
+    os.makedirs(direktori, exist_ok=True)
+
+    tugas = []
+    for nama, histogram in agregat.histogram().items():
+        tugas.append(('histogram', f"Sebaran {KOLOM_METRIK_HALAMAN[nama]}", histogram,
+                      _nama_berkas_grafik(direktori, f"histogram_{nama}")))
+        statistik = ringkasan[nama]
+        label = [kunci for kunci in statistik if kunci.startswith('p')] + ['maks']
+        tugas.append(('persentil', KOLOM_METRIK_HALAMAN[nama], (label, [statistik[kunci] for kunci in label]),
+                      _nama_berkas_grafik(direktori, f"persentil_{nama}")))
+
+    larik = agregat.larik()
+    x, y = larik['ukuran_konten'], larik['waktu_muat']
+    terisi = np.isfinite(x) & np.isfinite(y)
+    x, y = x[terisi], y[terisi]
+    if x.size:
+        if x.size > VISUALISASI_KONFIGURASI['MAKS_TITIK_SEBAR']:
+            sampel = np.random.default_rng(0).choice(x.size, VISUALISASI_KONFIGURASI['MAKS_TITIK_SEBAR'], replace=False)
+            x, y = x[sampel], y[sampel]
+        tugas.append(('sebar', 'Ukuran vs Waktu Muat', (x, y, KOLOM_METRIK_HALAMAN['ukuran_konten'],
+                                                        KOLOM_METRIK_HALAMAN['waktu_muat']),
+                      _nama_berkas_grafik(direktori, 'sebar_ukuran_waktu')))
+
+    if jumlah_proses and jumlah_proses > 1 and len(tugas) > 1:
+        with buat_pool_proses(min(jumlah_proses, len(tugas))) as pool:
+            daftar_berkas = list(pool.map(_gambar_grafik, tugas))
+    else:
+        daftar_berkas = [_gambar_grafik(satu) for satu in tugas]
+
+    nama_ringkasan = _nama_berkas_grafik(direktori, 'ringkasan', 'json')
+    with open(nama_ringkasan, 'w', encoding='utf-8') as f:
+        json.dump(ringkasan, f, ensure_ascii=False, indent=2)
+    return ringkasan, daftar_berkas + [nama_ringkasan]
 
 def periksa_pembaruan():
     versi_saat_ini = "9.9.9"  
     url_pembaruan = "https://api.github.com/repos/syaaikoo/phantom-web/releases/latest"
     try:
-        response = requests.get(url_pembaruan)
+        response = dapatkan_sesi().get(url_pembaruan, timeout=KINERJA_KONFIGURASI['TIMEOUT_PERMINTAAN'])
         data = response.json()
         versi_terbaru = data['tag_name']
         if versi_terbaru > versi_saat_ini:
@@ -361,6 +3646,173 @@ def periksa_pembaruan():
     except:
         console.print("[bold red]Gagal memeriksa pembaruan.[/bold red]")
 
+def baca_daftar_url(sumber):
+    # sumber: path berkas atau '-' untuk stdin; baris kosong dan komentar (#) dilewati
+    berkas = sys.stdin if sumber == '-' else open(sumber, 'r', encoding='utf-8')
+    try:
+        for baris in berkas:
+            url = baris.strip()
+            if url and not url.startswith('#'):
+                yield url
+    finally:
+        if berkas is not sys.stdin:
+            berkas.close()
+
+def hitung_persentil(nilai_terurut, persentil):
+    if not nilai_terurut:
+        return None
+    posisi = (len(nilai_terurut) - 1) * persentil / 100
+    bawah = math.floor(posisi)
+    atas = math.ceil(posisi)
+    if bawah == atas:
+        return nilai_terurut[bawah]
+    return nilai_terurut[bawah] + (nilai_terurut[atas] - nilai_terurut[bawah]) * (posisi - bawah)
+
+def _audit_url(url, gunakan_cache):
+    mulai = time.perf_counter()
+    rekaman = {'url': url, 'status': 'ok', 'waktu_muat': None, 'ukuran_konten': None,
+               'sumber_eksternal': None, 'error': None}
+    if not url_valid(url):
+        rekaman['status'] = 'tidak_valid'
+        rekaman['error'] = "URL tidak valid"
+    else:
+        try:
+            _, waktu_muat, ukuran_konten, sumber_eksternal = ambil_kode_sumber(url, gunakan_cache)
+            rekaman['waktu_muat'] = waktu_muat
+            rekaman['ukuran_konten'] = ukuran_konten
+            rekaman['sumber_eksternal'] = sumber_eksternal
+        except KontenDitolak as e:
+            rekaman['status'] = 'ditolak'
+            rekaman['error'] = e.alasan
+        except Exception as e:
+            rekaman['status'] = 'gagal'
+            rekaman['error'] = str(e)
+    rekaman['durasi'] = time.perf_counter() - mulai
+    return rekaman
+
+def audit_massal(daftar_url, sink=None, konkurensi=KINERJA_KONFIGURASI['MAKS_KONKURENSI'], gunakan_cache=True):
+    # Ambil & audit banyak URL sekaligus; rekaman dialirkan ke sink satu per satu, yang disimpan cuma angka latensi
+    latensi = []
+    jumlah_status = Counter()
+    mulai = time.perf_counter()
+
+    def tangani(selesai):
+        for future in selesai:
+            rekaman = future.result()
+            jumlah_status[rekaman['status']] += 1
+            if rekaman['status'] == 'ok':
+                latensi.append(rekaman['durasi'])
+            if sink:
+                sink(rekaman)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=konkurensi) as executor:
+        berjalan = set()
+        for url in daftar_url:
+            berjalan.add(executor.submit(_audit_url, url, gunakan_cache))
+            # Jendela terbatas biar daftar 10k URL gak jadi 10k future sekaligus
+            if len(berjalan) >= konkurensi * 2:
+                selesai, berjalan = concurrent.futures.wait(berjalan, return_when=concurrent.futures.FIRST_COMPLETED)
+                tangani(selesai)
+        tangani(concurrent.futures.as_completed(berjalan))
+
+    durasi_total = time.perf_counter() - mulai
+    latensi.sort()
+    jumlah_url = sum(jumlah_status.values())
+    return {
+        'jumlah_url': jumlah_url,
+        'status': dict(jumlah_status),
+        'durasi_total': durasi_total,
+        'url_per_detik': jumlah_url / durasi_total if durasi_total else 0.0,
+        'latensi': {
+            'p50': hitung_persentil(latensi, 50),
+            'p90': hitung_persentil(latensi, 90),
+            'p99': hitung_persentil(latensi, 99),
+            'maks': latensi[-1] if latensi else None
+        },
+        'koneksi': statistik_koneksi()
+    }
+
+def buat_parser_cli():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Phantom Web tanpa menu interaktif")
+    subparsers = parser.add_subparsers(dest='perintah', required=True)
+
+    massal = subparsers.add_parser('massal', help="ambil dan audit banyak URL dari berkas atau stdin")
+    massal.add_argument('sumber', help="berkas daftar URL (satu per baris), atau '-' untuk stdin")
+    massal.add_argument('-o', '--output', default='-', help="berkas hasil (bawaan: stdout)")
+    massal.add_argument('-f', '--format', default='jsonl', choices=sorted(PENULIS_EKSPOR), help="format hasil")
+    massal.add_argument('-k', '--konkurensi', type=int, default=KINERJA_KONFIGURASI['MAKS_KONKURENSI'],
+                        help="jumlah permintaan yang jalan bersamaan")
+    massal.add_argument('--tanpa-cache', action='store_true', help="selalu ambil ulang, abaikan cache respons")
+    massal.add_argument('--laporan', help="tulis laporan metrik per tahap (JSON) ke berkas ini")
+
+    koordinator = subparsers.add_parser('koordinator', help="crawl terdistribusi: isi frontier bersama, jalankan "
+                                                           "pekerja lokal, lalu gabungkan hasilnya")
+    koordinator.add_argument('url', nargs='+', help="URL dasar yang dijelajahi")
+    koordinator.add_argument('-o', '--output', default='-', help="berkas hasil gabungan (bawaan: stdout)")
+    koordinator.add_argument('-f', '--format', default='jsonl', choices=sorted(PENULIS_EKSPOR), help="format hasil")
+    koordinator.add_argument('-n', '--maks-halaman', type=int, default=CRAWLING_KONFIGURASI['MAKS_HALAMAN_PER_DOMAIN'],
+                             help="batas halaman per URL dasar")
+    koordinator.add_argument('-p', '--pekerja', type=int, default=CRAWLING_KONFIGURASI['JUMLAH_PEKERJA'],
+                             help="jumlah pekerja lokal (0: cuma pakai pekerja di mesin lain)")
+    koordinator.add_argument('--frontier', default=CRAWLING_KONFIGURASI['FILE_FRONTIER_BERSAMA'],
+                             help="berkas SQLite frontier bersama")
+    koordinator.add_argument('--tanpa-sitemap', action='store_true', help="jangan isi antrean awal dari sitemap")
+    koordinator.add_argument('--dashboard', metavar='DIREKTORI',
+                             help="render dashboard grafik metrik halaman (histogram, persentil) ke direktori ini")
+
+    pekerja = subparsers.add_parser('pekerja', help="ikut mengerjakan crawl terdistribusi dari frontier bersama")
+    pekerja.add_argument('--frontier', default=CRAWLING_KONFIGURASI['FILE_FRONTIER_BERSAMA'],
+                         help="berkas SQLite frontier bersama")
+    pekerja.add_argument('--id', help="nama pekerja (bawaan: host-pid)")
+    return parser
+
+def jalankan_cli(argumen):
+    args = buat_parser_cli().parse_args(argumen)
+    # Ringkasan ke stderr biar stdout tetap bersih buat rekaman
+    konsol_status = Console(stderr=True)
+
+    if args.perintah == 'massal':
+        metrik.reset()
+        jalankan_server_metrik()
+        with buka_penulis_ekspor(args.format, args.output) as penulis:
+            ringkasan = audit_massal(baca_daftar_url(args.sumber), sink=penulis, konkurensi=args.konkurensi,
+                                     gunakan_cache=not args.tanpa_cache)
+        konsol_status.print(f"[bold green]Selesai mengaudit {ringkasan['jumlah_url']} URL dalam "
+                            f"{ringkasan['durasi_total']:.2f} detik ({ringkasan['url_per_detik']:.1f} URL/detik)[/bold green]")
+        konsol_status.print(f"Status: {ringkasan['status']}")
+        latensi = ringkasan['latensi']
+        if latensi['p50'] is not None:
+            konsol_status.print(f"Latensi p50: {latensi['p50']:.3f}s, p90: {latensi['p90']:.3f}s, "
+                                f"p99: {latensi['p99']:.3f}s, maks: {latensi['maks']:.3f}s")
+        if args.output != '-':
+            konsol_status.print(f"[bold green]Hasil disimpan sebagai {penulis.nama_file}[/bold green]")
+        if args.laporan:
+            metrik.tulis_laporan(args.laporan, ringkasan_audit=ringkasan)
+            konsol_status.print(f"[bold green]Laporan metrik disimpan sebagai {args.laporan}[/bold green]")
+
+    elif args.perintah == 'koordinator':
+        agregat = AgregatMetrikCrawl()
+
+        def sink(rekaman):
+            penulis.tulis(rekaman)
+            agregat.tambah(rekaman)
+
+        with buka_penulis_ekspor(args.format, args.output) as penulis:
+            jelajahi_terdistribusi(args.url, args.maks_halaman, sink=sink, path=args.frontier,
+                                   jumlah_pekerja=args.pekerja, gunakan_sitemap=not args.tanpa_sitemap)
+        konsol_status.print(f"[bold green]Selesai: {penulis.jumlah} halaman dari {len(args.url)} URL dasar[/bold green]")
+        if args.output != '-':
+            konsol_status.print(f"[bold green]Hasil disimpan sebagai {penulis.nama_file}[/bold green]")
+        if args.dashboard:
+            _, daftar_berkas = buat_dashboard_crawl(agregat, args.dashboard)
+            konsol_status.print(f"[bold green]{len(daftar_berkas)} berkas dashboard disimpan di {args.dashboard}[/bold green]")
+
+    elif args.perintah == 'pekerja':
+        jumlah = jalankan_pekerja(args.frontier, args.id)
+        konsol_status.print(f"[bold green]Pekerja selesai: {jumlah} halaman[/bold green]")
+
 def tampilkan_banner():
     banner = """
 ██████╗ ██╗  ██╗ █████╗ ███╗   ██╗████████╗ ██████╗ ███╗   ███╗    ██╗    ██╗███████╗██████╗ 
@@ -383,16 +3835,73 @@ def tampilkan_menu():
     table.add_row("5", "Analisis sentimen dan ekstraksi kata kunci")
     table.add_row("6", "Buat visualisasi data")
     table.add_row("7", "Periksa pembaruan")
-    table.add_row("8", "Keluar")
+    table.add_row("8", "Lanjutkan penjelajahan")
+    table.add_row("9", "Keluar")
     console.print(table)
 
+def _minta_penulis_ekspor():
+    simpan = console.input("[bold yellow]Simpan hasil penjelajahan? (y/n): [/bold yellow]").lower()
+    if simpan != 'y':
+        return None, None
+    nama_file = console.input("[bold green]Masuk in nama file: [/bold green]")
+    format_ekspor = console.input("[bold green]Pilih format ekspor (json/jsonl/xml/csv): [/bold green]").lower()
+    if format_ekspor not in PENULIS_EKSPOR:
+        console.print("[bold red]Format gak valid njirr Menyimpan sebagai JSON.[/bold red]")
+        format_ekspor = 'json'
+    # Hasil ditulis sambil jalan, jadi gak perlu nunggu semua halaman kekumpul di memori
+    penulis = buka_penulis_ekspor(format_ekspor, nama_file)
+    unggahan = None
+    if PENYIMPANAN_KONFIGURASI['JENIS_PENYIMPANAN'] != 'lokal':
+        unggahan = PenulisUnggahan(nama_file)
+        penulis = PenulisGabungan([penulis, unggahan])
+    return penulis, unggahan
+
+def _jalankan_crawl_interaktif(jalankan):
+    penulis, unggahan = _minta_penulis_ekspor()
+    # Metrik dashboard dikumpulkan sambil jalan, jadi tetap bisa dibuat walau rekamannya gak ditahan di memori
+    agregat = AgregatMetrikCrawl() if VISUALISASI_KONFIGURASI['BUAT_GRAFIK'] else None
+
+    def sink(rekaman):
+        if penulis:
+            penulis.tulis(rekaman)
+        if agregat is not None:
+            agregat.tambah(rekaman)
+
+    try:
+        # Kalau hasil ditulis ke file, rekaman gak perlu ditahan di memori
+        hasil = jalankan(sink, penulis is not None)
+    finally:
+        if penulis:
+            penulis.tutup()
+    console.print(f"[bold green]Berhasil menjelajahi {penulis.jumlah if penulis else len(hasil)} halaman[/bold green]")
+    if agregat is not None and agregat.jumlah_halaman and \
+            console.input("[bold green]Buat dashboard grafik dari hasil crawl? (y/n): [/bold green]").lower() == 'y':
+        with console.status("[bold green]Membuat dashboard...[/bold green]"):
+            _, daftar_berkas = buat_dashboard_crawl(agregat)
+        console.print(f"[bold green]{len(daftar_berkas)} berkas dashboard disimpan di "
+                      f"{VISUALISASI_KONFIGURASI['DIREKTORI_GRAFIK']}[/bold green]")
+    statistik = statistik_koneksi()
+    console.print(f"Koneksi baru: {statistik['koneksi_baru']}, koneksi dipakai ulang: {statistik['koneksi_dipakai_ulang']}")
+    if penulis:
+        console.print(f"[bold green]File telah disimpan sebagai {penulis.nama_file}[/bold green]")
+    if unggahan:
+        with console.status("[bold green]Menunggu unggahan selesai...[/bold green]"):
+            try:
+                kunci = unggahan.future.result()
+            except Exception as e:
+                console.print(f"[bold red]Unggahan {unggahan.kunci} gagal: {str(e)}[/bold red]")
+            else:
+                console.print(f"[bold green]Hasil diunggah ke {PENYIMPANAN_KONFIGURASI['JENIS_PENYIMPANAN']} "
+                              f"sebagai {kunci}[/bold green]")
+
 def main():
     tampilkan_banner()
-    periksa_pembaruan()
+    if KONFIGURASI['PERIKSA_PEMBARUAN_SAAT_MULAI']:
+        periksa_pembaruan()
     
     while True:
         tampilkan_menu()
-        pilihan = console.input("[bold yellow]Pilih opsi (1-8): [/bold yellow]")
+        pilihan = console.input("[bold yellow]Pilih opsi (1-9): [/bold yellow]")
         
         if pilihan == "1":
             url = console.input("[bold green]Masukkin URL nya disini, pasti in bener yahh: [/bold green]")
@@ -430,18 +3939,10 @@ def main():
                 console.print("[bold red]Jumlah halaman harus berupa angka. Silakan coba lagi.[/bold red]")
                 continue
             
-            hasil = jelajahi_tautan_internal(url, maks_halaman)
-            console.print(f"[bold green]Berhasil menjelajahi {len(hasil)} halaman[/bold green]")
-            
-            simpan = console.input("[bold yellow]Simpan hasil penjelajahan? (y/n): [/bold yellow]").lower()
-            if simpan == 'y':
-                nama_file = console.input("[bold green]Masuk in nama file: [/bold green]")
-                format_ekspor = console.input("[bold green]Pilih format ekspor (json/xml/csv): [/bold green]").lower()
-                if format_ekspor in ['json', 'xml', 'csv']:
-                    ekspor_ke_format(hasil, format_ekspor, nama_file)
-                else:
-                    console.print("[bold red]Format gak valid njirr Menyimpan sebagai JSON.[/bold red]")
-                    ekspor_ke_format(hasil, 'json', nama_file)
+            nama_crawl = console.input("[bold green]Nama crawl buat checkpoint (kosongin kalau gak perlu): [/bold green]").strip()
+            _jalankan_crawl_interaktif(
+                lambda sink, hemat: jelajahi_tautan_internal(url, maks_halaman, sink=sink, nama_crawl=nama_crawl or None,
+                                                             hemat_memori=hemat))
         
         elif pilihan == "3":
             url = console.input("[bold green]Masukkin URL nya disini, pasti in bener yahh: [/bold green]")
@@ -486,12 +3987,12 @@ def main():
             with console.status("[bold green]Menganalisis sentimen dan mengekstrak kata kunci...[/bold green]") as status:
                 try:
                     konten_html, _, _, _ = ambil_kode_sumber(url)
-                    soup = parse_html(konten_html)
-                    teks = soup.get_text()
+                    teks = dapatkan_dokumen(konten_html).teks
                     
-                    sentimen = analisis_sentimen(teks)
-                    kata_kunci = ekstraksi_kata_kunci(teks)
-                    ringkasan = ringkas_teks(teks)
+                    analisis = analisis_teks(teks)
+                    sentimen = analisis['sentimen']
+                    kata_kunci = analisis['kata_kunci']
+                    ringkasan = analisis['ringkasan']
                     
                     console.print(f"[bold green]Hasil analisis untuk {url}:[/bold green]")
                     if sentimen is not None:
@@ -499,6 +4000,8 @@ def main():
                     console.print(f"Kata kunci: {', '.join(kata_kunci)}")
                     if ringkasan:
                         console.print(f"Ringkasan: {ringkasan}")
+                    if analisis['bahasa']:
+                        console.print(f"Bahasa: {analisis['bahasa']}")
                 except Exception as e:
                     console.print(f"[bold red]Terjadi kesalahan: {str(e)}[/bold red]")
         
@@ -511,15 +4014,15 @@ def main():
             with console.status("[bold green]Mengambil data dan membuat visualisasi...[/bold green]") as status:
                 try:
                     konten_html, waktu_muat, ukuran_konten, sumber_eksternal = ambil_kode_sumber(url)
-                    soup = parse_html(konten_html)
+                    dokumen = dapatkan_dokumen(konten_html)
                     
                     data = {
                         'Waktu Muat (s)': waktu_muat,
                         'Ukuran Konten (KB)': ukuran_konten / 1024,
                         'Sumber Eksternal': sumber_eksternal,
-                        'Jumlah Tag': len(soup.find_all()),
-                        'Jumlah Tautan': len(soup.find_all('a')),
-                        'Jumlah Gambar': len(soup.find_all('img'))
+                        'Jumlah Tag': dokumen.jumlah_tag,
+                        'Jumlah Tautan': dokumen.jumlah_tautan,
+                        'Jumlah Gambar': dokumen.jumlah_gambar
                     }
                     
                     buat_visualisasi(data)
@@ -530,6 +4033,14 @@ def main():
             periksa_pembaruan()
         
         elif pilihan == "8":
+            nama_crawl = console.input("[bold green]Masuk in nama crawl yang mau dilanjutkan: [/bold green]").strip()
+            try:
+                _jalankan_crawl_interaktif(
+                    lambda sink, hemat: lanjutkan_jelajah(nama_crawl, sink=sink, hemat_memori=hemat))
+            except Exception as e:
+                console.print(f"[bold red]Terjadi kesalahan: {str(e)}[/bold red]")
+        
+        elif pilihan == "9":
             console.print("[bold green]Terima kasih telah menggunakan Phantom Web. Sampai jumpa![/bold green]")
             break
         
@@ -537,5 +4048,8 @@ def main():
             console.print("[bold red]Pilihan gak valid njirr Silakan coba lagi.[/bold red]")
 
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) > 1:
+        jalankan_cli(sys.argv[1:])
+    else:
+        main()
 
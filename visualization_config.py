@@ -6,6 +6,12 @@ VISUALISASI_KONFIGURASI = {
     'DPI_GRAFIK': 300,
     'WARNA_TEMA': 'default',  # atau 'dark', 'light', 'colorblind'
     'TAMPILKAN_LEGENDA': True,
-    'UKURAN_FONT': 12
+    'UKURAN_FONT': 12,
+    'TAMPILKAN_GRAFIK': True,  # buka jendela grafik di menu interaktif; dashboard crawl selalu dirender tanpa jendela
+    'DIREKTORI_GRAFIK': 'grafik',  # tiap grafik dapat nama unik di sini, jadi run yang berbeda gak saling timpa
+    'JUMLAH_BIN_HISTOGRAM': 50,
+    'PERSENTIL_DASHBOARD': (50, 90, 99),
+    'MAKS_TITIK_SEBAR': 20_000,  # titik scatter di atas ini diambil sampel acak
+    'PROSES_RENDER': 0  # isi > 1 untuk merender grafik dashboard paralel di proses terpisah
 }
 